@@ -1,67 +1,103 @@
+import os
+import sys
 import requests
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def get_random_cat():
+import http_client
+from image_downloader import download_images
+from prefetch import Prefetcher
+
+# The Cat API returns at most this many random images per call
+CAT_BATCH_SIZE = 10
+
+# Where 'python Cat_pics.py download N' saves images by default
+DEFAULT_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cat_images')
+
+def get_random_cat(log=print):
     """
     Gets a random cat image from The Cat API
     Returns the image URL or None if request fails
+    Errors go to log (print by default)
     """
-    print("🐱 Fetching a random cat picture...")
-    
     try:
         # The Cat API - completely free, no key needed!
-        response = requests.get('https://api.thecatapi.com/v1/images/search')
+        response = http_client.get('https://api.thecatapi.com/v1/images/search', cache=False)
         
         # Check if request was successful
         if response.status_code == 200:
             data = response.json()
             return data[0]['url']  # The image URL is in the first result
         else:
-            print(f"Error: Received status code {response.status_code}")
+            log(f"Error: Received status code {response.status_code}")
             return None
             
     except requests.exceptions.RequestException as e:
-        print(f"Error connecting to Cat API: {e}")
+        log(f"Error connecting to Cat API: {e}")
         return None
 
-def get_cat_fact():
+def get_cat_fact(log=print):
     """
     Gets a random cat fact from the Cat Facts API
     Returns the fact text or None if request fails
+    Errors go to log (print by default)
     """
-    print("📚 Fetching a cat fact...")
-    
     try:
         # Cat Facts API - also completely free!
-        response = requests.get('https://catfact.ninja/fact')
+        response = http_client.get('https://catfact.ninja/fact', cache=False)
         
         if response.status_code == 200:
             data = response.json()
             # The fact is directly in 'fact' field
             return data['fact']
         else:
-            print(f"Error: Received status code {response.status_code}")
+            log(f"Error: Received status code {response.status_code}")
             return None
             
     except requests.exceptions.RequestException as e:
-        print(f"Error connecting to Cat Facts API: {e}")
+        log(f"Error connecting to Cat Facts API: {e}")
         return None
 
-def main():
+def get_random_cat_urls(count):
     """
-    Main function that runs the cat picture & fact generator
+    Gets up to `count` random cat image URLs for bulk downloads
+    Asks the Cat API for several batches at the same time
     """
-    print("=" * 50)
-    print("😺 RANDOM CAT PICTURE & FACT GENERATOR 😺")
-    print("=" * 50)
-    print()
+    calls = -(-count // CAT_BATCH_SIZE)  # Round up
     
-    # Get a random cat picture
-    cat_image_url = get_random_cat()
+    def fetch_batch(_):
+        # Random results must never come from the HTTP cache
+        response = http_client.get('https://api.thecatapi.com/v1/images/search?limit=10', cache=False)
+        response.raise_for_status()
+        return [image['url'] for image in response.json()]
     
-    # Get a random cat fact
-    cat_fact = get_cat_fact()
+    urls = []
+    with ThreadPoolExecutor(max_workers=min(calls, 8)) as pool:
+        for batch in pool.map(fetch_batch, range(calls)):
+            urls.extend(batch)
+    return urls
+
+def get_cat_and_fact():
+    """
+    Gets one (cat picture URL, cat fact, error messages) triple
+    Both requests run at the same time; either part may be None
+    Errors are collected instead of printed, since this runs in the
+    background while the user may be typing
+    """
+    messages = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        image = pool.submit(get_random_cat, messages.append)
+        fact = pool.submit(get_cat_fact, messages.append)
+        return image.result(), fact.result(), messages
+
+def show_cat(cat_image_url, cat_fact, messages=()):
+    """
+    Prints one cat picture & fact and offers to open the picture
+    """
+    # Errors from fetching this cat in the background
+    for message in messages:
+        print(message)
     
     print()
     print("-" * 50)
@@ -93,17 +129,48 @@ def main():
             webbrowser.open(cat_image_url)
         else:
             print("👋 Thanks for using the Cat Generator!")
-    
-    # Ask if user wants to see another cat
+
+def main():
+    """
+    Main function that runs the cat picture & fact generator
+    The next cats are fetched in the background while you look
+    """
+    print("=" * 50)
+    print("😺 RANDOM CAT PICTURE & FACT GENERATOR 😺")
+    print("=" * 50)
     print()
-    again = input("\nWant to see another cat? (yes/no): ").lower()
     
-    if again in ['yes', 'y']:
-        print("\n" * 2)
-        main()  # Run the program again!
-    else:
-        print("\n🐾 Thanks for playing! See you next time! 🐾")
+    # Keep the next cats ready in the background
+    prefetcher = Prefetcher(get_cat_and_fact)
+    
+    try:
+        while True:
+            if not prefetcher.ready():
+                print("🐱 Fetching a random cat picture and fact...")
+            try:
+                cat = prefetcher.get()
+            except Exception as e:
+                print(f"❌ Could not fetch a cat: {e!r}")
+            else:
+                show_cat(*cat)
+            
+            # Ask if user wants to see another cat
+            print()
+            again = input("\nWant to see another cat? (yes/no): ").lower()
+            
+            if again not in ['yes', 'y']:
+                break
+            print("\n" * 2)
+    finally:
+        prefetcher.close()
+    
+    print("\n🐾 Thanks for playing! See you next time! 🐾")
 
 # Run the program
+# python Cat_pics.py download N [folder] saves N cat pictures instead
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 2 and sys.argv[1] == 'download':
+        download_images(get_random_cat_urls, int(sys.argv[2]),
+                        sys.argv[3] if len(sys.argv) > 3 else DEFAULT_FOLDER)
+    else:
+        main()
\ No newline at end of file
@@ -1,67 +1,103 @@
+import os
+import sys
 import requests
 import webbrowser
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-def get_random_dog():
+import http_client
+from image_downloader import download_images
+from prefetch import Prefetcher
+
+# The Dog API returns at most this many random images per call
+DOG_BATCH_SIZE = 50
+
+# Where 'python Dog_Pics.py download N' saves images by default
+DEFAULT_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dog_images')
+
+def get_random_dog(log=print):
     """
     Gets a random dog image from the Dog API
     Returns the image URL or None if request fails
+    Errors go to log (print by default)
     """
-    print("🐕 Fetching a random dog picture...")
-    
     try:
         # Dog API - completely free, no key needed!
-        response = requests.get('https://dog.ceo/api/breeds/image/random')
+        response = http_client.get('https://dog.ceo/api/breeds/image/random', cache=False)
         
         # Check if request was successful
         if response.status_code == 200:
             data = response.json()
             return data['message']  # The image URL is in 'message'
         else:
-            print(f"Error: Received status code {response.status_code}")
+            log(f"Error: Received status code {response.status_code}")
             return None
             
     except requests.exceptions.RequestException as e:
-        print(f"Error connecting to Dog API: {e}")
+        log(f"Error connecting to Dog API: {e}")
         return None
 
-def get_dog_fact():
+def get_dog_fact(log=print):
     """
     Gets a random dog fact from the Dog Facts API
     Returns the fact text or None if request fails
+    Errors go to log (print by default)
     """
-    print("📚 Fetching a dog fact...")
-    
     try:
         # Dog Facts API - also completely free!
-        response = requests.get('https://dogapi.dog/api/v2/facts')
+        response = http_client.get('https://dogapi.dog/api/v2/facts', cache=False)
         
         if response.status_code == 200:
             data = response.json()
             # The fact is nested in the response
             return data['data'][0]['attributes']['body']
         else:
-            print(f"Error: Received status code {response.status_code}")
+            log(f"Error: Received status code {response.status_code}")
             return None
             
     except requests.exceptions.RequestException as e:
-        print(f"Error connecting to Dog Facts API: {e}")
+        log(f"Error connecting to Dog Facts API: {e}")
         return None
 
-def main():
+def get_random_dog_urls(count):
     """
-    Main function that runs the dog picture & fact generator
+    Gets up to `count` random dog image URLs for bulk downloads
+    Asks the Dog API for several batches at the same time
     """
-    print("=" * 50)
-    print("🐶 RANDOM DOG PICTURE & FACT GENERATOR 🐶")
-    print("=" * 50)
-    print()
+    calls = -(-count // DOG_BATCH_SIZE)  # Round up
     
-    # Get a random dog picture
-    dog_image_url = get_random_dog()
+    def fetch_batch(_):
+        # Random results must never come from the HTTP cache
+        response = http_client.get('https://dog.ceo/api/breeds/image/random/50', cache=False)
+        response.raise_for_status()
+        return response.json()['message']
     
-    # Get a random dog fact
-    dog_fact = get_dog_fact()
+    urls = []
+    with ThreadPoolExecutor(max_workers=min(calls, 8)) as pool:
+        for batch in pool.map(fetch_batch, range(calls)):
+            urls.extend(batch)
+    return urls
+
+def get_dog_and_fact():
+    """
+    Gets one (dog picture URL, dog fact, error messages) triple
+    Both requests run at the same time; either part may be None
+    Errors are collected instead of printed, since this runs in the
+    background while the user may be typing
+    """
+    messages = []
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        image = pool.submit(get_random_dog, messages.append)
+        fact = pool.submit(get_dog_fact, messages.append)
+        return image.result(), fact.result(), messages
+
+def show_dog(dog_image_url, dog_fact, messages=()):
+    """
+    Prints one dog picture & fact and offers to open the picture
+    """
+    # Errors from fetching this dog in the background
+    for message in messages:
+        print(message)
     
     print()
     print("-" * 50)
@@ -101,17 +137,48 @@ def main():
             webbrowser.open(dog_image_url)
         else:
             print("👋 Thanks for using the Dog Generator!")
-    
-    # Ask if user wants to see another dog
+
+def main():
+    """
+    Main function that runs the dog picture & fact generator
+    The next dogs are fetched in the background while you look
+    """
+    print("=" * 50)
+    print("🐶 RANDOM DOG PICTURE & FACT GENERATOR 🐶")
+    print("=" * 50)
     print()
-    again = input("\nWant to see another dog? (yes/no): ").lower()
     
-    if again in ['yes', 'y']:
-        print("\n" * 2)
-        main()  # Run the program again!
-    else:
-        print("\n🐾 Thanks for playing! See you next time! 🐾")
+    # Keep the next dogs ready in the background
+    prefetcher = Prefetcher(get_dog_and_fact)
+    
+    try:
+        while True:
+            if not prefetcher.ready():
+                print("🐕 Fetching a random dog picture and fact...")
+            try:
+                dog = prefetcher.get()
+            except Exception as e:
+                print(f"❌ Could not fetch a dog: {e!r}")
+            else:
+                show_dog(*dog)
+            
+            # Ask if user wants to see another dog
+            print()
+            again = input("\nWant to see another dog? (yes/no): ").lower()
+            
+            if again not in ['yes', 'y']:
+                break
+            print("\n" * 2)
+    finally:
+        prefetcher.close()
+    
+    print("\n🐾 Thanks for playing! See you next time! 🐾")
 
 # Run the program
+# python Dog_Pics.py download N [folder] saves N dog pictures instead
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 2 and sys.argv[1] == 'download':
+        download_images(get_random_dog_urls, int(sys.argv[2]),
+                        sys.argv[3] if len(sys.argv) > 3 else DEFAULT_FOLDER)
+    else:
+        main()
\ No newline at end of file
@@ -1,52 +1,174 @@
 import requests
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+
+import http_client
+from city_index import CityIndex
+from forecast_cache import ForecastCache
+from geo_cache import GeoCache
+
+# Hourly "feels like" alerts need NumPy; the script works without it
+try:
+    from weather_series import HourlySeries, feels_like_alerts
+except ImportError:
+    HourlySeries = None
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+FORECAST_URL = "https://api.open-meteo.com/v1/forecast"
+
+# Everything but the coordinates; also versions the forecast cache, so
+# changing it never serves payloads fetched with the old parameters
+FORECAST_QUERY = (
+    "&current_weather=true&temperature_unit=celsius"
+    "&hourly=temperature_2m,relativehumidity_2m,weathercode,windspeed_10m"
+    "&timeformat=unixtime"
+)
+
+# Open-Meteo accepts many comma-separated coordinates per request;
+# this keeps each URL comfortably short
+MAX_LOCATIONS_PER_REQUEST = 100
+
+# Parallel geocoding calls for cities missing from the cache
+GEOCODE_WORKERS = 8
+
+# Alert thresholds (shared with the nationwide sweep)
+HOT_TEMP_C = 35
+COLD_TEMP_C = 15
+RAIN_CODES = [51, 61, 63, 80, 81]
+
+
+# -----------------------------
+# GEOCODING CACHE
+# -----------------------------
+# Persistent city -> coordinates cache (opened on first use)
+_geo_cache = None
+
+
+def get_geo_cache():
+    """Returns the shared geocoding cache, opening it on first use."""
+    global _geo_cache
+    if _geo_cache is None:
+        _geo_cache = GeoCache()
+    return _geo_cache
+
+
+# Spatial index over the bundled city list (built on first use)
+_city_index = None
+
+
+def get_city_index():
+    """Returns the shared city KD-tree, building it on first use."""
+    global _city_index
+    if _city_index is None:
+        _city_index = CityIndex.from_gazetteer()
+    return _city_index
+
+
+# Grid-tile forecast cache (opened on first use)
+_forecast_cache = None
+
+
+def get_forecast_cache():
+    """Returns the shared forecast cache, opening it on first use."""
+    global _forecast_cache
+    if _forecast_cache is None:
+        _forecast_cache = ForecastCache(version=FORECAST_QUERY)
+    return _forecast_cache
+
+
+def parse_lat_lon(text: str):
+    """'28.61, 77.21' -> (28.61, 77.21); anything else -> None."""
+    parts = text.replace(",", " ").split()
+    if len(parts) != 2:
+        return None
+    try:
+        lat, lon = float(parts[0]), float(parts[1])
+    except ValueError:
+        return None
+    if -90 <= lat <= 90 and -180 <= lon <= 180:
+        return lat, lon
+    return None
+
+
+def label_coordinates(lat: float, lon: float):
+    """Coordinates dict for a raw point, named after the nearest known city."""
+    name = get_city_index().label(lat, lon) or f"{lat:.3f}, {lon:.3f}"
+    return {"name": name, "lat": lat, "lon": lon, "country": ""}
 
 
 # -----------------------------
 # UTILITY: API REQUEST WRAPPER
 # -----------------------------
-def fetch_json(url: str, timeout: int = 20):
-    """Safe GET request wrapper."""
+def fetch_json(url: str, timeout: int = 20, log=print):
+    """Safe GET request wrapper. Errors go to log (print by default)."""
     try:
-        response = requests.get(url, timeout=timeout)
+        response = http_client.get(url, timeout=timeout)
         response.raise_for_status()
         return response.json()
     except requests.RequestException as e:
-        print(f"❌ Network/API error: {e}")
+        log(f"❌ Network/API error: {e}")
         return None
 
 
+def get_json(url: str, timeout: int = 20):
+    """GET request that raises on failure (for callers that retry)."""
+    response = http_client.get(url, timeout=timeout, stale_if_error=False)
+    response.raise_for_status()
+    return response.json()
+
+
 # -----------------------------
 # GET COORDINATES FOR ANY CITY
 # -----------------------------
-def get_coordinates(city: str):
+def get_coordinates(city: str, log=print):
     """
     Fetch latitude & longitude for any city in India (or world)
     using Open-Meteo Geocoding API.
+
+    Results are cached on disk (pre-seeded with Indian cities),
+    so repeat lookups never hit the network. Raw coordinates
+    ("28.61, 77.21") are labelled with the nearest known city.
+    Errors go to log (print by default).
     """
     city = city.strip()
 
     if not city:
-        print("❌ City name cannot be empty!")
+        log("❌ City name cannot be empty!")
         return None
 
+    point = parse_lat_lon(city)
+    if point:
+        return label_coordinates(*point)
+
+    cache = get_geo_cache()
+    cached = cache.get(city)
+    if cached:
+        return cached
+
     url = (
         "https://geocoding-api.open-meteo.com/v1/search"
         f"?name={city}&count=1&language=en&format=json"
     )
 
-    data = fetch_json(url)
+    data = fetch_json(url, log=log)
     if not data or "results" not in data or len(data["results"]) == 0:
-        print(f"❌ Could not find city: {city}")
+        log(f"❌ Could not find city: {city}")
         return None
 
     result = data["results"][0]
-    return {
+    coords = {
         "name": result.get("name", city),
         "lat": result["latitude"],
         "lon": result["longitude"],
         "country": result.get("country", ""),
     }
+    cache.put(city, coords)
+    return coords
 
 
 # -----------------------------
@@ -67,14 +189,7 @@ def get_weather(city: str):
 
     print(f"\n🌤️ Fetching weather for {city_name} ({lat}, {lon})...")
 
-    url = (
-        "https://api.open-meteo.com/v1/forecast"
-        f"?latitude={lat}&longitude={lon}"
-        "&current_weather=true&temperature_unit=celsius"
-        "&hourly=relativehumidity_2m"
-    )
-
-    data = fetch_json(url)
+    data = get_forecasts([(lat, lon)])[0]
     if not data or "current_weather" not in data:
         print("❌ Weather data unavailable!")
         return None
@@ -102,17 +217,164 @@ def get_weather(city: str):
     )
 
     # Alerts
-    if temp > 35:
+    if temp > HOT_TEMP_C:
         print("🔥 ALERT: Very hot! Stay hydrated.")
-    elif temp < 15:
+    elif temp < COLD_TEMP_C:
         print("🧥 ALERT: Cold temperature! Wear warm clothes.")
 
-    if code in [51, 61, 63, 80, 81]:
+    if code in RAIN_CODES:
         print("🌧️ ALERT: Chance of rain. Carry an umbrella!")
 
+    # Heat index / humidity over the next 48 hours
+    if HourlySeries is not None:
+        series = HourlySeries.from_payload(data)
+        if series is not None:
+            for alert in feels_like_alerts(series):
+                print(alert)
+
     return data
 
 
+# -----------------------------
+# FORECAST URL FOR ONE OR MANY POINTS
+# -----------------------------
+def forecast_url(lats, lons) -> str:
+    """Forecast URL for one or more coordinates (comma-separated)."""
+    latitudes = ",".join(str(lat) for lat in lats)
+    longitudes = ",".join(str(lon) for lon in lons)
+    return (
+        FORECAST_URL
+        + f"?latitude={latitudes}&longitude={longitudes}"
+        + FORECAST_QUERY
+    )
+
+
+# -----------------------------
+# CACHED FORECASTS BY GRID TILE
+# -----------------------------
+def get_forecasts(points, strict: bool = False):
+    """
+    Forecast payloads for many (lat, lon) points, in input order
+    (None where the fetch failed).
+
+    Points are snapped to forecast grid tiles: every point in a
+    tile shares one payload, which is reused until the next model
+    run is published. Missing tiles are fetched in packed requests.
+
+    With strict=True network errors are raised instead of printed,
+    so a scheduler can back off.
+    """
+    fetch = get_json if strict else fetch_json
+    cache = get_forecast_cache()
+    tiles = [cache.tile(lat, lon) for lat, lon in points]
+
+    payloads = {}
+    missing = {}
+    for key, lat, lon in tiles:
+        if key in payloads or key in missing:
+            continue
+        payload = cache.get(key)
+        if payload is None:
+            missing[key] = (lat, lon)
+        else:
+            payloads[key] = payload
+
+    keys = list(missing)
+    for i in range(0, len(keys), MAX_LOCATIONS_PER_REQUEST):
+        batch = keys[i:i + MAX_LOCATIONS_PER_REQUEST]
+        data = fetch(forecast_url(
+            [missing[key][0] for key in batch], [missing[key][1] for key in batch]
+        ))
+        if data is None:
+            continue
+        # One location -> one object; several -> a list in request order
+        if isinstance(data, dict):
+            data = [data]
+        fetched = dict(zip(batch, data))
+        cache.put_many(fetched)
+        payloads.update(fetched)
+
+    return [_with_current_hour(payloads.get(key)) for key, _, _ in tiles]
+
+
+def _with_current_hour(data):
+    """
+    A cached payload may be hours old: take "current" conditions
+    from the hourly forecast slot for this hour instead.
+    """
+    if not data or "hourly" not in data or "current_weather" not in data:
+        return data
+
+    hourly = data["hourly"]
+    hour = int(time.time()) // 3600 * 3600
+    try:
+        i = hourly["time"].index(hour)
+    except (KeyError, ValueError):
+        return data
+
+    current = dict(data["current_weather"])
+    for field, column in (
+        ("temperature", "temperature_2m"),
+        ("windspeed", "windspeed_10m"),
+        ("weathercode", "weathercode"),
+    ):
+        values = hourly.get(column)
+        if values and values[i] is not None:
+            current[field] = values[i]
+    current["time"] = hour
+    return {**data, "current_weather": current}
+
+
+# -----------------------------
+# BULK WEATHER FOR MANY CITIES
+# -----------------------------
+def get_coordinates_many(cities, log=print):
+    """
+    Resolve many cities at once: cache hits are instant,
+    misses are geocoded in parallel. Returns coords (or None)
+    per city, in input order. Errors from the worker threads
+    go to log (print by default).
+    """
+    cache = get_geo_cache()
+    results = [cache.get(city) if city.strip() else None for city in cities]
+
+    # Geocode each distinct missing name once
+    missing = list(dict.fromkeys(
+        city for city, coords in zip(cities, results) if coords is None and city.strip()
+    ))
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(GEOCODE_WORKERS, len(missing))) as pool:
+            found = dict(zip(missing, pool.map(partial(get_coordinates, log=log), missing)))
+        results = [coords if coords else found.get(city) for city, coords in zip(cities, results)]
+
+    return results
+
+
+def get_weather_many(cities):
+    """
+    Fetch current weather for many cities with as few requests
+    as possible: cities sharing a grid tile share one forecast,
+    and up to MAX_LOCATIONS_PER_REQUEST tiles are packed into each
+    forecast call.
+
+    Returns one forecast dict (same shape as get_weather) or None
+    per city, in input order. Nothing is printed per city:
+    cities that could not be located are listed in one line.
+    """
+    cities = list(cities)
+    coords = get_coordinates_many(cities, log=lambda message: None)
+    unresolved = [city for city, c in zip(cities, coords) if not c]
+    if unresolved:
+        print(f"⚠️ Could not locate {len(unresolved)} cities: {', '.join(unresolved[:5])}"
+              + (" ..." if len(unresolved) > 5 else ""))
+
+    points = [(c["lat"], c["lon"]) for c in coords if c]
+    print(f"\n🌤️ Fetching weather for {len(cities)} cities...")
+    forecasts = iter(get_forecasts(points))
+
+    return [next(forecasts) if c else None for c in coords]
+
+
 # WEATHER CODE MEANINGS (Optional)
 WEATHER_CODES = {
     0: "Clear",
@@ -156,8 +418,8 @@ if __name__ == "__main__":
     print("     SIMPLE PYTHON AUTOMATION - WEATHER CHECKER")
     print("=" * 55)
 
-    # Ask user for any Indian city
-    user_city = input("\nEnter any city of India: ").strip()
+    # Ask user for any Indian city (or "lat, lon")
+    user_city = input("\nEnter any city of India (or lat, lon): ").strip()
 
     weather_data = get_weather(user_city)
 
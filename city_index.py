@@ -0,0 +1,156 @@
+import heapq
+import math
+
+from geo_cache import load_gazetteer
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+# Mean Earth radius used for all distances
+EARTH_RADIUS_KM = 6371.0088
+
+# Points beyond this distance are not labelled as "near" a city
+MAX_LABEL_DISTANCE_KM = 75
+
+
+# -----------------------------
+# DISTANCE HELPERS
+# -----------------------------
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in km."""
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _unit_vector(lat: float, lon: float):
+    """Point on the unit sphere: straight-line distance grows with km."""
+    p, l = math.radians(lat), math.radians(lon)
+    return (math.cos(p) * math.cos(l), math.cos(p) * math.sin(l), math.sin(p))
+
+
+def _chord_to_km(chord: float) -> float:
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, chord / 2))
+
+
+def _km_to_chord(km: float) -> float:
+    return 2 * math.sin(min(math.pi, km / EARTH_RADIUS_KM) / 2)
+
+
+# -----------------------------
+# KD-TREE OVER CITIES
+# -----------------------------
+class CityIndex:
+    """
+    Spatial index over the bundled city list.
+
+    Cities are stored as 3D unit vectors in a KD-tree: on a sphere
+    the straight-line (chord) distance orders points exactly like the
+    haversine distance, so ordinary KD-tree pruning gives correct
+    great-circle answers with no special cases at the poles or the
+    antimeridian. Queries touch a handful of nodes (microseconds).
+    """
+
+    def __init__(self, places):
+        self.places = list(places)
+        self._points = [_unit_vector(p["lat"], p["lon"]) for p in self.places]
+        self._root = self._build(list(range(len(self.places))), 0)
+
+    @classmethod
+    def from_gazetteer(cls, path: str = None):
+        """Index over the bundled Indian city list."""
+        return cls(load_gazetteer(path) if path else load_gazetteer())
+
+    def __len__(self):
+        return len(self.places)
+
+    def _build(self, indices, depth):
+        """Node = (city index, split axis, left subtree, right subtree)."""
+        if not indices:
+            return None
+        axis = depth % 3
+        indices.sort(key=lambda i: self._points[i][axis])
+        mid = len(indices) // 2
+        return (
+            indices[mid],
+            axis,
+            self._build(indices[:mid], depth + 1),
+            self._build(indices[mid + 1:], depth + 1),
+        )
+
+    def _result(self, i, lat, lon):
+        place = self.places[i]
+        return place, haversine_km(lat, lon, place["lat"], place["lon"])
+
+    def nearest(self, lat: float, lon: float, k: int = 1):
+        """
+        The k closest cities to a point, closest first,
+        as (place, distance_km) pairs.
+        """
+        target = _unit_vector(lat, lon)
+        best = []  # Max-heap of (-squared chord, index), size <= k
+
+        def visit(node):
+            if node is None:
+                return
+            i, axis, left, right = node
+            d2 = sum((a - b) ** 2 for a, b in zip(self._points[i], target))
+            if len(best) < k:
+                heapq.heappush(best, (-d2, i))
+            elif d2 < -best[0][0]:
+                heapq.heapreplace(best, (-d2, i))
+
+            diff = target[axis] - self._points[i][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            # The other side can only help if the splitting plane is closer than our worst match
+            if len(best) < k or diff * diff < -best[0][0]:
+                visit(far)
+
+        if k > 0:
+            visit(self._root)
+        return [self._result(i, lat, lon) for _, i in sorted(best, reverse=True)]
+
+    def within(self, lat: float, lon: float, radius_km: float):
+        """All cities within radius_km of a point, closest first."""
+        target = _unit_vector(lat, lon)
+        limit = _km_to_chord(radius_km)
+        limit2 = limit * limit
+        found = []
+
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            i, axis, left, right = node
+            d2 = sum((a - b) ** 2 for a, b in zip(self._points[i], target))
+            if d2 <= limit2:
+                found.append((d2, i))
+
+            diff = target[axis] - self._points[i][axis]
+            if diff - limit <= 0:
+                stack.append(left)
+            if diff + limit >= 0:
+                stack.append(right)
+
+        found.sort()
+        return [self._result(i, lat, lon) for _, i in found]
+
+    def label(self, lat: float, lon: float, max_km: float = MAX_LABEL_DISTANCE_KM):
+        """
+        Human-readable name for any coordinates:
+        'Noida', 'near Delhi (12 km)', or None if nothing is close.
+        """
+        match = self.nearest(lat, lon)
+        if not match:
+            return None
+        place, km = match[0]
+        if km > max_km:
+            return None
+        if km < 2:
+            return place["name"]
+        return f"near {place['name']} ({km:.0f} km)"
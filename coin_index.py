@@ -0,0 +1,174 @@
+# ============================================================================
+# COIN SYMBOL / NAME -> ID INDEX
+# Resolves 'btc', 'Bitcoin' or 'shiba inu' to CoinGecko ids without guessing
+# Built from /coins/list | Saved on disk | Constant-time lookups
+# ============================================================================
+
+import json      # For saving the coin list on disk
+import os        # For building file paths and creating folders
+import time      # For checking how old the saved list is
+
+import requests  # For recognising download errors
+
+import http_client  # Shared pooled HTTP session
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+COINS_LIST_URL = "https://api.coingecko.com/api/v3/coins/list"
+
+# Where the downloaded coin list is kept between runs
+INDEX_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "coins_list.json")
+
+# Re-download the list once it is older than this (seconds) - new coins
+# are listed every day, but a week-old list is fine for lookups
+MAX_AGE = 7 * 24 * 3600
+
+# Many symbols are shared by dozens of tokens ('eth' alone matches bridged
+# and wrapped copies). These win whenever they match.
+PREFERRED = {
+    'bitcoin': 'bitcoin', 'btc': 'bitcoin',
+    'ethereum': 'ethereum', 'eth': 'ethereum',
+    'dogecoin': 'dogecoin', 'doge': 'dogecoin',
+    'shiba': 'shiba-inu', 'shib': 'shiba-inu',
+    'cardano': 'cardano', 'ada': 'cardano',
+    'solana': 'solana', 'sol': 'solana',
+    'xrp': 'ripple', 'ltc': 'litecoin', 'dot': 'polkadot',
+    'link': 'chainlink', 'xlm': 'stellar', 'trx': 'tron',
+    'avax': 'avalanche-2', 'uni': 'uniswap', 'usdt': 'tether',
+    'bnb': 'binancecoin', 'usdc': 'usd-coin',
+}
+
+
+def _normalize(text):
+    """Lowercases and collapses whitespace: '  Shiba  Inu ' -> 'shiba inu'."""
+    return ' '.join(text.lower().split())
+
+
+# ============================================================================
+# COIN INDEX
+# ============================================================================
+class CoinIndex:
+    """
+    In-memory hash index over CoinGecko's full coin list.
+
+    Lookup order for a query:
+        1. PREFERRED overrides (e.g. 'eth' -> 'ethereum')
+        2. Exact CoinGecko id ('shiba-inu', also 'shiba inu')
+        3. Exact coin name ('Shiba Inu')
+        4. Exact symbol ('shib')
+
+    Names and symbols that match more than one coin are reported as
+    ambiguous together with all candidates, instead of silently guessing.
+
+    Example:
+        index = CoinIndex.load()
+        coin_id, candidates = index.resolve('btc')
+    """
+
+    def __init__(self, coins, fetched_at=0.0):
+        """
+        Args:
+            coins (list): [{'id': ..., 'symbol': ..., 'name': ...}, ...]
+            fetched_at (float): Unix time the list was downloaded
+        """
+        self.fetched_at = fetched_at
+        self.ids = set()
+        self.by_name = {}
+        self.by_symbol = {}
+
+        for coin in coins:
+            coin_id = coin['id']
+            self.ids.add(coin_id)
+            self.by_name.setdefault(_normalize(coin.get('name', '')), []).append(coin_id)
+            self.by_symbol.setdefault(_normalize(coin.get('symbol', '')), []).append(coin_id)
+
+    def __len__(self):
+        return len(self.ids)
+
+    # ----------------------------------------------------------------
+    # LOADING & SAVING
+    # ----------------------------------------------------------------
+    @classmethod
+    def load(cls, path=INDEX_PATH, max_age=MAX_AGE):
+        """
+        Loads the index from disk, downloading a fresh list when the saved
+        one is missing or older than max_age.
+
+        If the download fails, a stale list is used; with no list at all
+        the index is empty and only PREFERRED / exact ids resolve.
+        """
+        coins, fetched_at = [], 0.0
+        if os.path.exists(path):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    saved = json.load(f)
+                coins, fetched_at = saved['coins'], saved['fetched_at']
+            except (OSError, ValueError, KeyError):
+                coins, fetched_at = [], 0.0
+
+        if time.time() - fetched_at > max_age:
+            fresh = cls.download()
+            if fresh is not None:
+                coins, fetched_at = fresh, time.time()
+                cls._save(path, coins, fetched_at)
+
+        return cls(coins, fetched_at)
+
+    @staticmethod
+    def download():
+        """Fetches the full coin list. Returns None if the request fails."""
+        try:
+            response = http_client.get(COINS_LIST_URL, timeout=30)
+            response.raise_for_status()
+            # Keep only the fields we index - the file stays small
+            return [{'id': c['id'], 'symbol': c.get('symbol', ''), 'name': c.get('name', '')}
+                    for c in response.json()]
+        except (requests.exceptions.RequestException, ValueError, KeyError, TypeError):
+            return None
+
+    @staticmethod
+    def _save(path, coins, fetched_at):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({'fetched_at': fetched_at, 'coins': coins}, f, separators=(',', ':'))
+        os.replace(tmp_path, path)  # Atomic - never leaves a half-written file
+
+    # ----------------------------------------------------------------
+    # LOOKUPS
+    # ----------------------------------------------------------------
+    def resolve(self, query):
+        """
+        Resolves a name, symbol or id to a CoinGecko id.
+
+        Args:
+            query (str): e.g. 'btc', 'Bitcoin', 'shiba inu', 'avalanche-2'
+
+        Returns:
+            tuple: (coin_id, candidates)
+                   coin_id is None when nothing or more than one coin matched;
+                   candidates lists every matching id
+        """
+        key = _normalize(query)
+        if not key:
+            return None, []
+
+        if key in PREFERRED:
+            return PREFERRED[key], [PREFERRED[key]]
+
+        slug = key.replace(' ', '-')
+        if slug in self.ids:
+            return slug, [slug]
+
+        for table in (self.by_name, self.by_symbol):
+            matches = table.get(key)
+            if matches:
+                if len(matches) == 1:
+                    return matches[0], matches
+                return None, list(matches)
+
+        # Empty / stale index: fall back to treating the input as an id
+        if not self.ids:
+            return slug, [slug]
+        return None, []
@@ -0,0 +1,380 @@
+# ============================================================================
+# CRYPTO ALERT RULES ENGINE
+# Thousands of price alerts, checked in O(log n) per coin per tick
+# Sorted threshold index | Edge-triggered | Deduplicated with cooldowns
+# ============================================================================
+
+import bisect    # For searching the sorted threshold lists
+import itertools # For handing out rule ids
+import time      # For timestamps and cooldowns
+from collections import deque  # For the sliding-window min/max trackers
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Rule that matches every coin in the snapshot
+ANY_COIN = '*'
+
+# Default cooldown for the built-in 24h movers rules (seconds)
+DEFAULT_COOLDOWN = 3600
+
+_rule_ids = itertools.count(1)
+
+
+def _pretty_name(coin_id):
+    """Converts ID format: 'shiba-inu' becomes 'Shiba Inu'."""
+    return coin_id.replace('-', ' ').title()
+
+
+# ============================================================================
+# RULES & ALERTS
+# ============================================================================
+class ThresholdRule:
+    """
+    Fires when a field crosses a fixed threshold, e.g. "BTC usd crosses 70k".
+
+    op='above' fires when the value moves from below the threshold to at or
+    above it; op='below' is the mirror image. On the very first snapshot a
+    rule whose condition already holds fires once.
+    """
+
+    __slots__ = ('rule_id', 'coin', 'field', 'op', 'threshold', 'cooldown', 'message')
+
+    def __init__(self, coin, field, op, threshold, cooldown=0, message=None):
+        if op not in ('above', 'below'):
+            raise ValueError("op must be 'above' or 'below'")
+        self.rule_id = next(_rule_ids)
+        self.coin = coin
+        self.field = field
+        self.op = op
+        self.threshold = float(threshold)
+        self.cooldown = cooldown
+        self.message = message or (
+            "{arrow} {name} {field} crossed {op} {threshold:,.2f} (now {value:,.2f})"
+        )
+
+    def __repr__(self):
+        return f"ThresholdRule({self.coin!r}, {self.field!r}, {self.op!r}, {self.threshold})"
+
+
+class MoveRule:
+    """
+    Fires when a coin moves by pct percent within a time window, e.g.
+    "any coin moves 5% within 15 minutes".
+
+    direction='up' compares the price with the window's low, 'down' with
+    the window's high. The rule fires when the move first reaches pct and
+    re-arms once the move drops back under it.
+    """
+
+    __slots__ = ('rule_id', 'coin', 'field', 'pct', 'window', 'direction', 'cooldown', 'message')
+
+    def __init__(self, coin, pct, window, direction='up', field='usd', cooldown=0, message=None):
+        if direction not in ('up', 'down'):
+            raise ValueError("direction must be 'up' or 'down'")
+        self.rule_id = next(_rule_ids)
+        self.coin = coin
+        self.field = field
+        self.pct = abs(float(pct))
+        self.window = float(window)
+        self.direction = direction
+        self.cooldown = cooldown
+        self.message = message or (
+            "{arrow} {name} moved {direction} {value:.2f}% within {minutes:g} min"
+        )
+
+    def __repr__(self):
+        return f"MoveRule({self.coin!r}, {self.pct}%, {self.window}s, {self.direction!r})"
+
+
+class Alert:
+    """One fired rule for one coin."""
+
+    __slots__ = ('rule', 'coin_id', 'value', 'ts')
+
+    def __init__(self, rule, coin_id, value, ts):
+        self.rule = rule
+        self.coin_id = coin_id
+        self.value = value
+        self.ts = ts
+
+    @property
+    def message(self):
+        rule = self.rule
+        up = getattr(rule, 'op', None) == 'above' or getattr(rule, 'direction', None) == 'up'
+        return rule.message.format(
+            arrow="🚀" if up else "📉",
+            name=_pretty_name(self.coin_id),
+            coin=self.coin_id,
+            field=rule.field,
+            op=getattr(rule, 'op', ''),
+            direction=getattr(rule, 'direction', ''),
+            threshold=getattr(rule, 'threshold', getattr(rule, 'pct', 0.0)),
+            minutes=getattr(rule, 'window', 0.0) / 60,
+            value=self.value,
+        )
+
+    def __repr__(self):
+        return f"Alert({self.message!r})"
+
+
+# ============================================================================
+# SORTED INDEX
+# ============================================================================
+class _SortedRules:
+    """Rules kept sorted by their key so crossings are two bisects away."""
+
+    __slots__ = ('keys', 'rules')
+
+    def __init__(self):
+        self.keys = []
+        self.rules = []
+
+    def add(self, key, rule):
+        i = bisect.bisect_right(self.keys, key)
+        self.keys.insert(i, key)
+        self.rules.insert(i, rule)
+
+    def remove(self, key, rule):
+        i = bisect.bisect_left(self.keys, key)
+        while i < len(self.keys) and self.keys[i] == key:
+            if self.rules[i] is rule:
+                del self.keys[i]
+                del self.rules[i]
+                return True
+            i += 1
+        return False
+
+    def crossed_up(self, prev, cur):
+        """Rules with prev < key <= cur."""
+        lo = bisect.bisect_right(self.keys, prev)
+        hi = bisect.bisect_right(self.keys, cur)
+        return self.rules[lo:hi]
+
+    def crossed_down(self, prev, cur):
+        """Rules with cur <= key < prev."""
+        lo = bisect.bisect_left(self.keys, cur)
+        hi = bisect.bisect_left(self.keys, prev)
+        return self.rules[lo:hi]
+
+
+class _WindowRange:
+    """Sliding-window min and max over (ts, value) pairs, amortized O(1)."""
+
+    __slots__ = ('window', 'lows', 'highs')
+
+    def __init__(self, window):
+        self.window = window
+        self.lows = deque()   # Increasing values - front is the window min
+        self.highs = deque()  # Decreasing values - front is the window max
+
+    def push(self, ts, value):
+        while self.lows and self.lows[-1][1] >= value:
+            self.lows.pop()
+        self.lows.append((ts, value))
+        while self.highs and self.highs[-1][1] <= value:
+            self.highs.pop()
+        self.highs.append((ts, value))
+
+        cutoff = ts - self.window
+        while self.lows[0][0] < cutoff:
+            self.lows.popleft()
+        while self.highs[0][0] < cutoff:
+            self.highs.popleft()
+        return self.lows[0][1], self.highs[0][1]
+
+
+# ============================================================================
+# ALERT ENGINE
+# ============================================================================
+class AlertEngine:
+    """
+    Indexed, edge-triggered alert rules.
+
+    Threshold rules are indexed per (coin, field, op) in a sorted list. Each
+    tick remembers the previous value per coin and field, so only the rules
+    whose thresholds lie between the previous and the current value are
+    touched - thousands of rules cost two bisects per coin.
+
+    Move rules are grouped per (field, window, direction) and sorted by pct.
+    Each group tracks the window's low/high per coin and fires the rules
+    whose pct the current move has just reached.
+
+    A rule fires again only after its condition has gone false and true
+    again, and never more often than its cooldown allows.
+
+    Example:
+        engine = AlertEngine()
+        engine.add_threshold('bitcoin', 'usd', 'above', 70_000)
+        engine.add_move(ANY_COIN, pct=5, window=15 * 60)
+        for alert in engine.check(fetch_quotes()):
+            print(alert.message)
+    """
+
+    def __init__(self):
+        self._thresholds = {}    # (coin, field, op) -> _SortedRules
+        self._moves = {}         # (coin, field, window, direction) -> _SortedRules
+        self._prev_values = {}   # (coin_id, field) -> last value seen
+        self._ranges = {}        # (coin_id, field, window) -> _WindowRange
+        self._prev_moves = {}    # (coin_id, field, window, direction) -> last move %
+        self._last_fired = {}    # (rule_id, coin_id) -> ts
+
+    def __len__(self):
+        return (sum(len(index.rules) for index in self._thresholds.values())
+                + sum(len(index.rules) for index in self._moves.values()))
+
+    # ----------------------------------------------------------------
+    # MANAGING RULES
+    # ----------------------------------------------------------------
+    def add_threshold(self, coin, field, op, threshold, cooldown=0, message=None):
+        """
+        Adds a "crosses above/below" rule.
+
+        Args:
+            coin (str): CoinGecko id, or ANY_COIN for every coin
+            field (str): Snapshot key, e.g. 'usd', 'inr', 'usd_24h_change'
+            op (str): 'above' or 'below'
+            threshold (float): Level to watch
+            cooldown (float): Min seconds between two alerts per coin
+            message (str): Optional format string for Alert.message
+
+        Returns:
+            ThresholdRule: The new rule (pass it to remove() to delete it)
+        """
+        rule = ThresholdRule(coin, field, op, threshold, cooldown, message)
+        self._thresholds.setdefault((coin, field, op), _SortedRules()).add(rule.threshold, rule)
+        return rule
+
+    def add_move(self, coin, pct, window, direction='up', field='usd', cooldown=0, message=None):
+        """
+        Adds a "moves pct% within window seconds" rule.
+
+        Args:
+            coin (str): CoinGecko id, or ANY_COIN for every coin
+            pct (float): Size of the move in percent
+            window (float): Window length in seconds
+            direction (str): 'up' or 'down'
+            field (str): Snapshot key to watch (default: 'usd')
+            cooldown (float): Min seconds between two alerts per coin
+            message (str): Optional format string for Alert.message
+
+        Returns:
+            MoveRule: The new rule (pass it to remove() to delete it)
+        """
+        rule = MoveRule(coin, pct, window, direction, field, cooldown, message)
+        key = (coin, field, rule.window, direction)
+        self._moves.setdefault(key, _SortedRules()).add(rule.pct, rule)
+        return rule
+
+    def remove(self, rule):
+        """Deletes a rule. Returns True if it was found."""
+        if isinstance(rule, ThresholdRule):
+            index = self._thresholds.get((rule.coin, rule.field, rule.op))
+            found = index is not None and index.remove(rule.threshold, rule)
+        else:
+            index = self._moves.get((rule.coin, rule.field, rule.window, rule.direction))
+            found = index is not None and index.remove(rule.pct, rule)
+        if found:
+            self._last_fired = {k: v for k, v in self._last_fired.items() if k[0] != rule.rule_id}
+        return found
+
+    # ----------------------------------------------------------------
+    # CHECKING A SNAPSHOT
+    # ----------------------------------------------------------------
+    def check(self, data, ts=None):
+        """
+        Evaluates one snapshot against every rule.
+
+        Args:
+            data (QuoteTable): Snapshot from fetch_quotes() - anything with
+                               items() -> (coin_id, row with .get(field))
+                               works, including the raw API dict
+            ts (float): Unix timestamp of the snapshot (default: now)
+
+        Returns:
+            list: Alert objects for rules that fired on this tick
+        """
+        ts = time.time() if ts is None else ts
+        fired = []
+
+        threshold_fields = {field for (_, field, _) in self._thresholds}
+        move_groups = {}
+        for (coin, field, window, direction) in self._moves:
+            move_groups.setdefault((field, window), set()).add(direction)
+
+        for coin_id, coin_data in data.items():
+            # ----------------------------------------------------------------
+            # THRESHOLD RULES - only the ones between prev and current value
+            # ----------------------------------------------------------------
+            for field in threshold_fields:
+                value = coin_data.get(field)
+                if value is None:
+                    continue
+                prev = self._prev_values.get((coin_id, field))
+                self._prev_values[(coin_id, field)] = value
+
+                for coin in (coin_id, ANY_COIN):
+                    above = self._thresholds.get((coin, field, 'above'))
+                    if above is not None:
+                        start = float('-inf') if prev is None else prev
+                        for rule in above.crossed_up(start, value):
+                            self._fire(rule, coin_id, value, ts, fired)
+                    below = self._thresholds.get((coin, field, 'below'))
+                    if below is not None:
+                        start = float('inf') if prev is None else prev
+                        for rule in below.crossed_down(start, value):
+                            self._fire(rule, coin_id, value, ts, fired)
+
+            # ----------------------------------------------------------------
+            # MOVE RULES - window low/high per coin, then a sorted pct lookup
+            # ----------------------------------------------------------------
+            for (field, window), directions in move_groups.items():
+                has_rules = any((coin, field, window, d) in self._moves
+                                for coin in (coin_id, ANY_COIN) for d in directions)
+                value = coin_data.get(field)
+                if not has_rules or value is None:
+                    continue
+
+                tracker = self._ranges.get((coin_id, field, window))
+                if tracker is None:
+                    tracker = self._ranges[(coin_id, field, window)] = _WindowRange(window)
+                low, high = tracker.push(ts, value)
+
+                moves = {
+                    'up': (value - low) / low * 100 if low > 0 else 0.0,
+                    'down': (high - value) / high * 100 if high > 0 else 0.0,
+                }
+                for direction in directions:
+                    move = moves[direction]
+                    state_key = (coin_id, field, window, direction)
+                    prev_move = self._prev_moves.get(state_key, 0.0)
+                    self._prev_moves[state_key] = move
+                    for coin in (coin_id, ANY_COIN):
+                        index = self._moves.get((coin, field, window, direction))
+                        if index is not None:
+                            for rule in index.crossed_up(prev_move, move):
+                                self._fire(rule, coin_id, move, ts, fired)
+
+        return fired
+
+    def _fire(self, rule, coin_id, value, ts, fired):
+        """Records an alert unless the rule is still cooling down for this coin."""
+        key = (rule.rule_id, coin_id)
+        last = self._last_fired.get(key)
+        if last is not None and ts - last < rule.cooldown:
+            return
+        self._last_fired[key] = ts
+        fired.append(Alert(rule, coin_id, value, ts))
+
+
+def default_alert_engine():
+    """
+    Builds the engine behind the tracker's ALERTS section: any coin that is
+    up or down more than 10% in 24 hours.
+    """
+    engine = AlertEngine()
+    engine.add_threshold(ANY_COIN, 'usd_24h_change', 'above', 10, cooldown=DEFAULT_COOLDOWN,
+                         message="{arrow} {name} is UP {value:.2f}% today!")
+    engine.add_threshold(ANY_COIN, 'usd_24h_change', 'below', -10, cooldown=DEFAULT_COOLDOWN,
+                         message="{arrow} {name} is DOWN {value:.2f}% today!")
+    return engine
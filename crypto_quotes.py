@@ -0,0 +1,227 @@
+# ============================================================================
+# CRYPTO QUOTE RECORDS
+# Compact, typed containers for fetched prices - no formatting, no printing
+# Array-backed snapshot table | __slots__ row views and coin details
+# ============================================================================
+
+import math      # For NaN placeholders
+import time      # For timestamping snapshots
+from array import array  # For compact float columns (8 bytes per value)
+
+NAN = math.nan
+
+
+# ============================================================================
+# ONE SNAPSHOT OF MANY COINS
+# ============================================================================
+class QuoteTable:
+    """
+    One /simple/price snapshot stored column by column.
+
+    Every field is one array('d') aligned with coin_ids, so a snapshot of
+    2,000 coins is a handful of arrays instead of 2,000 nested dicts.
+    Missing values are NaN. NumPy users can wrap a column without copying:
+    np.frombuffer(table.column('usd')).
+
+    Columns use the API's key names: '<currency>' for prices,
+    '<currency>_24h_change' and '<currency>_market_cap'.
+
+    Example:
+        table = fetch_quotes(['bitcoin', 'ethereum'])
+        table['bitcoin'].usd          # One coin as a Quote row view
+        table.column('usd')           # The whole price column
+    """
+
+    __slots__ = ('coin_ids', 'vs_currencies', 'ts', '_columns', '_rows')
+
+    def __init__(self, coin_ids, vs_currencies, columns, ts=None):
+        """
+        Args:
+            coin_ids (list): Row order
+            vs_currencies (list): Quote currencies in this snapshot
+            columns (dict): {api_key: array('d')} aligned with coin_ids
+            ts (float): Unix time of the snapshot (default: now)
+        """
+        self.coin_ids = coin_ids
+        self.vs_currencies = vs_currencies
+        self.ts = time.time() if ts is None else ts
+        self._columns = columns
+        self._rows = {coin_id: i for i, coin_id in enumerate(coin_ids)}
+
+    @classmethod
+    def from_api(cls, data, vs_currencies=('usd', 'inr'), ts=None):
+        """
+        Builds a table from a /simple/price response.
+
+        Args:
+            data (dict): {coin_id: {api_key: value}}
+            vs_currencies (list): Currencies that were requested
+            ts (float): Unix time of the snapshot (default: now)
+        """
+        vs_currencies = list(vs_currencies)
+        keys = []
+        for currency in vs_currencies:
+            keys += [currency, f"{currency}_24h_change", f"{currency}_market_cap"]
+
+        coin_ids = list(data)
+        columns = {key: array('d') for key in keys}
+        for coin_data in data.values():
+            for key in keys:
+                value = coin_data.get(key)
+                columns[key].append(NAN if value is None else value)
+        return cls(coin_ids, vs_currencies, columns, ts)
+
+    # ----------------------------------------------------------------
+    # COLUMN ACCESS (for bulk consumers)
+    # ----------------------------------------------------------------
+    def column(self, key):
+        """Returns the array('d') for an API key like 'usd' or 'usd_24h_change'."""
+        return self._columns[key]
+
+    def has_column(self, key):
+        return key in self._columns
+
+    def positions(self, columns):
+        """
+        Maps this table's rows onto another coin universe.
+
+        Args:
+            columns (dict): {coin_id: column index} of the target universe
+
+        Returns:
+            tuple: (rows, cols) lists - row rows[i] of this table belongs
+                   in column cols[i]; coins the universe lacks are skipped
+        """
+        rows, cols = [], []
+        for row, coin_id in enumerate(self.coin_ids):
+            col = columns.get(coin_id)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+        return rows, cols
+
+    # ----------------------------------------------------------------
+    # ROW ACCESS (for display and per-coin logic)
+    # ----------------------------------------------------------------
+    def __len__(self):
+        return len(self.coin_ids)
+
+    def __contains__(self, coin_id):
+        return coin_id in self._rows
+
+    def __getitem__(self, coin_id):
+        return Quote(self, self._rows[coin_id])
+
+    def __iter__(self):
+        for i in range(len(self.coin_ids)):
+            yield Quote(self, i)
+
+    def items(self):
+        """(coin_id, Quote) pairs, like dict.items() on the raw response."""
+        for i, coin_id in enumerate(self.coin_ids):
+            yield coin_id, Quote(self, i)
+
+    def __repr__(self):
+        return f"QuoteTable({len(self)} coins, {', '.join(self.vs_currencies)})"
+
+
+class Quote:
+    """
+    Lightweight view of one row of a QuoteTable.
+
+    Holds no data of its own - just the table and a row number - so it
+    costs nothing to create while iterating and nothing to keep around.
+    """
+
+    __slots__ = ('table', 'row')
+
+    def __init__(self, table, row):
+        self.table = table
+        self.row = row
+
+    @property
+    def coin_id(self):
+        return self.table.coin_ids[self.row]
+
+    @property
+    def name(self):
+        """Converts ID format: 'shiba-inu' becomes 'Shiba Inu'."""
+        return self.coin_id.replace('-', ' ').title()
+
+    @property
+    def usd(self):
+        return self.price('usd')
+
+    @property
+    def inr(self):
+        return self.price('inr')
+
+    @property
+    def change_24h(self):
+        """24hr percentage change of the USD price."""
+        return self.get('usd_24h_change', NAN)
+
+    @property
+    def market_cap(self):
+        """Market capitalization in USD."""
+        return self.get('usd_market_cap', NAN)
+
+    def price(self, currency):
+        return self.get(currency, NAN)
+
+    def get(self, key, default=None):
+        """Value by API key (like dict.get on the raw response); NaN -> default."""
+        column = self.table._columns.get(key)
+        if column is None:
+            return default
+        value = column[self.row]
+        return default if value != value else value  # NaN check
+
+    def __repr__(self):
+        return f"Quote({self.coin_id!r}, usd={self.usd}, inr={self.inr})"
+
+
+# ============================================================================
+# DETAILED INFO FOR ONE COIN
+# ============================================================================
+class CoinDetail:
+    """
+    The handful of /coins/{id} fields the tracker uses.
+
+    The full payload is several hundred KB of nested dicts (descriptions in
+    dozens of languages, tickers...); keeping only these fields makes cached
+    details cheap to hold.
+    """
+
+    __slots__ = ('coin_id', 'name', 'symbol', 'price_usd', 'price_inr', 'ath_usd', 'ath_date')
+
+    def __init__(self, coin_id, name, symbol, price_usd, price_inr, ath_usd, ath_date):
+        self.coin_id = coin_id
+        self.name = name
+        self.symbol = symbol
+        self.price_usd = price_usd
+        self.price_inr = price_inr
+        self.ath_usd = ath_usd
+        self.ath_date = ath_date
+
+    @classmethod
+    def from_api(cls, data):
+        """Extracts the fields from a /coins/{id} response."""
+        market = data['market_data']
+        return cls(
+            coin_id=data['id'],
+            name=data['name'],                       # Full name (e.g., 'Bitcoin')
+            symbol=data['symbol'].upper(),           # Ticker symbol (e.g., 'BTC')
+            price_usd=market['current_price']['usd'],
+            price_inr=market['current_price']['inr'],
+            ath_usd=market['ath']['usd'],            # All-time high price
+            ath_date=market['ath_date']['usd'][:10], # First 10 chars = YYYY-MM-DD
+        )
+
+    @property
+    def down_from_ath(self):
+        """Percentage below the all-time high: ((current - ath) / ath) * 100."""
+        return (self.price_usd - self.ath_usd) / self.ath_usd * 100
+
+    def __repr__(self):
+        return f"CoinDetail({self.coin_id!r}, usd={self.price_usd})"
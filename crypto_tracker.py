@@ -6,49 +6,345 @@
 
 import requests  # For making HTTP requests to the API
 import json      # For handling JSON data (though not heavily used here)
+from collections import deque  # For the live board's recent alerts
 from datetime import datetime  # For displaying current timestamp
 import time      # For sleep() function in live tracker
+import sys       # For writing the board to stdout in one go
+from concurrent.futures import ThreadPoolExecutor  # For fetching chunks in parallel
+
+import http_client  # Shared pooled HTTP session
+from crypto_alerts import default_alert_engine  # Indexed alert rules
+from crypto_quotes import QuoteTable, CoinDetail  # Compact quote records
+from coin_index import CoinIndex  # Symbol/name -> CoinGecko id lookups
+from poll_scheduler import PollScheduler, TokenBucket  # Drift-free, quota-aware polling
+from terminal_board import BoardRenderer  # Redraws only changed rows
+
+# ============================================================================
+# CONFIGURATION: COIN UNIVERSE & BATCHING
+# ============================================================================
+# CoinGecko's free public API - no authentication needed
+SIMPLE_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price"
+
+# Default list of cryptocurrency IDs (must match CoinGecko's naming)
+# Pass your own list to get_crypto_prices() or load one with load_coin_ids()
+DEFAULT_COIN_IDS = [
+    'bitcoin', 'ethereum', 'cardano', 'solana', 'dogecoin', 'shiba-inu',
+    'polygon', 'ripple', 'litecoin', 'polkadot', 'chainlink', 'stellar',
+    'tron', 'avalanche-2', 'uniswap',
+]
+
+# Currencies to display prices in (can add more like 'eur', 'gbp')
+DEFAULT_VS_CURRENCIES = ['usd', 'inr']
+
+# Max characters of comma-joined ids per request - keeps the full URL well
+# under the ~2,000 character limit that proxies and CDNs commonly enforce
+MAX_IDS_CHARS = 1500
+
+# Max ids per request, no matter how short the names are
+MAX_IDS_PER_CHUNK = 250
+
+# How many chunk requests may be in flight at once (be kind to the API!)
+MAX_WORKERS = 8
+
+# CoinGecko free tier quota used by live_tracker() (calls per minute)
+API_CALLS_PER_MINUTE = 30
+
+# Alert rules used when get_crypto_prices() isn't given its own engine.
+# Rules are edge-triggered, so a coin is only reported when it crosses.
+# Add your own: DEFAULT_ALERTS.add_threshold('bitcoin', 'usd', 'above', 70_000)
+DEFAULT_ALERTS = default_alert_engine()
+
+# Recent alerts kept at the top of the live board. Rules fire only once,
+# so they stay on screen for the next few alerts instead of one frame
+LIVE_ALERT_ROWS = 5
+
+
+def load_coin_ids(path):
+    """
+    Loads a coin universe from a text file.
+    
+    Args:
+        path (str): File with CoinGecko ids, separated by commas or newlines.
+                    Lines starting with '#' are ignored.
+    
+    Returns:
+        list: Unique coin ids in file order
+    """
+    coin_ids = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.split('#', 1)[0]
+            coin_ids.extend(part.strip().lower() for part in line.split(','))
+    # dict.fromkeys() drops duplicates but keeps the original order
+    return list(dict.fromkeys(c for c in coin_ids if c))
+
+
+def chunk_coin_ids(coin_ids, max_chars=MAX_IDS_CHARS, max_ids=MAX_IDS_PER_CHUNK):
+    """
+    Splits a list of coin ids into URL-safe chunks.
+    
+    Args:
+        coin_ids (list): CoinGecko ids to split
+        max_chars (int): Max length of one comma-joined chunk
+        max_ids (int): Max number of ids in one chunk
+    
+    Returns:
+        list: List of id lists, each small enough for one request
+    """
+    chunks = []
+    current = []
+    current_len = 0
+    
+    for coin_id in coin_ids:
+        # +1 for the comma separating this id from the previous one
+        added = len(coin_id) + (1 if current else 0)
+        if current and (current_len + added > max_chars or len(current) >= max_ids):
+            chunks.append(current)
+            current = []
+            current_len = 0
+            added = len(coin_id)
+        current.append(coin_id)
+        current_len += added
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _fetch_price_chunk(coin_ids, vs_currencies):
+    """Fetches one chunk from /simple/price. Raises on any HTTP error."""
+    params = {
+        'ids': ','.join(coin_ids),
+        'vs_currencies': ','.join(vs_currencies),
+        
+        # Include 24-hour percentage change (true/false)
+        'include_24hr_change': 'true',
+        
+        # Include market capitalization data (true/false)
+        'include_market_cap': 'true'
+    }
+    # Send GET request with 30-second timeout to prevent hanging
+    # Never a stale copy in place of a 429: the live tracker must back off
+    response = http_client.get(SIMPLE_PRICE_URL, params=params, timeout=30, stale_if_error=False)
+    response.raise_for_status()
+    return response.json()
+
+
+def fetch_prices_batch(coin_ids=None, vs_currencies=None, max_workers=MAX_WORKERS):
+    """
+    Fetches prices for any number of coins without printing anything.
+    
+    The id list is split into URL-safe chunks which are fetched in parallel
+    by a bounded thread pool, so a refresh of thousands of coins takes about
+    as long as the slowest single chunk.
+    
+    Args:
+        coin_ids (list): CoinGecko ids (default: DEFAULT_COIN_IDS)
+        vs_currencies (list): Quote currencies (default: usd and inr)
+        max_workers (int): Max chunk requests in flight at once
+    
+    Returns:
+        dict: {coin_id: {field: value}} merged from all chunks, in the
+              order of coin_ids (unknown ids are simply missing)
+    
+    Raises:
+        requests.exceptions.RequestException: If any chunk fails
+    """
+    coin_ids = list(dict.fromkeys(coin_ids or DEFAULT_COIN_IDS))
+    vs_currencies = vs_currencies or DEFAULT_VS_CURRENCIES
+    chunks = chunk_coin_ids(coin_ids)
+    
+    if len(chunks) <= 1:
+        # Nothing to parallelise - skip the thread pool overhead
+        results = [_fetch_price_chunk(chunk, vs_currencies) for chunk in chunks]
+    else:
+        workers = max(1, min(max_workers, len(chunks)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # map() yields in submission order and re-raises the first error
+            results = list(pool.map(lambda chunk: _fetch_price_chunk(chunk, vs_currencies), chunks))
+    
+    merged = {}
+    for result in results:
+        merged.update(result)
+    
+    # Keep the caller's ordering instead of whatever order chunks finished in
+    return {coin_id: merged[coin_id] for coin_id in coin_ids if coin_id in merged}
+
+
+def fetch_quotes(coin_ids=None, vs_currencies=None, max_workers=MAX_WORKERS):
+    """
+    Fetches prices into a compact QuoteTable - no formatting, no printing.
+    
+    This is what bulk consumers (live_tracker, alerts, history, analytics)
+    should use: one array per field instead of one dict per coin.
+    
+    Args:
+        coin_ids (list): CoinGecko ids (default: DEFAULT_COIN_IDS)
+        vs_currencies (list): Quote currencies (default: usd and inr)
+        max_workers (int): Max chunk requests in flight at once
+    
+    Returns:
+        QuoteTable: One row per coin found, in the order of coin_ids
+    
+    Raises:
+        requests.exceptions.RequestException: If any chunk fails
+    """
+    vs_currencies = vs_currencies or DEFAULT_VS_CURRENCIES
+    data = fetch_prices_batch(coin_ids, vs_currencies, max_workers)
+    return QuoteTable.from_api(data, vs_currencies)
+
+
+# ============================================================================
+# HELPER: BUILD & PRINT THE PRICE BOARD
+# ============================================================================
+def format_market_cap(market_cap):
+    """Market cap in billions or millions: '$1.23B' / '$456.78M'."""
+    if market_cap > 1_000_000_000:  # If over 1 billion
+        return f"${market_cap / 1_000_000_000:.2f}B"
+    return f"${market_cap / 1_000_000:.2f}M"  # If under 1 billion, show in millions
+
+
+def trend_marker(change_24h):
+    """(trend indicator, sign prefix) for a 24h change: green up or red down."""
+    if change_24h > 0:  # Price went up
+        return "🟢 ↗", "+"  # Show '+' sign for positive change
+    return "🔴 ↘", ""  # Negative sign already included
+
+
+def build_price_board(quotes, alerts=None):
+    """
+    Formats the price board and ALERTS section for one snapshot.
+    
+    Args:
+        quotes (QuoteTable): Snapshot from fetch_quotes()
+        alerts (AlertEngine): Rules for the ALERTS section (default: DEFAULT_ALERTS)
+    
+    Returns:
+        list: The board's text rows, ready for one write
+    """
+    lines = []
+    
+    # ----------------------------------------------------------------
+    # HEADER WITH TIMESTAMP
+    # ----------------------------------------------------------------
+    lines.append("╔" + "═" * 70 + "╗")
+    lines.append("║" + "  LIVE CRYPTOCURRENCY PRICES".center(70) + "║")
+    lines.append("║" + f"  Updated: {datetime.now().strftime('%I:%M:%S %p, %d %b %Y')}".center(70) + "║")
+    lines.append("╚" + "═" * 70 + "╝")
+    lines.append("")
+    
+    # ----------------------------------------------------------------
+    # LOOP THROUGH EACH CRYPTOCURRENCY
+    # ----------------------------------------------------------------
+    for quote in quotes:
+        # Converts ID format: 'shiba-inu' becomes 'Shiba Inu'
+        crypto_name = quote.name
+        
+        # Price data (NaN if the API left a field out)
+        usd_price = quote.usd            # Price in US Dollars
+        inr_price = quote.inr            # Price in Indian Rupees
+        change_24h = quote.change_24h    # 24hr percentage change
+        market_cap = quote.market_cap    # Total market value
+        
+        market_cap_str = format_market_cap(market_cap)
+        trend, change_color = trend_marker(change_24h)
+        
+        # ----------------------------------------------------------------
+        # CRYPTO INFORMATION
+        # ----------------------------------------------------------------
+        lines.append(f"━━━ {crypto_name} ━━━")
+        lines.append(f"  💵 USD: ${usd_price:,.2f}")  # :,. adds thousand separators
+        lines.append(f"  💰 INR: ₹{inr_price:,.2f}")
+        lines.append(f"  {trend} 24h Change: {change_color}{change_24h:.2f}%")
+        lines.append(f"  📊 Market Cap: {market_cap_str}")
+        lines.append("")  # Blank line for readability
+    
+    # ----------------------------------------------------------------
+    # ALERT SECTION - Highlight Big Movers
+    # ----------------------------------------------------------------
+    lines.append("🚨 ALERTS:")
+    engine = alerts if alerts is not None else DEFAULT_ALERTS
+    for alert in engine.check(quotes, ts=quotes.ts):
+        lines.append(f"   {alert.message}")
+    
+    return lines
+
+
+def build_live_board(quotes, recent_alerts=(), portfolio_lines=()):
+    """
+    Formats the compact board used by live_tracker().
+    
+    Everything that carries events comes first - recent alerts, then the
+    portfolio - followed by one row per coin, so on a short terminal only
+    coin rows can fall off the bottom (BoardRenderer says how many).
+    
+    Args:
+        quotes (QuoteTable): Snapshot from fetch_quotes()
+        recent_alerts (iterable): Alert rows to show, newest last
+        portfolio_lines (list): Rows from Portfolio.summary_lines()
+    
+    Returns:
+        list: The board's text rows, ready for one write
+    """
+    lines = [f"📈 LIVE CRYPTOCURRENCY PRICES | Updated: {datetime.now().strftime('%I:%M:%S %p, %d %b %Y')}"]
+    lines.append("🚨 ALERTS:")
+    lines.extend(f"   {row}" for row in recent_alerts)
+    if not recent_alerts:
+        lines.append("   (none yet)")
+    if portfolio_lines:
+        lines.extend(portfolio_lines)
+    
+    lines.append(f"{'COIN':<16} {'USD':>16} {'INR':>18}    {'24H':>8} {'MARKET CAP':>12}")
+    for quote in quotes:
+        trend, sign = trend_marker(quote.change_24h)
+        lines.append(f"{quote.name[:16]:<16} {quote.usd:>16,.2f} {quote.inr:>18,.2f} {trend} "
+                     f"{sign + format(quote.change_24h, '.2f') + '%':>8} {format_market_cap(quote.market_cap):>12}")
+    return lines
+
+
+def show_crypto_prices(quotes, alerts=None, renderer=None):
+    """
+    Prints the price board and ALERTS section for one snapshot.
+    
+    Args:
+        quotes (QuoteTable): Snapshot from fetch_quotes()
+        alerts (AlertEngine): Rules for the ALERTS section (default: DEFAULT_ALERTS)
+        renderer (BoardRenderer): Redraws only changed rows on a terminal
+                                  (default: one plain write of the whole board)
+    """
+    lines = build_price_board(quotes, alerts)
+    if renderer is not None:
+        renderer.render(lines)
+    else:
+        # One write instead of ~90 print() calls
+        sys.stdout.write("\n".join(lines) + "\n")
+
 
 # ============================================================================
 # FUNCTION 1: GET MULTIPLE CRYPTO PRICES
 # ============================================================================
-def get_crypto_prices():
+def get_crypto_prices(coin_ids=None, vs_currencies=None, alerts=None):
     """
     Fetches live prices for multiple cryptocurrencies simultaneously.
     
+    Args:
+        coin_ids (list): CoinGecko ids to track (default: DEFAULT_COIN_IDS)
+        vs_currencies (list): Quote currencies, must include 'usd' and 'inr'
+                              for the board below (default: usd and inr)
+        alerts (AlertEngine): Rules for the ALERTS section (default:
+                              DEFAULT_ALERTS, any coin moving >10% in 24h)
+    
     Returns:
-        dict: Price data for all requested cryptocurrencies, or None if error
+        QuoteTable: Price data for all requested cryptocurrencies, or None if error
     
     Features:
         - Gets prices in USD and INR
         - Shows 24-hour price change percentage
         - Displays market capitalization
-        - Highlights significant price movements (>10%)
+        - Highlights significant price movements (>10%), once per move
+        - Handles thousands of coins via chunked, parallel requests
     """
     try:
-        # ----------------------------------------------------------------
-        # API ENDPOINT SETUP
-        # ----------------------------------------------------------------
-        # CoinGecko's free public API - no authentication needed
-        url = "https://api.coingecko.com/api/v3/simple/price"
-        
-        # ----------------------------------------------------------------
-        # REQUEST PARAMETERS
-        # ----------------------------------------------------------------
-        params = {
-            # List of cryptocurrency IDs (must match CoinGecko's naming)
-            'ids': 'bitcoin,ethereum,cardano,solana,dogecoin,shiba-inu,polygon,ripple,litecoin,polkadot,chainlink,stellar,tron,avalanche-2,uniswap',
-            
-            # Currencies to display prices in (can add more like 'eur', 'gbp')
-            'vs_currencies': 'usd,inr',
-            
-            # Include 24-hour percentage change (true/false)
-            'include_24hr_change': 'true',
-            
-            # Include market capitalization data (true/false)
-            'include_market_cap': 'true'
-        }
-        
         # ----------------------------------------------------------------
         # LOADING MESSAGES
         # ----------------------------------------------------------------
@@ -56,96 +352,28 @@ def get_crypto_prices():
         print("⏳ Please wait...\n")
         
         # ----------------------------------------------------------------
-        # MAKE API REQUEST
+        # MAKE API REQUESTS (chunked + parallel)
         # ----------------------------------------------------------------
-        # Send GET request with 30-second timeout to prevent hanging
-        response = requests.get(url, params=params, timeout=30)
+        quotes = fetch_quotes(coin_ids, vs_currencies)
         
         # ----------------------------------------------------------------
-        # HANDLE SUCCESSFUL RESPONSE (Status Code 200)
+        # DISPLAY THE BOARD
         # ----------------------------------------------------------------
-        if response.status_code == 200:
-            # Parse JSON response into Python dictionary
-            data = response.json()
-            
-            # ----------------------------------------------------------------
-            # DISPLAY HEADER WITH TIMESTAMP
-            # ----------------------------------------------------------------
-            print("╔" + "═" * 70 + "╗")
-            print("║" + "  LIVE CRYPTOCURRENCY PRICES".center(70) + "║")
-            print("║" + f"  Updated: {datetime.now().strftime('%I:%M:%S %p, %d %b %Y')}".center(70) + "║")
-            print("╚" + "═" * 70 + "╝\n")
-            
-            # ----------------------------------------------------------------
-            # LOOP THROUGH EACH CRYPTOCURRENCY
-            # ----------------------------------------------------------------
-            for crypto_id, crypto_data in data.items():
-                # Convert ID format: 'shiba-inu' becomes 'Shiba Inu'
-                crypto_name = crypto_id.replace('-', ' ').title()
-                
-                # Extract price data from API response
-                usd_price = crypto_data['usd']           # Price in US Dollars
-                inr_price = crypto_data['inr']           # Price in Indian Rupees
-                change_24h = crypto_data['usd_24h_change']  # 24hr percentage change
-                market_cap = crypto_data['usd_market_cap']  # Total market value
-                
-                # ----------------------------------------------------------------
-                # FORMAT MARKET CAP (Billions or Millions)
-                # ----------------------------------------------------------------
-                if market_cap > 1_000_000_000:  # If over 1 billion
-                    market_cap_str = f"${market_cap / 1_000_000_000:.2f}B"
-                else:  # If under 1 billion, show in millions
-                    market_cap_str = f"${market_cap / 1_000_000:.2f}M"
-                
-                # ----------------------------------------------------------------
-                # DETERMINE TREND INDICATOR (Green up or Red down)
-                # ----------------------------------------------------------------
-                if change_24h > 0:  # Price went up
-                    trend = "🟢 ↗"
-                    change_color = "+"  # Show '+' sign for positive change
-                else:  # Price went down
-                    trend = "🔴 ↘"
-                    change_color = ""  # Negative sign already included
-                
-                # ----------------------------------------------------------------
-                # DISPLAY CRYPTO INFORMATION
-                # ----------------------------------------------------------------
-                print(f"━━━ {crypto_name} ━━━")
-                print(f"  💵 USD: ${usd_price:,.2f}")  # :,. adds thousand separators
-                print(f"  💰 INR: ₹{inr_price:,.2f}")
-                print(f"  {trend} 24h Change: {change_color}{change_24h:.2f}%")
-                print(f"  📊 Market Cap: {market_cap_str}")
-                print()  # Blank line for readability
-            
-            # ----------------------------------------------------------------
-            # ALERT SECTION - Highlight Big Movers
-            # ----------------------------------------------------------------
-            print("🚨 ALERTS:")
-            for crypto_id, crypto_data in data.items():
-                change = crypto_data['usd_24h_change']
-                name = crypto_id.replace('-', ' ').title()
-                
-                # Alert if price moved more than 10% in either direction
-                if change > 10:
-                    print(f"   🚀 {name} is UP {change:.2f}% today!")
-                elif change < -10:
-                    print(f"   📉 {name} is DOWN {change:.2f}% today!")
-            
-            return data  # Return the full data dictionary for further use
+        show_crypto_prices(quotes, alerts)
         
-        # ----------------------------------------------------------------
-        # HANDLE RATE LIMITING (Status Code 429)
-        # ----------------------------------------------------------------
-        elif response.status_code == 429:
+        return quotes  # Return the quote table for further use
+    
+    # ----------------------------------------------------------------
+    # HANDLE HTTP ERRORS (from any chunk)
+    # ----------------------------------------------------------------
+    except requests.exceptions.HTTPError as e:
+        status = e.response.status_code if e.response is not None else None
+        if status == 429:
+            # Rate limited (Status Code 429)
             print("❌ Error: Too many requests. Wait a minute and try again.")
-            return None
-        
-        # ----------------------------------------------------------------
-        # HANDLE OTHER HTTP ERRORS
-        # ----------------------------------------------------------------
         else:
-            print(f"❌ Error: Could not fetch data (Status: {response.status_code})")
-            return None
+            print(f"❌ Error: Could not fetch data (Status: {status})")
+        return None
     
     # ----------------------------------------------------------------
     # EXCEPTION HANDLING
@@ -160,6 +388,93 @@ def get_crypto_prices():
         return None
 
 
+# ============================================================================
+# COIN LOOKUP INDEX & DETAIL CACHE
+# ============================================================================
+# How long a /coins/{id} result is reused before asking the API again
+DETAIL_CACHE_TTL = 60
+
+# coin_id -> (expires_at, CoinDetail). Lives for the whole session.
+_detail_cache = {}
+
+# Symbol/name -> id index, loaded on first use (see coin_index.py)
+_coin_index = None
+
+
+def get_coin_index():
+    """Returns the shared CoinIndex, loading it from disk on first use."""
+    global _coin_index
+    if _coin_index is None:
+        _coin_index = CoinIndex.load()
+    return _coin_index
+
+
+def _detail_cache_get(coin_id):
+    """Returns a cached CoinDetail, or None if missing or expired."""
+    entry = _detail_cache.get(coin_id)
+    if entry is None:
+        return None
+    expires_at, data = entry
+    if time.monotonic() >= expires_at:
+        del _detail_cache[coin_id]
+        return None
+    return data
+
+
+def _detail_cache_put(coin_id, detail, ttl=DETAIL_CACHE_TTL):
+    """Stores a CoinDetail for ttl seconds."""
+    _detail_cache[coin_id] = (time.monotonic() + ttl, detail)
+
+
+def fetch_coin_detail(coin_id):
+    """
+    Fetches the details of one coin - no formatting, no printing.
+    
+    Args:
+        coin_id (str): Exact CoinGecko id (see get_coin_index().resolve())
+    
+    Returns:
+        CoinDetail: Prices and all-time high (cached for DETAIL_CACHE_TTL)
+    
+    Raises:
+        requests.exceptions.RequestException: If the request fails (404 for
+                                              unknown ids)
+    """
+    detail = _detail_cache_get(coin_id)
+    if detail is None:
+        url = f"https://api.coingecko.com/api/v3/coins/{coin_id}"
+        response = http_client.get(url, timeout=30)
+        response.raise_for_status()
+        detail = CoinDetail.from_api(response.json())
+        _detail_cache_put(coin_id, detail)
+    return detail
+
+
+def build_coin_detail(detail):
+    """
+    Formats one coin's details.
+    
+    Args:
+        detail (CoinDetail): Result of fetch_coin_detail()
+    
+    Returns:
+        list: Text rows, ready for one write
+    """
+    return [
+        f"╔{'═' * 50}╗",
+        f"║  {detail.name} ({detail.symbol})".ljust(51) + "║",  # .ljust() pads with spaces
+        f"╚{'═' * 50}╝",
+        "",
+        # Current prices with thousand separators
+        f"💵 Current Price (USD): ${detail.price_usd:,.2f}",
+        f"💰 Current Price (INR): ₹{detail.price_inr:,.2f}",
+        # All-time high info
+        f"🏆 All-Time High: ${detail.ath_usd:,.2f} (on {detail.ath_date})",
+        f"📉 Down from ATH: {detail.down_from_ath:.2f}%",
+        "",
+    ]
+
+
 # ============================================================================
 # FUNCTION 2: GET DETAILED INFO FOR ONE CRYPTO
 # ============================================================================
@@ -171,89 +486,51 @@ def get_single_crypto(crypto_name):
         crypto_name (str): Name or symbol of the crypto (e.g., 'bitcoin' or 'btc')
     
     Returns:
-        dict: Detailed crypto data, or None if not found
+        CoinDetail: Detailed crypto data, or None if not found
     
     Features:
         - Current price in USD and INR
         - All-time high (ATH) price and date
         - Percentage down from ATH
+        - Repeat lookups within DETAIL_CACHE_TTL skip the network
     """
     try:
         # ----------------------------------------------------------------
-        # CRYPTO NAME MAPPING
-        # ----------------------------------------------------------------
-        # Maps common abbreviations to CoinGecko's official IDs
-        crypto_map = {
-            'bitcoin': 'bitcoin', 'btc': 'bitcoin',
-            'ethereum': 'ethereum', 'eth': 'ethereum',
-            'dogecoin': 'dogecoin', 'doge': 'dogecoin',
-            'shiba': 'shiba-inu', 'shib': 'shiba-inu',
-            'cardano': 'cardano', 'ada': 'cardano',
-            'solana': 'solana', 'sol': 'solana'
-        }
-        
-        # Convert input to lowercase and look up in map
-        # If not in map, use the input as-is (assumes it's already correct ID)
-        crypto_id = crypto_map.get(crypto_name.lower(), crypto_name.lower())
-        
-        # ----------------------------------------------------------------
-        # BUILD API URL FOR SPECIFIC COIN
+        # RESOLVE NAME / SYMBOL -> COINGECKO ID
         # ----------------------------------------------------------------
-        url = f"https://api.coingecko.com/api/v3/coins/{crypto_id}"
+        # Uses the full coin list (cached on disk) instead of guessing
+        crypto_id, candidates = get_coin_index().resolve(crypto_name)
         
-        print(f"\n🔍 Fetching detailed info for {crypto_name}...\n")
+        if crypto_id is None:
+            if candidates:
+                print(f"❌ '{crypto_name}' is ambiguous. Did you mean one of:")
+                for candidate in candidates[:10]:
+                    print(f"   • {candidate}")
+            else:
+                print(f"❌ Could not find crypto: {crypto_name}")
+            return None
         
         # ----------------------------------------------------------------
-        # MAKE API REQUEST
+        # FETCH (served from the detail cache when possible)
         # ----------------------------------------------------------------
-        response = requests.get(url, timeout=30)
+        if _detail_cache_get(crypto_id) is None:
+            print(f"\n🔍 Fetching detailed info for {crypto_name}...\n")
         
-        # ----------------------------------------------------------------
-        # PROCESS SUCCESSFUL RESPONSE
-        # ----------------------------------------------------------------
-        if response.status_code == 200:
-            data = response.json()  # Parse JSON response
-            
+        try:
+            detail = fetch_coin_detail(crypto_id)
+        except requests.exceptions.HTTPError:
             # ----------------------------------------------------------------
-            # EXTRACT DATA FROM NESTED JSON STRUCTURE
+            # HANDLE CRYPTO NOT FOUND
             # ----------------------------------------------------------------
-            name = data['name']  # Full name (e.g., 'Bitcoin')
-            symbol = data['symbol'].upper()  # Ticker symbol (e.g., 'BTC')
-            
-            # Current prices (nested under 'market_data' -> 'current_price')
-            current_price_usd = data['market_data']['current_price']['usd']
-            current_price_inr = data['market_data']['current_price']['inr']
-            
-            # All-time high data
-            ath_usd = data['market_data']['ath']['usd']  # ATH price
-            ath_date = data['market_data']['ath_date']['usd'][:10]  # ATH date (first 10 chars = YYYY-MM-DD)
-            
-            # ----------------------------------------------------------------
-            # DISPLAY DETAILED INFORMATION
-            # ----------------------------------------------------------------
-            print(f"╔{'═' * 50}╗")
-            print(f"║  {name} ({symbol})".ljust(51) + "║")  # .ljust() pads with spaces
-            print(f"╚{'═' * 50}╝")
-            
-            # Current prices with thousand separators
-            print(f"\n💵 Current Price (USD): ${current_price_usd:,.2f}")
-            print(f"💰 Current Price (INR): ₹{current_price_inr:,.2f}")
-            
-            # All-time high info
-            print(f"🏆 All-Time High: ${ath_usd:,.2f} (on {ath_date})")
-            
-            # Calculate percentage down from ATH
-            # Formula: ((current - ath) / ath) * 100
-            print(f"📉 Down from ATH: {((current_price_usd - ath_usd) / ath_usd * 100):.2f}%\n")
-            
-            return data  # Return full data dictionary
+            print(f"❌ Could not find crypto: {crypto_name}")
+            return None
         
         # ----------------------------------------------------------------
-        # HANDLE CRYPTO NOT FOUND
+        # DISPLAY DETAILED INFORMATION
         # ----------------------------------------------------------------
-        else:
-            print(f"❌ Could not find crypto: {crypto_name}")
-            return None
+        sys.stdout.write("\n".join(build_coin_detail(detail)) + "\n")
+        
+        return detail  # Return the CoinDetail record
     
     # ----------------------------------------------------------------
     # EXCEPTION HANDLING
@@ -266,47 +543,116 @@ def get_single_crypto(crypto_name):
 # ============================================================================
 # FUNCTION 3: LIVE PRICE TRACKER (AUTO-REFRESH)
 # ============================================================================
-def live_tracker(seconds=60):
+def live_tracker(seconds=60, coin_ids=None, history=None, analytics=None,
+                 calls_per_minute=API_CALLS_PER_MINUTE, portfolio=None, vs_currencies=None):
     """
     Continuously monitors crypto prices with automatic refresh.
     
     Args:
         seconds (int): Time between updates (default: 60 seconds)
+        coin_ids (list): CoinGecko ids to track (default: DEFAULT_COIN_IDS)
+        history (PriceHistory): Optional store from price_history.py -
+                                every snapshot is appended to it
+        analytics (RollingAnalytics): Optional stats from price_analytics.py -
+                                      updated with every snapshot
+        calls_per_minute (int): Upstream quota the tracker must stay under
+        portfolio (Portfolio): Optional book from portfolio.py - revalued
+                               on every tick and shown under the board
+        vs_currencies (list): Quote currencies to fetch (default: usd and
+                              inr, plus the portfolio's currencies)
+    
+    How it schedules (see poll_scheduler.py):
+        - Refreshes are aligned to a fixed grid, so slow fetches don't drift
+        - A token bucket keeps all chunk requests within calls_per_minute
+        - 429s and timeouts back off exponentially (with jitter) instead of
+          retrying at the next tick; skipped / delayed polls are reported
+        - On a terminal the board is redrawn in place, changed rows only;
+          alerts and the portfolio sit above the one-row-per-coin table
     
     WARNING: 
-        - Don't set refresh rate too low (< 10 seconds) or API will rate-limit you
         - Press Ctrl+C to stop the tracker
     
     Rate Limits:
         - CoinGecko free tier: ~10-50 calls/minute depending on endpoint
-        - Recommended minimum: 30-60 seconds between refreshes
+        - Each refresh costs one call per chunk of ~250 coins
     """
     print("\n🔴 LIVE TRACKER MODE")
     print(f"Updating every {seconds} seconds...")
     print("Press Ctrl+C to stop\n")
     
+    coin_ids = coin_ids or DEFAULT_COIN_IDS
+    vs_currencies = list(vs_currencies or DEFAULT_VS_CURRENCIES)
+    if portfolio is not None:
+        # Make sure every held coin and every valuation currency is fetched
+        coin_ids = list(dict.fromkeys(list(coin_ids) + portfolio.coin_ids))
+        vs_currencies = list(dict.fromkeys(vs_currencies + portfolio.currencies))
+    
+    # Each chunk is one API call, so that's what a refresh costs in tokens
+    cost = len(chunk_coin_ids(coin_ids))
+    scheduler = PollScheduler(seconds, TokenBucket.per_minute(calls_per_minute))
+    stats = scheduler.stats
+    
+    # On a terminal only the changed rows are redrawn; piped output stays plain
+    renderer = BoardRenderer()
+    
+    # Alerts fire once, so the last few stay on the board
+    recent_alerts = deque(maxlen=LIVE_ALERT_ROWS)
+    
+    # ----------------------------------------------------------------
+    # ONE REFRESH - errors propagate so the scheduler can back off
+    # ----------------------------------------------------------------
+    def refresh():
+        quotes = fetch_quotes(coin_ids, vs_currencies)
+        stamp = datetime.now().strftime('%H:%M:%S')
+        for alert in DEFAULT_ALERTS.check(quotes, ts=quotes.ts):
+            recent_alerts.append(f"[{stamp}] {alert.message}")
+        
+        # Revalue the book - only coins whose price moved are touched
+        portfolio_lines = []
+        if portfolio is not None:
+            portfolio.update(quotes)
+            portfolio_lines = portfolio.summary_lines()
+        
+        # Compact layout: alerts and portfolio on top, one row per coin below
+        renderer.render(build_live_board(quotes, list(recent_alerts), portfolio_lines))
+        
+        # Keep the snapshot instead of throwing it away
+        if history is not None:
+            history.append(quotes)
+        if analytics is not None:
+            analytics.update_snapshot(quotes)
+    
+    def report_error(error, delay):
+        message = f"❌ Error: {error}"
+        if delay:
+            message += f"\n🐢 Backing off for {delay:.0f} seconds..."
+        renderer.status(message)
+    
+    def report_wait(wait):
+        # Show countdown message
+        message = (f"⏳ Refreshing in {wait:.0f} seconds... "
+                   f"(skipped: {stats.skipped}, delayed: {stats.delayed}, throttled: {stats.throttled})")
+        if not renderer.diff:
+            # Visual separator between updates (the live board redraws in place)
+            message = f"\n{message}\n\n" + "=" * 70 + "\n"
+        renderer.status(message)
+    
     try:
         # ----------------------------------------------------------------
         # INFINITE LOOP - Runs until user stops it
         # ----------------------------------------------------------------
-        while True:
-            # Fetch and display current prices
-            get_crypto_prices()
-            
-            # Show countdown message
-            print(f"\n⏳ Refreshing in {seconds} seconds...\n")
-            
-            # Wait before next update (this is blocking - script pauses here)
-            time.sleep(seconds)
-            
-            # Visual separator between updates
-            print("\n" + "="*70 + "\n")
+        scheduler.run(refresh, cost=cost, on_error=report_error, on_wait=report_wait)
     
     # ----------------------------------------------------------------
     # HANDLE KEYBOARD INTERRUPT (Ctrl+C)
     # ----------------------------------------------------------------
     except KeyboardInterrupt:
         print("\n\n✋ Tracker stopped by user. Goodbye!")
+        print(f"📊 {stats.polls} polls | {stats.ok} ok | {stats.skipped} skipped | "
+              f"{stats.delayed} delayed | {stats.throttled} throttled")
+    finally:
+        if history is not None:
+            history.flush()
 
 
 # ============================================================================
@@ -330,7 +676,7 @@ if __name__ == "__main__":
     # ----------------------------------------------------------------
     # FETCH AND DISPLAY CRYPTO PRICES
     # ----------------------------------------------------------------
-    crypto_data = get_crypto_prices()  # Call main function
+    crypto_data = get_crypto_prices()  # Call main function (returns a QuoteTable)
     
     # ----------------------------------------------------------------
     # SHOW USAGE TIPS (Only if data fetch was successful)
@@ -345,8 +691,8 @@ if __name__ == "__main__":
         print()
         print("🎯 NEXT STEPS:")
         print("   1. Uncomment line below to get detailed Bitcoin info")
-        print("   2. Track your favorite coins by editing the 'ids' list")
-        print("   3. Set up alerts for specific price targets")
+        print("   2. Track your favorite coins by editing DEFAULT_COIN_IDS (or load_coin_ids())")
+        print("   3. Set up alerts for specific price targets (DEFAULT_ALERTS)")
         print("   4. Save price history to a CSV file")
         print("   5. Uncomment live_tracker() for auto-refresh mode")
         print()
@@ -363,6 +709,14 @@ if __name__ == "__main__":
         # WARNING: Don't set seconds too low or API will block you!
         # Recommended: Keep at 60 seconds or higher
         # live_tracker(seconds=60)
+        
+        # Or keep every tick on disk for later analysis (needs numpy):
+        # from price_history import PriceHistory
+        # live_tracker(seconds=60, history=PriceHistory(coin_ids=DEFAULT_COIN_IDS))
+        
+        # Or value your own holdings on every tick (coin,qty,cost_basis CSV):
+        # from portfolio import Portfolio
+        # live_tracker(seconds=60, portfolio=Portfolio.from_csv('holdings.csv'))
     
     # ----------------------------------------------------------------
     # CLOSING BANNER
@@ -0,0 +1,146 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# On-disk store of forecast payloads, one row per grid tile
+CACHE_PATH = os.path.join(BASE_DIR, ".cache", "forecasts.sqlite")
+
+# Tile size in degrees (~11 km): about the resolution of the global
+# models behind Open-Meteo, so points inside one tile get the same forecast
+GRID_DEGREES = 0.1
+
+# Global models start a new run every 6 hours (00, 06, 12, 18 UTC)...
+MODEL_CYCLE_HOURS = 6
+
+# ...and the run shows up in the API a few hours after it starts
+PUBLICATION_LAG_HOURS = 4
+
+
+# -----------------------------
+# MODEL CYCLE TIMING
+# -----------------------------
+def next_model_update(now: float = None) -> float:
+    """
+    Unix time when the next model run becomes available.
+    A forecast fetched now stays current until then.
+    """
+    now = time.time() if now is None else now
+    cycle = MODEL_CYCLE_HOURS * 3600
+    lag = PUBLICATION_LAG_HOURS * 3600
+
+    # Start of the newest run that is already published
+    published_run = (now - lag) // cycle * cycle
+    return published_run + cycle + lag
+
+
+# -----------------------------
+# GRID TILES
+# -----------------------------
+def snap_to_grid(lat: float, lon: float, grid: float = GRID_DEGREES):
+    """
+    The tile a point falls in: (key, center_lat, center_lon).
+    Points a few km apart (two addresses in one city) usually share
+    a tile; neighbouring cities such as Delhi and Noida do not.
+    """
+    row, col = round(lat / grid), round(lon / grid)
+    return f"{row}:{col}", round(row * grid, 4), round(col * grid, 4)
+
+
+# -----------------------------
+# PERSISTENT FORECAST CACHE
+# -----------------------------
+class ForecastCache:
+    """
+    SQLite-backed forecast cache keyed on grid tiles.
+
+    A payload is fetched once per tile and reused by every point in
+    it until the next model run is published, rather than on a short
+    fixed TTL. Fresh entries are also kept in memory.
+
+    `version` identifies the payload format (e.g. the request's query
+    parameters): it is part of every key, so payloads fetched with
+    other parameters are never served. Outdated tiles are purged when
+    the cache is opened.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, grid: float = GRID_DEGREES, version: str = ""):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.grid = grid
+        self.version = hashlib.sha1(version.encode()).hexdigest()[:8]
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._memory = {}
+
+        with self._lock, self._db:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS tiles (
+                    key TEXT PRIMARY KEY,
+                    payload TEXT NOT NULL,
+                    fetched REAL NOT NULL,
+                    expires REAL NOT NULL
+                )
+                """
+            )
+        self.purge()
+
+    def tile(self, lat: float, lon: float):
+        """(key, center_lat, center_lon) of the tile holding a point."""
+        key, center_lat, center_lon = snap_to_grid(lat, lon, self.grid)
+        return f"{self.version}/{key}", center_lat, center_lon
+
+    def get(self, key: str, now: float = None):
+        """Cached payload for a tile, or None if missing or outdated."""
+        now = time.time() if now is None else now
+
+        entry = self._memory.get(key)
+        if entry is None:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT payload, expires FROM tiles WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            entry = (json.loads(row[0]), row[1])
+            self._memory[key] = entry
+
+        payload, expires = entry
+        if now >= expires:
+            self._memory.pop(key, None)
+            return None
+        return payload
+
+    def put(self, key: str, payload: dict, now: float = None):
+        """Stores a tile's payload until the next model run."""
+        self.put_many({key: payload}, now)
+
+    def put_many(self, payloads: dict, now: float = None):
+        """Stores many {key: payload} tiles in one transaction."""
+        now = time.time() if now is None else now
+        expires = next_model_update(now)
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(payload), now, expires) for key, payload in payloads.items()],
+            )
+        for key, payload in payloads.items():
+            self._memory[key] = (payload, expires)
+
+    def purge(self, now: float = None):
+        """Deletes outdated tiles from disk."""
+        now = time.time() if now is None else now
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM tiles WHERE expires <= ?", (now,))
+        self._memory = {k: v for k, v in self._memory.items() if v[1] > now}
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,214 @@
+import csv
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Bundled list of Indian cities (name, state, lat, lon) used to seed the cache
+GAZETTEER_PATH = os.path.join(BASE_DIR, "data", "india_cities.csv")
+
+# On-disk cache of every city we have ever geocoded
+CACHE_PATH = os.path.join(BASE_DIR, ".cache", "geocode.sqlite")
+
+# Old names, common spellings and short forms -> the name in the gazetteer
+ALIASES = {
+    "bombay": "mumbai",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "bangalore": "bengaluru",
+    "bengaluru city": "bengaluru",
+    "poona": "pune",
+    "gurgaon": "gurugram",
+    "trivandrum": "thiruvananthapuram",
+    "baroda": "vadodara",
+    "benares": "varanasi",
+    "banaras": "varanasi",
+    "kashi": "varanasi",
+    "cawnpore": "kanpur",
+    "mysore": "mysuru",
+    "mangalore": "mangaluru",
+    "calicut": "kozhikode",
+    "cochin": "kochi",
+    "ernakulam": "kochi",
+    "pondicherry": "puducherry",
+    "pondy": "puducherry",
+    "simla": "shimla",
+    "allahabad": "prayagraj",
+    "vizag": "visakhapatnam",
+    "vishakhapatnam": "visakhapatnam",
+    "belgaum": "belagavi",
+    "hubli": "hubballi",
+    "gauhati": "guwahati",
+    "jubbulpore": "jabalpur",
+    "trichy": "tiruchirappalli",
+    "tiruchi": "tiruchirappalli",
+    "kalaburagi": "gulbarga",
+    "bellary": "ballari",
+    "shimoga": "shivamogga",
+    "quilon": "kollam",
+    "alleppey": "alappuzha",
+    "cannanore": "kannur",
+    "trichur": "thrissur",
+    "tanjore": "thanjavur",
+    "ootacamund": "ooty",
+    "udhagamandalam": "ooty",
+    "rajamahendravaram": "rajahmundry",
+    "panjim": "panaji",
+    "delhi ncr": "delhi",
+    "ncr": "delhi",
+    "dilli": "delhi",
+    "faizabad": "ayodhya",
+    "aurangabad maharashtra": "aurangabad",
+    "chhatrapati sambhajinagar": "aurangabad",
+    "sambhajinagar": "aurangabad",
+    "bokaro": "bokaro steel city",
+    "brahmapur": "berhampur",
+    "burdwan": "bardhaman",
+    "kharagpur city": "kharagpur",
+}
+
+
+# -----------------------------
+# CITY NAME NORMALIZATION
+# -----------------------------
+def normalize_city(name: str) -> str:
+    """
+    Turns any spelling of a city into one cache key:
+    case, accents, punctuation and extra spaces are ignored,
+    and known alternate names (Bombay, Madras...) are mapped.
+    """
+    text = _clean(name)
+
+    # "Pune, India" / "Pune city" -> "pune"
+    for suffix in (" india", " city"):
+        if text.endswith(suffix) and text[: -len(suffix)] in _known_names():
+            text = text[: -len(suffix)]
+
+    return ALIASES.get(text, text)
+
+
+def _clean(name: str) -> str:
+    """Lowercase ASCII-ish words: '  Bengalūru-City ' -> 'bengaluru city'."""
+    # "Bengalūru" -> "Bengaluru": split accents off, then drop them
+    text = unicodedata.normalize("NFKD", name)
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+
+    # Keep letters/digits only, everything else becomes a space
+    text = "".join(ch if ch.isalnum() else " " for ch in text.casefold())
+    return " ".join(text.split())
+
+
+_gazetteer_names = None
+
+
+def _known_names():
+    """Normalized gazetteer names (loaded once)."""
+    global _gazetteer_names
+    if _gazetteer_names is None:
+        _gazetteer_names = {_clean(row["name"]) for row in load_gazetteer()}
+    return _gazetteer_names
+
+
+def load_gazetteer(path: str = GAZETTEER_PATH):
+    """Reads the bundled city list as dicts with name, state, lat, lon."""
+    if not os.path.exists(path):
+        return []
+    with open(path, newline="", encoding="utf-8") as f:
+        return [
+            {
+                "name": row["name"],
+                "state": row["state"],
+                "lat": float(row["lat"]),
+                "lon": float(row["lon"]),
+            }
+            for row in csv.DictReader(f)
+        ]
+
+
+# -----------------------------
+# PERSISTENT GEOCODING CACHE
+# -----------------------------
+class GeoCache:
+    """
+    SQLite-backed city -> coordinates cache.
+
+    Pre-seeded with the bundled gazetteer, so common Indian cities
+    never need a geocoding call. Every lookup is also memoized in
+    memory, so a warm lookup is a dict hit.
+    """
+
+    def __init__(self, path: str = CACHE_PATH, seed: bool = True):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._memory = {}
+
+        with self._lock, self._db:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS places (
+                    key TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    lat REAL NOT NULL,
+                    lon REAL NOT NULL,
+                    country TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    updated REAL NOT NULL
+                )
+                """
+            )
+
+        if seed:
+            self.seed()
+
+    def seed(self, path: str = GAZETTEER_PATH):
+        """Adds every gazetteer city that is not cached yet."""
+        now = time.time()
+        rows = [
+            (normalize_city(city["name"]), city["name"], city["lat"], city["lon"], "India", "gazetteer", now)
+            for city in load_gazetteer(path)
+        ]
+        with self._lock, self._db:
+            self._db.executemany("INSERT OR IGNORE INTO places VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+
+    def get(self, city: str):
+        """Returns cached coordinates for a city, or None."""
+        key = normalize_city(city)
+        if key in self._memory:
+            return self._memory[key]
+
+        with self._lock:
+            row = self._db.execute(
+                "SELECT name, lat, lon, country FROM places WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        coords = {"name": row[0], "lat": row[1], "lon": row[2], "country": row[3]}
+        self._memory[key] = coords
+        return coords
+
+    def put(self, city: str, coords: dict):
+        """Stores coordinates under the query and the resolved name."""
+        keys = {normalize_city(city), normalize_city(coords["name"])}
+        now = time.time()
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO places VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (key, coords["name"], coords["lat"], coords["lon"], coords.get("country", ""), "api", now)
+                    for key in keys
+                ],
+            )
+        for key in keys:
+            self._memory[key] = coords
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,75 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# On-disk copy of every Hacker News item we have fetched
+STORE_PATH = os.path.join(BASE_DIR, ".cache", "hn_items.sqlite")
+
+
+# -----------------------------
+# PERSISTENT ITEM STORE
+# -----------------------------
+class HNStore:
+    """
+    SQLite store of Hacker News items keyed by id.
+
+    Each row keeps the item JSON and when it was last fetched, so a
+    refresh can tell which stories it already knows and how old
+    their score/comment counts are.
+    """
+
+    def __init__(self, path: str = STORE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._db:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS items (
+                    id INTEGER PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    fetched REAL NOT NULL
+                )
+                """
+            )
+
+    def get_many(self, item_ids):
+        """{id: (item, fetched)} for the ids we have."""
+        item_ids = list(item_ids)
+        found = {}
+        # SQLite limits the number of ? placeholders per statement
+        for i in range(0, len(item_ids), 500):
+            chunk = item_ids[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            with self._lock:
+                rows = self._db.execute(
+                    f"SELECT id, data, fetched FROM items WHERE id IN ({marks})", chunk
+                ).fetchall()
+            for item_id, data, fetched in rows:
+                found[item_id] = (json.loads(data), fetched)
+        return found
+
+    def put_many(self, items, now: float = None):
+        """Stores (or replaces) fetched items."""
+        now = time.time() if now is None else now
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?)",
+                [(item["id"], json.dumps(item), now) for item in items],
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,398 @@
+# ============================================================================
+# HTTP RESPONSE CACHE
+# A private HTTP cache (RFC 9111) under the shared client: Cache-Control
+# freshness, ETag / Last-Modified revalidation, stale-while-revalidate and
+# stale-if-error, with compressed bodies stored in SQLite
+# ============================================================================
+
+import json       # For storing response headers
+import os         # For building file paths and creating folders
+import sqlite3    # For the on-disk store
+import threading  # For the store lock and background revalidation
+import time       # For response ages
+import zlib       # For compressing stored bodies
+from email.utils import formatdate, parsedate_to_datetime  # For HTTP dates
+
+import requests   # For building Response objects
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CACHE_PATH = os.path.join(BASE_DIR, '.cache', 'http.sqlite')
+
+# How long a stored response may be served when the origin fails or
+# rate-limits us, if the response itself doesn't say (seconds). Pollers
+# that must see the 429 to back off opt out per call (stale_if_error=False)
+DEFAULT_STALE_IF_ERROR = 24 * 3600
+
+# Size limits: entries not refreshed for MAX_ENTRY_AGE seconds are deleted,
+# and beyond MAX_ENTRIES the least recently stored ones go first
+MAX_ENTRIES = 5000
+MAX_ENTRY_AGE = 7 * 24 * 3600
+
+# Check the limits once per this many stored responses (and on open)
+PURGE_EVERY = 200
+
+# Statuses that mean "origin is struggling": fall back to a stale copy
+ERROR_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Statuses we store (plain successful GETs)
+CACHEABLE_STATUS_CODES = {200, 203}
+
+# Headers describing the stored body that no longer apply once requests
+# has decoded it
+_DROPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding')
+
+
+# ============================================================================
+# CACHE-CONTROL PARSING
+# ============================================================================
+def parse_cache_control(value):
+    """
+    'max-age=60, stale-while-revalidate=30, no-cache' ->
+    {'max-age': 60, 'stale-while-revalidate': 30, 'no-cache': True}
+    """
+    directives = {}
+    for part in (value or '').split(','):
+        name, _, arg = part.strip().partition('=')
+        name = name.strip().lower()
+        if not name:
+            continue
+        arg = arg.strip().strip('"')
+        if arg.isdigit():
+            directives[name] = int(arg)
+        else:
+            directives[name] = arg or True
+    return directives
+
+
+def _http_date(value):
+    """HTTP date header -> Unix time, or None."""
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+# ============================================================================
+# ONE STORED RESPONSE
+# ============================================================================
+class CacheEntry:
+    """A stored response plus the bookkeeping needed to judge its freshness."""
+
+    __slots__ = ('url', 'status', 'headers', 'body', 'stored', 'vary')
+
+    def __init__(self, url, status, headers, body, stored, vary):
+        self.url = url
+        self.status = status
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.stored = stored    # Unix time the response was received/revalidated
+        self.vary = vary        # {request header: value} the response varies on
+
+    @property
+    def directives(self):
+        return parse_cache_control(self.headers.get('Cache-Control'))
+
+    def age(self, now):
+        """Current age: the origin's Age header plus time spent in our store."""
+        try:
+            initial = max(0, int(self.headers.get('Age', 0)))
+        except ValueError:
+            initial = 0
+        return initial + max(0.0, now - self.stored)
+
+    def lifetime(self):
+        """
+        Freshness lifetime in seconds (RFC 9111 4.2.1): max-age, else
+        Expires - Date, else 10% of the time since Last-Modified.
+        """
+        cc = self.directives
+        if 'no-cache' in cc:
+            return 0
+        if isinstance(cc.get('max-age'), int):
+            return cc['max-age']
+
+        date = _http_date(self.headers.get('Date')) or self.stored
+        expires = self.headers.get('Expires')
+        if expires is not None:
+            expires_at = _http_date(expires)
+            return max(0, expires_at - date) if expires_at else 0
+
+        last_modified = _http_date(self.headers.get('Last-Modified'))
+        if last_modified:
+            return max(0, (date - last_modified) / 10)
+        return 0
+
+    def staleness(self, now):
+        """Seconds past the freshness lifetime (<= 0 while fresh)."""
+        return self.age(now) - self.lifetime()
+
+    def may_serve_stale(self, directive, now, default=0):
+        """
+        True if `directive` (stale-while-revalidate / stale-if-error) covers us.
+
+        must-revalidate forbids both. no-cache only forbids serving without
+        asking first - an old copy still beats an error page once we have.
+        """
+        cc = self.directives
+        if 'must-revalidate' in cc:
+            return False
+        if 'no-cache' in cc and directive != 'stale-if-error':
+            return False
+        window = cc.get(directive)
+        if not isinstance(window, int):
+            window = default
+        return self.staleness(now) <= window
+
+    def validators(self):
+        """Conditional request headers for revalidation."""
+        headers = {}
+        if 'ETag' in self.headers:
+            headers['If-None-Match'] = self.headers['ETag']
+        if 'Last-Modified' in self.headers:
+            headers['If-Modified-Since'] = self.headers['Last-Modified']
+        return headers
+
+    def to_response(self, request=None, cache_status='HIT'):
+        """A requests.Response built from the stored copy."""
+        response = requests.Response()
+        response.status_code = self.status
+        response._content = self.body
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.headers['X-Cache'] = cache_status
+        response.url = self.url
+        response.reason = 'OK'
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.request = request
+        return response
+
+
+# ============================================================================
+# THE CACHE
+# ============================================================================
+class HTTPCache:
+    """
+    Private HTTP cache for GET requests.
+
+    Per request:
+        fresh copy                   -> served from disk, no network
+        stale, in stale-while-revalidate window
+                                     -> served now, refreshed in the background
+        stale / no-cache / validators only
+                                     -> conditional GET (If-None-Match /
+                                        If-Modified-Since); a 304 costs a few
+                                        hundred bytes and the stored body is reused
+        origin error / 429 / timeout -> stale copy if within stale-if-error
+                                        (default DEFAULT_STALE_IF_ERROR), marked
+                                        X-Cache: STALE-IF-ERROR with the
+                                        origin's status in X-Cache-Origin-Status
+
+    Bodies are stored zlib-compressed. Responses marked no-store, or with
+    Vary: *, are never stored. Streaming requests bypass the cache.
+    Served responses carry an X-Cache header (HIT, STALE, STALE-IF-ERROR,
+    REVALIDATED, MISS). The store keeps at most MAX_ENTRIES responses,
+    none older than MAX_ENTRY_AGE.
+
+    Example:
+        cache = HTTPCache()
+        response = cache.get(http_client.get_session(), url, timeout=10)
+    """
+
+    def __init__(self, path=CACHE_PATH, stale_if_error=DEFAULT_STALE_IF_ERROR,
+                 max_entries=MAX_ENTRIES, max_age=MAX_ENTRY_AGE, clock=time.time):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.stale_if_error = stale_if_error
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._saves = 0
+        self._clock = clock
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._refreshing = set()  # Keys being revalidated in the background
+
+        with self._lock, self._db:
+            self._db.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    status INTEGER NOT NULL,
+                    headers TEXT NOT NULL,
+                    vary TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    stored REAL NOT NULL
+                )
+                """
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS responses_stored ON responses (stored)")
+        self.purge()
+
+    # ----------------------------------------------------------------
+    # STORAGE
+    # ----------------------------------------------------------------
+    def load(self, key):
+        with self._lock:
+            row = self._db.execute(
+                "SELECT url, status, headers, vary, body, stored FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        url, status, headers, vary, body, stored = row
+        return CacheEntry(url, status, json.loads(headers), zlib.decompress(body), stored, json.loads(vary))
+
+    def save(self, key, entry):
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, entry.url, entry.status, json.dumps(dict(entry.headers)), json.dumps(entry.vary),
+                 zlib.compress(entry.body), entry.stored),
+            )
+            self._saves += 1
+            due = self._saves % PURGE_EVERY == 0
+        if due:
+            self.purge()
+
+    def purge(self):
+        """Applies the size limits: drops old entries, then the oldest beyond max_entries."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses WHERE stored < ?", (self._clock() - self.max_age,))
+            self._db.execute(
+                "DELETE FROM responses WHERE key IN "
+                "(SELECT key FROM responses ORDER BY stored DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def delete(self, key):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    # ----------------------------------------------------------------
+    # REQUESTS
+    # ----------------------------------------------------------------
+    def get(self, session, url, params=None, headers=None, stream=False,
+            stale_if_error=True, **kwargs):
+        """
+        Cached equivalent of session.get(url, ...).
+
+        With stale_if_error=False origin errors always reach the caller,
+        even when a stale copy would be allowed - for pollers that must
+        see a 429 to back off. Such calls also skip stale-while-revalidate:
+        a stale copy is never returned without asking the origin first.
+
+        Returns:
+            requests.Response: From the network or rebuilt from the store
+        """
+        if stream:
+            return session.get(url, params=params, headers=headers, stream=True, **kwargs)
+
+        request = session.prepare_request(requests.Request('GET', url, params=params, headers=headers))
+        key = request.url
+
+        # Proxy / certificate settings, as session.get() would apply them
+        kwargs.update(session.merge_environment_settings(
+            request.url, kwargs.pop('proxies', {}), False, kwargs.pop('verify', None), kwargs.pop('cert', None)
+        ))
+        now = self._clock()
+
+        entry = self.load(key)
+        if entry is not None and not self._vary_matches(entry, request):
+            entry = None
+
+        if entry is not None and entry.staleness(now) <= 0 and 'no-cache' not in entry.directives:
+            return entry.to_response(request, 'HIT')
+
+        if (stale_if_error and entry is not None
+                and entry.may_serve_stale('stale-while-revalidate', now)):
+            self._revalidate_in_background(session, request, key, entry, kwargs)
+            return entry.to_response(request, 'STALE')
+
+        return self._fetch(session, request, key, entry, kwargs, stale_if_error)
+
+    def _fetch(self, session, request, key, entry, kwargs, stale_if_error=True):
+        """Network round trip (conditional if we hold a copy), with stale fallback."""
+        if entry is not None:
+            request.headers.update(entry.validators())
+        fallback = entry if stale_if_error else None
+
+        try:
+            response = session.send(request, **kwargs)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if self._can_fall_back(fallback):
+                return self._stale_response(fallback, request, 'error')
+            raise
+
+        now = self._clock()
+        if response.status_code == 304 and entry is not None:
+            # Unchanged: keep our body, take the fresh headers
+            for name, value in response.headers.items():
+                if name.lower() not in _DROPPED_HEADERS:
+                    entry.headers[name] = value
+            entry.stored = now
+            self.save(key, entry)
+            return entry.to_response(request, 'REVALIDATED')
+
+        if response.status_code in ERROR_STATUS_CODES and self._can_fall_back(fallback):
+            return self._stale_response(fallback, request, response.status_code)
+
+        self._store(key, request, response, now)
+        response.headers['X-Cache'] = 'MISS'
+        return response
+
+    def _store(self, key, request, response, now):
+        """Saves a response if the rules allow it."""
+        cc = parse_cache_control(response.headers.get('Cache-Control'))
+        vary = response.headers.get('Vary', '')
+        if (response.status_code not in CACHEABLE_STATUS_CODES or 'no-store' in cc
+                or vary.strip() == '*'):
+            if 'no-store' in cc:
+                self.delete(key)
+            return
+
+        headers = {name: value for name, value in response.headers.items()
+                   if name.lower() not in _DROPPED_HEADERS}
+        headers.setdefault('Date', formatdate(now, usegmt=True))
+        vary_values = {name.strip().lower(): request.headers.get(name.strip(), '')
+                       for name in vary.split(',') if name.strip()}
+        self.save(key, CacheEntry(response.url, response.status_code, headers,
+                                  response.content, now, vary_values))
+
+    @staticmethod
+    def _stale_response(entry, request, origin_status):
+        """A stored copy served in place of an error, labelled as such."""
+        response = entry.to_response(request, 'STALE-IF-ERROR')
+        response.headers['X-Cache-Origin-Status'] = str(origin_status)
+        return response
+
+    def _can_fall_back(self, entry):
+        return entry is not None and entry.may_serve_stale(
+            'stale-if-error', self._clock(), default=self.stale_if_error)
+
+    @staticmethod
+    def _vary_matches(entry, request):
+        return all(request.headers.get(name, '') == value for name, value in entry.vary.items())
+
+    def _revalidate_in_background(self, session, request, key, entry, kwargs):
+        """Starts one refresh thread per key (extra callers just get the stale copy)."""
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._fetch(session, request.copy(), key, entry, kwargs)
+            except requests.exceptions.RequestException:
+                pass  # Next request will try again
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, daemon=True).start()
@@ -0,0 +1,159 @@
+# ============================================================================
+# SHARED HTTP CLIENT
+# One pooled requests.Session for every script: keep-alive connections per
+# host, default timeouts, one retry policy for transient failures and an
+# on-disk HTTP cache (see http_cache.py)
+# ============================================================================
+
+import threading  # For creating the shared session exactly once
+
+import requests   # For the Session itself
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from http_cache import HTTPCache  # Cache-Control aware response cache
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# (connect, read) timeout in seconds, used when a call doesn't pass its own
+DEFAULT_TIMEOUT = (5, 20)
+
+# Hosts to keep pools for, and open connections kept per host. The per-host
+# size covers the thread pools used for parallel fetches (8 workers)
+POOL_CONNECTIONS = 16
+POOL_MAXSIZE = 16
+
+# Serve GETs through the HTTP cache (set to False to always hit the network)
+CACHE_ENABLED = True
+
+# Transient server errors worth retrying a couple of times. 429 is NOT here:
+# rate limits are handled by the callers (see poll_scheduler), which know
+# how long to back off - retrying instantly would only dig the hole deeper
+RETRY_STATUS_CODES = (500, 502, 503, 504)
+
+# Longest sleep between two retries, in seconds
+RETRY_BACKOFF_MAX = 4
+
+class _CallerPacedRetry(Retry):
+    """
+    Retry that never retries a response carrying Retry-After.
+
+    urllib3 would otherwise retry such 429s/503s and sleep for the header
+    inside the request - minutes for CoinGecko or Reddit. They come back
+    to the caller at once instead, which honours the header itself
+    (poll_scheduler.retry_after).
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if has_retry_after:
+            return False
+        return super().is_retry(method, status_code, has_retry_after=False)
+
+
+RETRY_POLICY = _CallerPacedRetry(
+    total=3,
+    connect=3,
+    read=2,
+    status=3,
+    backoff_factor=0.5,                     # 0.5s, 1s, 2s between attempts
+    backoff_max=RETRY_BACKOFF_MAX,
+    status_forcelist=RETRY_STATUS_CODES,
+    allowed_methods=frozenset({'GET', 'HEAD'}),
+    respect_retry_after_header=False,       # Never sleep for Retry-After in here
+    raise_on_status=False,                  # Return the last response; callers
+)                                           # still get HTTPError via raise_for_status()
+
+
+class _TimeoutAdapter(HTTPAdapter):
+    """HTTPAdapter that applies DEFAULT_TIMEOUT when a request has none."""
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = DEFAULT_TIMEOUT
+        return super().send(request, **kwargs)
+
+
+# ============================================================================
+# SHARED SESSION
+# ============================================================================
+_session = None
+_cache = None
+_session_lock = threading.Lock()
+
+
+def new_session():
+    """
+    Builds a Session with pooled keep-alive connections, default timeouts
+    and the retry policy mounted for http and https.
+    """
+    session = requests.Session()
+    adapter = _TimeoutAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=RETRY_POLICY,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session():
+    """
+    Returns the process-wide Session, creating it on first use.
+
+    Reusing it means repeat calls to the same API skip the TCP + TLS
+    handshake. It is safe to share between threads for plain GETs.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = new_session()
+    return _session
+
+
+def get_cache():
+    """Returns the process-wide HTTPCache, opening it on first use."""
+    global _cache
+    if _cache is None:
+        with _session_lock:
+            if _cache is None:
+                _cache = HTTPCache()
+    return _cache
+
+
+def get(url, cache=True, stale_if_error=True, **kwargs):
+    """
+    Drop-in replacement for requests.get() that uses the shared Session.
+
+    Responses go through the HTTP cache unless cache=False or
+    stream=True: fresh copies come from disk, stale ones are revalidated
+    with a conditional request, and a stored copy is served if the API
+    fails or rate-limits us (stale-if-error). Pollers pass
+    stale_if_error=False so they always see the 429 / 5xx and can back
+    off; they never get a stale copy, not even while revalidating.
+
+    Example:
+        response = http_client.get('https://dog.ceo/api/breeds/image/random')
+        response.raise_for_status()
+    """
+    if cache and CACHE_ENABLED:
+        return get_cache().get(get_session(), url, stale_if_error=stale_if_error, **kwargs)
+    return get_session().get(url, **kwargs)
+
+
+def worst_case_time(timeout):
+    """
+    Longest a get() with this per-attempt timeout can block once
+    RETRY_POLICY has retried it: every attempt times out and each retry
+    waits the longest backoff.
+
+    Args:
+        timeout (float): Timeout passed to get() (connect and read)
+
+    Returns:
+        float: Seconds, for sizing a backstop around parallel requests
+    """
+    retries = RETRY_POLICY.total
+    return (retries + 1) * timeout + retries * RETRY_BACKOFF_MAX
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from urllib.parse import urlsplit
+
+import http_client
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+# Parallel downloads (matches the shared client's connections per host)
+DOWNLOAD_WORKERS = 16
+
+# Bytes written per chunk while streaming a body to disk
+CHUNK_SIZE = 64 * 1024
+
+# One JSON line per started / finished URL; appending is crash-safe
+MANIFEST_NAME = "manifest.jsonl"
+
+# Stop asking the API for more URLs after this many rounds without progress
+MAX_IDLE_ROUNDS = 5
+
+# Downloads queued per worker; keeps Ctrl+C from waiting on a whole round
+QUEUED_PER_WORKER = 2
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+
+# -----------------------------
+# MANIFEST (RESUME STATE)
+# -----------------------------
+class Manifest:
+    """
+    What a download folder already holds: url -> sha256 and
+    sha256 -> file name, plus URLs that were started but never
+    finished. Loaded from and appended to manifest.jsonl, so an
+    interrupted run picks up exactly where it stopped.
+    """
+
+    def __init__(self, folder: str):
+        self.path = os.path.join(folder, MANIFEST_NAME)
+        self.urls = {}
+        self.files = {}
+        self.pending = set()
+        self._lock = threading.Lock()
+
+        if os.path.exists(self.path):
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # Half-written last line from a crash
+                    if entry.get("pending"):
+                        self.pending.add(entry["url"])
+                        continue
+                    self.urls[entry["url"]] = entry["sha256"]
+                    self.files.setdefault(entry["sha256"], entry["file"])
+        self.pending -= self.urls.keys()
+
+    def _append(self, entry: dict):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    def start(self, urls):
+        """Notes URLs about to be downloaded, so a crash can resume them."""
+        with self._lock:
+            for url in urls:
+                if url not in self.pending:
+                    self.pending.add(url)
+                    self._append({"url": url, "pending": True})
+
+    def record(self, url: str, sha256: str, file: str) -> bool:
+        """
+        Remembers a finished download. Returns False if the same
+        content was already stored (the caller drops its copy).
+        """
+        with self._lock:
+            new = sha256 not in self.files
+            if new:
+                self.files[sha256] = file
+            self.urls[url] = sha256
+            self.pending.discard(url)
+            self._append({"url": url, "sha256": sha256, "file": self.files[sha256]})
+            return new
+
+
+# -----------------------------
+# ONE STREAMED DOWNLOAD
+# -----------------------------
+def _extension(url: str) -> str:
+    ext = os.path.splitext(urlsplit(url).path)[1].lower()
+    return ext if ext in IMAGE_EXTENSIONS else ".jpg"
+
+
+def download_image(url: str, folder: str, manifest: Manifest):
+    """
+    Streams one image to disk; returns "saved", "duplicate" or "skipped".
+
+    The body goes to <folder>/<url hash>.part chunk by chunk while
+    being hashed, and is only renamed to <sha256><ext> once complete.
+    A .part left by an interrupted run is resumed with a Range request.
+    """
+    if url in manifest.urls:
+        return "skipped"
+
+    part = os.path.join(folder, hashlib.sha1(url.encode()).hexdigest() + ".part")
+    digest = hashlib.sha256()
+    have = os.path.getsize(part) if os.path.exists(part) else 0
+    headers = {"Range": f"bytes={have}-"} if have else None
+
+    with http_client.get(url, cache=False, headers=headers, stream=True, timeout=(5, 30)) as response:
+        if response.status_code == 416:
+            # The .part doesn't fit the file on the server: start over
+            response.close()
+            os.remove(part)
+            return download_image(url, folder, manifest)
+        response.raise_for_status()
+
+        if response.status_code == 206 and have:
+            # Resuming: the hash must cover the bytes already on disk
+            with open(part, "rb") as f:
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            mode = "ab"
+        else:
+            mode = "wb"
+
+        with open(part, mode) as f:
+            for chunk in response.iter_content(CHUNK_SIZE):
+                f.write(chunk)
+                digest.update(chunk)
+
+    return _finish(url, folder, manifest, part, digest.hexdigest())
+
+
+def _finish(url: str, folder: str, manifest: Manifest, part: str, sha256: str):
+    # The file goes in place before the manifest line that points at it,
+    # so a crash in between only costs a re-download (names are content
+    # hashes, so that just overwrites the same bytes)
+    name = sha256[:32] + _extension(url)
+    path = os.path.join(folder, name)
+    renamed = sha256 not in manifest.files
+    if renamed:
+        os.replace(part, path)
+    else:
+        os.remove(part)
+
+    if manifest.record(url, sha256, name):
+        return "saved"
+    if renamed and manifest.files[sha256] != name:
+        os.remove(path)  # Same bytes arrived under another extension meanwhile
+    return "duplicate"
+
+
+# -----------------------------
+# MANY DOWNLOADS AT ONCE
+# -----------------------------
+def download_images(fetch_urls, count: int, folder: str, workers: int = DOWNLOAD_WORKERS):
+    """
+    Saves `count` new, distinct images into `folder`.
+
+    fetch_urls(n) must return a list of up to n image URLs (e.g. a
+    batch from a random-image API). URLs already in the folder's
+    manifest are skipped and identical images are stored once.
+    A rerun after Ctrl+C first finishes the downloads that were in
+    progress (resuming partial files), then continues.
+
+    Returns a dict of counters: saved, duplicate, skipped, failed.
+    """
+    os.makedirs(folder, exist_ok=True)
+    manifest = Manifest(folder)
+    stats = {"saved": 0, "duplicate": 0, "skipped": 0, "failed": 0}
+    started = time.perf_counter()
+    idle_rounds = 0
+
+    print(f"⬇️ Downloading {count} images to {folder} ({len(manifest.files)} already there)...")
+
+    # Unfinished downloads from an interrupted run go first
+    resume = list(manifest.pending)
+    if resume:
+        print(f"   Resuming {len(resume)} unfinished downloads")
+
+    def tally(futures):
+        for future in futures:
+            try:
+                stats[future.result()] += 1
+            except Exception:
+                stats["failed"] += 1
+
+    pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        while stats["saved"] < count and idle_rounds < MAX_IDLE_ROUNDS:
+            wanted = count - stats["saved"]
+            if resume:
+                urls, resume = resume[:wanted], resume[wanted:]
+            else:
+                try:
+                    urls = list(dict.fromkeys(fetch_urls(wanted)))
+                except Exception as e:
+                    print(f"❌ Could not get image URLs: {e}")
+                    idle_rounds += 1
+                    continue
+
+            before = stats["saved"]
+            new_urls = [url for url in urls if url not in manifest.urls]
+            stats["skipped"] += len(urls) - len(new_urls)
+            urls = new_urls[:wanted]
+            manifest.start(urls)
+
+            # Only a few downloads per worker are queued at any time
+            running = set()
+            for url in urls:
+                if len(running) >= workers * QUEUED_PER_WORKER:
+                    done, running = wait(running, return_when=FIRST_COMPLETED)
+                    tally(done)
+                running.add(pool.submit(download_image, url, folder, manifest))
+            tally(wait(running).done)
+
+            idle_rounds = idle_rounds + 1 if stats["saved"] == before else 0
+            elapsed = time.perf_counter() - started
+            print(f"   {stats['saved']}/{count} saved, {stats['duplicate']} duplicates, "
+                  f"{stats['failed']} failed ({stats['saved'] / elapsed * 60:.0f}/min)")
+    except KeyboardInterrupt:
+        # Drop queued downloads; the few in flight finish or stay as .part
+        pool.shutdown(wait=False, cancel_futures=True)
+        print(f"\n⏹️ Stopped after {stats['saved']} new images - run again to resume.")
+        return stats
+    pool.shutdown()
+
+    if stats["saved"] < count:
+        print("⚠️ The API kept returning images we already have - stopping early.")
+    print(f"✅ Done! {stats['saved']} new images in {folder}")
+    return stats
@@ -0,0 +1,177 @@
+import hashlib
+import random
+import re
+import time
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from. Generic names
+# like ref, source or share are left alone: some sites use them for content
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'igshid', 'mc_cid', 'mc_eid',
+    'ref_src', 'ref_url', 'cmpid', 'smid', 'sr_share',
+    'ncid', 'ocid', 'at_medium', 'at_campaign',
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', '__twitter', 'fb_')
+
+# Titles sharing at least this fraction of their words (Jaccard) are
+# treated as the same story ("EU agrees X" vs "EU agrees X - report": 0.75)
+MIN_TITLE_SIMILARITY = 0.6
+
+# Shorter titles are only matched by URL: two or three words overlap too easily
+MIN_TITLE_TOKENS = 3
+
+# MinHash signature split into bands of rows for lookup: titles sharing
+# any whole band become candidates. With 16 bands of 2 rows, a pair at
+# Jaccard 0.6 is found ~99.9% of the time and one at 0.2 only ~48%,
+# before the exact check
+MINHASH_BANDS = 16
+MINHASH_ROWS = 2
+
+# Filler words that shouldn't make two titles look different
+STOP_WORDS = {
+    'a', 'an', 'the', 'of', 'to', 'in', 'on', 'for', 'and', 'or', 'is', 'are',
+    'was', 'at', 'by', 'with', 'from', 'as', 'after', 'says', 'said',
+}
+
+def canonical_url(url):
+    """
+    One form for every spelling of the same link:
+    https, no 'www.'/'m.', no fragment, no tracking parameters,
+    sorted query, no trailing slash.
+    """
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in ('www.', 'm.', 'amp.'):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = re.sub(r'/+$', '', parts.path) or '/'
+    if path.endswith('/amp'):
+        path = path[:-4] or '/'
+    return urlunsplit(('https', host, path, urlencode(query), ''))
+
+def title_tokens(title):
+    """Lowercase words of a title without filler words"""
+    words = re.findall(r'[a-z0-9]+', (title or '').lower())
+    return [word for word in words if word not in STOP_WORDS]
+
+# One (a, b) pair per MinHash function: h -> (a * h + b) mod a Mersenne prime
+_MERSENNE = (1 << 61) - 1
+_rng = random.Random(1234)
+_PERMUTATIONS = [(_rng.randrange(1, _MERSENNE), _rng.randrange(_MERSENNE))
+                 for _ in range(MINHASH_BANDS * MINHASH_ROWS)]
+
+def minhash(tokens):
+    """
+    MinHash signature of a set of words: for each hash function the
+    smallest hash over the words. Two titles agree in a given slot
+    with probability equal to their Jaccard similarity.
+    """
+    hashes = [int.from_bytes(hashlib.blake2b(token.encode(), digest_size=8).digest(), 'big')
+              for token in set(tokens)]
+    if not hashes:
+        return ()
+    return tuple(min((a * h + b) % _MERSENNE for h in hashes) for a, b in _PERMUTATIONS)
+
+def jaccard(a, b):
+    """Shared words / all words of two word sets"""
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+def _bands(signature):
+    return [(i, signature[i * MINHASH_ROWS:(i + 1) * MINHASH_ROWS]) for i in range(MINHASH_BANDS)]
+
+def story_from_reddit(post, subreddit):
+    """Common story dict from a Reddit post"""
+    link = f"https://www.reddit.com{post.get('permalink', '')}"
+    url = post.get('url') or link
+    return {
+        'title': post.get('title', 'No title'),
+        'url': link if post.get('is_self') else url,
+        'discussion': link,
+        'source': f"r/{subreddit}",
+        'score': post.get('score', 0),
+        'comments': post.get('num_comments', 0),
+        'created': post.get('created_utc', 0),
+    }
+
+def story_from_hn(item):
+    """Common story dict from a Hacker News item"""
+    link = f"https://news.ycombinator.com/item?id={item.get('id')}"
+    return {
+        'title': item.get('title', 'No title'),
+        'url': item.get('url') or link,
+        'discussion': link,
+        'source': "HN",
+        'score': item.get('score', 0),
+        'comments': item.get('descendants', 0),
+        'created': item.get('time', 0),
+    }
+
+def aggregate(sources, now=None):
+    """
+    Merge stories from several sources into one ranked feed.
+
+    sources: {source name: [story dicts, best first]}
+
+    Stories with the same canonical URL, or titles sharing most of
+    their words (MinHash candidates confirmed by Jaccard), become one
+    entry listing every source it appeared in. Each source contributes
+    a rank-based weight (1.0 for its top story down to ~0 for its
+    last), so sources with very different score scales mix fairly; a
+    story found in several sources adds them up, and older stories
+    slowly sink.
+
+    Returns the story dicts, best first, with sources, links and rank added
+    """
+    now = time.time() if now is None else now
+    merged = []
+    by_url = {}
+    by_band = {}
+
+    for name, stories in sources.items():
+        for position, story in enumerate(stories):
+            weight = 1 - position / max(len(stories), 1)
+            url = canonical_url(story['url'])
+            tokens = set(title_tokens(story['title']))
+            signature = minhash(tokens) if len(tokens) >= MIN_TITLE_TOKENS else ()
+
+            # Same link, or a title sharing MIN_TITLE_SIMILARITY of its words?
+            index = by_url.get(url)
+            if index is None and signature:
+                candidates = {i for band in _bands(signature) for i in by_band.get(band, ())}
+                for i in sorted(candidates):
+                    if jaccard(merged[i]['tokens'], tokens) >= MIN_TITLE_SIMILARITY:
+                        index = i
+                        break
+
+            if index is None:
+                index = len(merged)
+                merged.append(dict(story, sources=[], links=[], weight=0.0, tokens=tokens))
+            entry = merged[index]
+            if story['source'] not in entry['sources']:
+                entry['sources'].append(story['source'])
+                entry['links'].append(story['discussion'])
+                entry['weight'] += weight
+            entry['created'] = max(entry['created'], story['created'])
+
+            by_url.setdefault(url, index)
+            if signature:
+                for band in _bands(signature):
+                    by_band.setdefault(band, []).append(index)
+
+    # Drop the matching state so callers only see story fields
+    for entry in merged:
+        del entry['tokens']
+        age_hours = max(0, now - entry['created']) / 3600
+        entry['rank'] = entry.pop('weight') / (1 + age_hours / 24)
+
+    merged.sort(key=lambda entry: entry['rank'], reverse=True)
+    return merged
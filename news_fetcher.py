@@ -1,79 +1,195 @@
-import requests
 from datetime import datetime
 import json
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import http_client
+from hn_store import HNStore
+from news_aggregator import aggregate, story_from_hn, story_from_reddit
+
+# Searchable history needs NumPy; fetching works without it
+try:
+    from news_index import NewsIndex
+except ImportError:
+    NewsIndex = None
+
+# Hacker News API
+HN_API = "https://hacker-news.firebaseio.com/v0"
+
+# Item requests in flight at once, and how long one item may take (seconds)
+HN_WORKERS = 16
+HN_ITEM_TIMEOUT = 5
+
+# Stored items are re-fetched when updates.json says they changed, or
+# at the latest after this many seconds (updates.json only lists the
+# most recent changes, so this catches anything it missed). Each item
+# gets up to HN_ITEM_AGE_JITTER extra on top, fixed per id, so a batch
+# fetched together doesn't expire together
+HN_ITEM_MAX_AGE = 30 * 60
+HN_ITEM_AGE_JITTER = 30 * 60
+
+# At most this many items are re-fetched per refresh just for being old
+# (oldest first); new and changed items are always fetched
+HN_MAX_AGE_REFRESHES = 50
+
+# Persistent item store (opened on first use)
+_hn_store = None
+
+def get_hn_store():
+    """Returns the shared Hacker News item store"""
+    global _hn_store
+    if _hn_store is None:
+        _hn_store = HNStore()
+    return _hn_store
+
+# Reddit listings (no auth needed for public posts)
+REDDIT_URL = "https://www.reddit.com/r/{subreddit}/{listing}.json"
+
+# Reddit requires a user agent
+REDDIT_HEADERS = {
+    'User-Agent': 'Python News Fetcher Bot 1.0'
+}
+
+# Reddit returns at most 100 posts per page
+REDDIT_PAGE_SIZE = 100
+
+# Search index of every fetched story (opened on first use)
+_news_index = None
+
+def get_news_index():
+    """Returns the shared news search index (None without NumPy)"""
+    global _news_index
+    if _news_index is None and NewsIndex is not None:
+        _news_index = NewsIndex()
+    return _news_index
+
+def record_stories(stories):
+    """Adds fetched stories to the search history (never fails the fetch)"""
+    try:
+        index = get_news_index()
+        if index is not None and stories:
+            index.add_many(stories)
+    except Exception as e:
+        print(f"⚠️ Could not save stories to history: {e}")
+
+def fetch_reddit_page(subreddit, listing="hot", after=None, count=0, limit=REDDIT_PAGE_SIZE):
+    """
+    Fetch one page of a subreddit listing.
+    
+    Returns (posts, after): the post dicts and the cursor for the
+    next page (None on the last page). Raises on HTTP errors.
+    """
+    params = {'limit': limit}
+    if after:
+        params['after'] = after
+        params['count'] = count
+    
+    url = REDDIT_URL.format(subreddit=subreddit, listing=listing)
+    response = http_client.get(url, params=params, headers=REDDIT_HEADERS, timeout=10, stale_if_error=False)
+    response.raise_for_status()
+    
+    data = response.json()['data']
+    return [child['data'] for child in data['children']], data.get('after')
+
+def iter_reddit_posts(subreddit="worldnews", limit=None, listing="hot", skip_stickied=True):
+    """
+    Stream posts from a subreddit, page after page.
+    
+    Follows Reddit's `after` cursor, so it can go far past the
+    100-post page limit. Only the current page is held in memory;
+    the next one is downloaded in the background while the current
+    one is being consumed. With a limit, no page beyond it is ever
+    requested; breaking out of the loop early wastes at most the
+    one page already in flight.
+    
+    Example:
+        for post in iter_reddit_posts("science", limit=1000):
+            print(post['title'])
+    """
+    pool = ThreadPoolExecutor(max_workers=1)
+    pending = pool.submit(fetch_reddit_page, subreddit, listing, None, 0,
+                          REDDIT_PAGE_SIZE if limit is None else min(REDDIT_PAGE_SIZE, limit))
+    seen = 0      # Posts received so far (Reddit's `count` parameter)
+    yielded = 0
+    
+    try:
+        while pending is not None:
+            posts, after = pending.result()
+            pending = None
+            seen += len(posts)
+            
+            wanted = [post for post in posts if not (skip_stickied and post.get('stickied'))]
+            
+            # Start downloading the next page before handing out this one
+            remaining = None if limit is None else limit - yielded - len(wanted)
+            if after and posts and (remaining is None or remaining > 0):
+                page_limit = REDDIT_PAGE_SIZE if remaining is None else min(REDDIT_PAGE_SIZE, remaining)
+                pending = pool.submit(fetch_reddit_page, subreddit, listing, after, seen, page_limit)
+            
+            for post in wanted:
+                yield post
+                yielded += 1
+                if limit is not None and yielded >= limit:
+                    return
+    finally:
+        if pending is not None:
+            pending.cancel()
+        pool.shutdown(wait=False)
 
 def fetch_reddit_news(subreddit="worldnews", limit=10):
     """
     Fetch latest news from Reddit - always current and free!
     
     Popular news subreddits: worldnews, news, technology, science, business
+    
+    Prints the posts and returns them as a list of post dicts.
     """
     
     print(f"\n🌍 Fetching latest posts from r/{subreddit}...\n")
     print("=" * 70)
     
-    # Reddit's JSON API (no auth needed for public posts)
-    url = f"https://www.reddit.com/r/{subreddit}/hot.json?limit={limit}"
-    
-    # Reddit requires a user agent
-    headers = {
-        'User-Agent': 'Python News Fetcher Bot 1.0'
-    }
+    posts = []
     
     try:
-        response = requests.get(url, headers=headers, timeout=10)
-        
-        if response.status_code == 200:
-            data = response.json()
-            posts = data['data']['children']
+        for post_data in iter_reddit_posts(subreddit, limit=limit):
+            posts.append(post_data)
+            count = len(posts)
             
-            if not posts:
-                print("No posts found!")
-                return
+            title = post_data.get('title', 'No title')
+            author = post_data.get('author', 'Unknown')
+            score = post_data.get('score', 0)
+            url_link = post_data.get('url', '')
+            permalink = f"https://www.reddit.com{post_data.get('permalink', '')}"
+            created = post_data.get('created_utc', 0)
             
-            count = 0
-            for post in posts:
-                post_data = post['data']
-                
-                # Skip stickied posts and non-news content
-                if post_data.get('stickied'):
-                    continue
-                
-                count += 1
-                title = post_data.get('title', 'No title')
-                author = post_data.get('author', 'Unknown')
-                score = post_data.get('score', 0)
-                url_link = post_data.get('url', '')
-                permalink = f"https://www.reddit.com{post_data.get('permalink', '')}"
-                created = post_data.get('created_utc', 0)
-                
-                # Format timestamp
-                try:
-                    pub_date = datetime.fromtimestamp(created)
-                    time_ago = get_time_ago(created)
-                    formatted_date = pub_date.strftime('%Y-%m-%d %H:%M')
-                except:
-                    formatted_date = "Unknown date"
-                    time_ago = ""
-                
-                # Print formatted post
-                print(f"\n📰 Post {count}")
-                print(f"Title: {title}")
-                print(f"Posted: {time_ago} | Score: {score}↑")
-                print(f"Link: {url_link}")
-                print(f"Comments: {permalink}")
-                print("-" * 70)
-                
-                if count >= limit:
-                    break
-            
-            print(f"\n✅ Successfully fetched {count} current posts!")
+            # Format timestamp
+            try:
+                pub_date = datetime.fromtimestamp(created)
+                time_ago = get_time_ago(created)
+                formatted_date = pub_date.strftime('%Y-%m-%d %H:%M')
+            except:
+                formatted_date = "Unknown date"
+                time_ago = ""
             
+            # Print formatted post
+            print(f"\n📰 Post {count}")
+            print(f"Title: {title}")
+            print(f"Posted: {time_ago} | Score: {score}↑")
+            print(f"Link: {url_link}")
+            print(f"Comments: {permalink}")
+            print("-" * 70)
+        
+        if posts:
+            print(f"\n✅ Successfully fetched {len(posts)} current posts!")
+            record_stories([story_from_reddit(post, subreddit) for post in posts])
         else:
-            print(f"❌ Error: Status code {response.status_code}")
+            print("No posts found!")
             
     except Exception as e:
         print(f"❌ Error: {e}")
+    
+    return posts
 
 def get_time_ago(timestamp):
     """Calculate how long ago something was posted"""
@@ -89,6 +205,88 @@ def get_time_ago(timestamp):
     else:
         return f"{diff // 86400} days ago"
 
+def fetch_hn_item(item_id):
+    """Fetch one Hacker News item, or None if it fails"""
+    try:
+        response = http_client.get(f"{HN_API}/item/{item_id}.json", timeout=HN_ITEM_TIMEOUT)
+        if response.status_code == 200:
+            return response.json()
+    except Exception:
+        pass
+    return None
+
+def fetch_hn_items(item_ids, max_workers=HN_WORKERS):
+    """
+    Fetch many Hacker News items in parallel.
+    
+    Returns a list in the same order as item_ids (None for items
+    that failed or didn't arrive in time), so rank order is kept.
+    A slow item never holds up the others: items run in waves of
+    max_workers, and the batch is cut off only once every wave has
+    had the worst case of HN_ITEM_TIMEOUT with the shared client's
+    retries, plus one more wave for stragglers.
+    """
+    item_ids = list(item_ids)
+    if not item_ids:
+        return []
+    
+    workers = min(max_workers, len(item_ids))
+    pool = ThreadPoolExecutor(max_workers=workers)
+    futures = [pool.submit(fetch_hn_item, item_id) for item_id in item_ids]
+    
+    # Each attempt has its own timeout, but a request may be retried; this
+    # is a backstop for stragglers, scaled so items queued behind earlier
+    # waves still get their full time including retries
+    waves = math.ceil(len(item_ids) / workers)
+    wait(futures, timeout=(waves + 1) * http_client.worst_case_time(HN_ITEM_TIMEOUT))
+    pool.shutdown(wait=False, cancel_futures=True)
+    
+    return [f.result() if f.done() and not f.cancelled() else None for f in futures]
+
+def fetch_hn_updates():
+    """Ids of items that changed recently (from updates.json), or an empty set"""
+    try:
+        response = http_client.get(f"{HN_API}/updates.json", timeout=10)
+        if response.status_code == 200:
+            return set(response.json().get('items', []))
+    except Exception:
+        pass
+    return set()
+
+def hn_item_max_age(item_id):
+    """HN_ITEM_MAX_AGE plus this item's own share of HN_ITEM_AGE_JITTER"""
+    spread = (item_id * 2654435761) % 4096 / 4096   # Stable, well mixed in [0, 1)
+    return HN_ITEM_MAX_AGE + spread * HN_ITEM_AGE_JITTER
+
+def refresh_hn_items(item_ids):
+    """
+    Items for item_ids in the same order, using the local store.
+    
+    Only ids we have never seen, ids listed in updates.json and a
+    few of the entries past their max age (see hn_item_max_age) are
+    fetched; everything else comes from disk. In steady state a
+    refresh of the top 500 costs a couple of requests plus the
+    handful of stories that changed.
+    """
+    item_ids = list(item_ids)
+    store = get_hn_store()
+    known = store.get_many(item_ids)
+    changed = fetch_hn_updates() if known else set()
+    now = time.time()
+    
+    to_fetch = [item_id for item_id in item_ids if item_id not in known or item_id in changed]
+    expired = sorted(
+        (known[item_id][1], item_id) for item_id in item_ids
+        if item_id in known and item_id not in changed
+        and now - known[item_id][1] > hn_item_max_age(item_id)
+    )
+    to_fetch += [item_id for _, item_id in expired[:HN_MAX_AGE_REFRESHES]]
+    fetched = dict(zip(to_fetch, fetch_hn_items(to_fetch)))
+    store.put_many([item for item in fetched.values() if item])
+    
+    # A failed re-fetch falls back to the stored copy
+    return [fetched.get(item_id) or known.get(item_id, (None, 0))[0] for item_id in item_ids]
+
 def fetch_hacker_news(num_stories=15):
     """
     Fetch top stories from Hacker News - tech news that's always current!
@@ -99,20 +297,17 @@ def fetch_hacker_news(num_stories=15):
     
     try:
         # Get top story IDs
-        top_url = "https://hacker-news.firebaseio.com/v0/topstories.json"
-        response = requests.get(top_url, timeout=10)
+        top_url = f"{HN_API}/topstories.json"
+        response = http_client.get(top_url, timeout=10)
         
         if response.status_code == 200:
             story_ids = response.json()[:num_stories]
             
-            for i, story_id in enumerate(story_ids, 1):
-                # Fetch each story details
-                story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                story_response = requests.get(story_url, timeout=5)
-                
-                if story_response.status_code == 200:
-                    story = story_response.json()
-                    
+            # New/changed stories are fetched at once, the rest come from disk
+            stories = refresh_hn_items(story_ids)
+            
+            for i, (story_id, story) in enumerate(zip(story_ids, stories), 1):
+                if story:
                     title = story.get('title', 'No title')
                     author = story.get('by', 'Unknown')
                     score = story.get('score', 0)
@@ -127,13 +322,89 @@ def fetch_hacker_news(num_stories=15):
                     print(f"Link: {url_link}")
                     print("-" * 70)
             
-            print(f"\n✅ Successfully fetched {len(story_ids)} current stories!")
+            fetched = sum(1 for story in stories if story)
+            print(f"\n✅ Successfully fetched {fetched} current stories!")
+            record_stories([story_from_hn(story) for story in stories if story])
         else:
             print(f"❌ Error: Status code {response.status_code}")
             
     except Exception as e:
         print(f"❌ Error: {e}")
 
+def fetch_hn_top_stories(num_stories=30):
+    """Top Hacker News stories as item dicts (quiet; raises on errors)"""
+    response = http_client.get(f"{HN_API}/topstories.json", timeout=10)
+    response.raise_for_status()
+    return [story for story in refresh_hn_items(response.json()[:num_stories]) if story]
+
+# Sources for the aggregated feed
+AGGREGATE_SUBREDDITS = ["worldnews", "news", "technology", "science"]
+
+def fetch_aggregated_news(subreddits=AGGREGATE_SUBREDDITS, per_source=25, show=20):
+    """
+    One ranked feed from several subreddits and Hacker News.
+    
+    All sources are fetched at the same time, so this takes as long
+    as the slowest one. The same story posted in several places
+    (same link, or nearly the same title) is shown once, with every
+    source listed. Returns the merged feed.
+    """
+    
+    print(f"\n🗞️ Fetching {len(subreddits)} subreddits + Hacker News at once...\n")
+    print("=" * 70)
+    
+    jobs = {f"r/{name}": (lambda name=name: [
+        story_from_reddit(post, name) for post in iter_reddit_posts(name, limit=per_source)
+    ]) for name in subreddits}
+    jobs["HN"] = lambda: [story_from_hn(item) for item in fetch_hn_top_stories(per_source)]
+    
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {name: pool.submit(job) for name, job in jobs.items()}
+    
+    sources = {}
+    for name, future in futures.items():
+        try:
+            sources[name] = future.result()
+        except Exception as e:
+            print(f"⚠️ Skipping {name}: {e}")
+    
+    feed = aggregate(sources)
+    record_stories([story for stories in sources.values() for story in stories])
+    total = sum(len(stories) for stories in sources.values())
+    
+    for i, story in enumerate(feed[:show], 1):
+        print(f"\n📰 Story {i}  [{', '.join(story['sources'])}]")
+        print(f"Title: {story['title']}")
+        print(f"Posted: {get_time_ago(story['created'])} | Score: {story['score']}↑")
+        print(f"Link: {story['url']}")
+        print(f"Comments: {story['links'][0]}")
+        print("-" * 70)
+    
+    print(f"\n✅ {total} posts from {len(sources)} sources -> {len(feed)} unique stories")
+    return feed
+
+def search_news(query, limit=10):
+    """Search every story fetched so far (ranked by relevance)"""
+    
+    index = get_news_index()
+    if index is None:
+        print("❌ Searching history needs NumPy: pip install numpy")
+        return []
+    
+    started = time.perf_counter()
+    results = index.search(query, limit)
+    took = (time.perf_counter() - started) * 1000
+    
+    print(f"\n🔎 {len(results)} result(s) for '{query}' among {len(index)} saved stories ({took:.1f} ms)")
+    print("=" * 70)
+    for i, story in enumerate(results, 1):
+        print(f"\n📰 Result {i}  [{story['source']}]")
+        print(f"Title: {story['title']}")
+        print(f"Posted: {get_time_ago(story['created'])}")
+        print(f"Link: {story['url']}")
+        print("-" * 70)
+    return results
+
 def main():
     """Main function"""
     
@@ -148,9 +419,11 @@ def main():
     print("  4. Reddit General News (r/news)")
     print("  5. Hacker News (Tech/Startup news)")
     print("  6. Custom Reddit subreddit")
+    print("  7. All sources (one combined feed)")
+    print("  8. Search saved news")
     
     try:
-        choice = input("\nEnter choice (1-6): ").strip()
+        choice = input("\nEnter choice (1-8): ").strip()
         
         if choice == "1":
             fetch_reddit_news("worldnews")
@@ -165,6 +438,11 @@ def main():
         elif choice == "6":
             custom = input("Enter subreddit name (without r/): ").strip()
             fetch_reddit_news(custom)
+        elif choice == "7":
+            fetch_aggregated_news()
+        elif choice == "8":
+            query = input("Search for: ").strip()
+            search_news(query)
         else:
             print("Invalid choice. Using r/worldnews")
             fetch_reddit_news("worldnews")
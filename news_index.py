@@ -0,0 +1,253 @@
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+from news_aggregator import STOP_WORDS, canonical_url
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Stories and the inverted index over their titles and domains
+INDEX_PATH = os.path.join(BASE_DIR, ".cache", "news_index.sqlite")
+
+# BM25 tuning (the usual defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# A term's postings are appended as small level-0 segments. Whenever its
+# newest MERGE_FACTOR segments share a level they are merged into one
+# segment a level up, so each posting is rewritten only once per level
+# (log of the number of batches) and big lists are rarely touched
+MERGE_FACTOR = 4
+
+# Domain parts that say nothing about the site
+DOMAIN_NOISE = {'www', 'm', 'com', 'org', 'net', 'co', 'uk', 'in', 'io', 'gov', 'edu'}
+
+def tokenize(text):
+    """Lowercase words without filler words"""
+    return [word for word in re.findall(r'[a-z0-9]+', (text or '').lower()) if word not in STOP_WORDS]
+
+def domain_tokens(url):
+    """'https://www.bbc.co.uk/news' -> ['bbc.co.uk', 'bbc']"""
+    host = (urlsplit(url or '').hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if not host:
+        return []
+    return [host] + [part for part in host.split('.') if part not in DOMAIN_NOISE]
+
+class NewsIndex:
+    """
+    Persistent BM25 search over every story we have fetched.
+
+    Layout (one SQLite file):
+        docs     - one row per story; its row id is the doc id
+        terms    - per term: document frequency and segment count
+        postings - per term and segment: three parallel blobs, doc ids
+                   (uint32), term counts and doc lengths (uint16), plus
+                   the segment's merge level
+
+    Each indexing batch appends one new segment per term it touches
+    (doc ids only grow, so concatenated segments stay sorted). Merges
+    are size-tiered: only the newest segments of equal level are
+    combined (see MERGE_FACTOR), so a term keeps a handful of
+    segments that shrink from oldest to newest. A search
+    reads a few rows per query term and scores everything with NumPy,
+    so it stays in the milliseconds even with millions of stories.
+    """
+
+    def __init__(self, path=INDEX_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+
+        with self._lock, self._db:
+            self._db.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS docs (
+                    id INTEGER PRIMARY KEY,
+                    key TEXT UNIQUE NOT NULL,
+                    title TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    created REAL NOT NULL,
+                    length INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS terms (
+                    term TEXT PRIMARY KEY,
+                    df INTEGER NOT NULL,
+                    segments INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL,
+                    segment INTEGER NOT NULL,
+                    doc_ids BLOB NOT NULL,
+                    tfs BLOB NOT NULL,
+                    lengths BLOB NOT NULL,
+                    level INTEGER NOT NULL DEFAULT 0,
+                    PRIMARY KEY (term, segment)
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS stats (
+                    id INTEGER PRIMARY KEY CHECK (id = 0),
+                    docs INTEGER NOT NULL,
+                    total_length INTEGER NOT NULL
+                );
+                INSERT OR IGNORE INTO stats VALUES (0, 0, 0);
+                """
+            )
+
+    def __len__(self):
+        with self._lock:
+            return self._db.execute("SELECT docs FROM stats").fetchone()[0]
+
+    def add_many(self, stories):
+        """
+        Index stories (dicts with title, url, source, created).
+        Stories already in the index (same canonical URL) are skipped.
+
+        Returns the number of new stories.
+        """
+        with self._lock, self._db:
+            postings = {}   # term -> ([doc ids], [counts], [doc lengths]) for this batch
+            added = 0
+            total_length = 0
+
+            for story in stories:
+                key = canonical_url(story['url'])
+                tokens = tokenize(story['title']) + domain_tokens(story['url'])
+                cursor = self._db.execute(
+                    "INSERT OR IGNORE INTO docs (key, title, url, source, created, length) VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, story['title'], story['url'], story['source'], story.get('created') or time.time(), len(tokens)),
+                )
+                if cursor.rowcount == 0:
+                    continue  # Already indexed
+                doc_id = cursor.lastrowid
+                added += 1
+                total_length += len(tokens)
+
+                counts = {}
+                for token in tokens:
+                    counts[token] = counts.get(token, 0) + 1
+                for term, count in counts.items():
+                    ids, tfs, lengths = postings.setdefault(term, ([], [], []))
+                    ids.append(doc_id)
+                    tfs.append(min(count, 65535))
+                    lengths.append(min(len(tokens), 65535))
+
+            # Append this batch's postings as a new segment of each term
+            segments = self._segment_counts(list(postings))
+            self._db.executemany(
+                "INSERT INTO postings VALUES (?, ?, ?, ?, ?, 0)",
+                [
+                    (term, segments.get(term, 0),
+                     np.array(ids, dtype=np.uint32).tobytes(),
+                     np.array(tfs, dtype=np.uint16).tobytes(),
+                     np.array(lengths, dtype=np.uint16).tobytes())
+                    for term, (ids, tfs, lengths) in postings.items()
+                ],
+            )
+            self._db.executemany(
+                "INSERT INTO terms VALUES (?, ?, 1) "
+                "ON CONFLICT (term) DO UPDATE SET df = df + excluded.df, segments = segments + 1",
+                [(term, len(ids)) for term, (ids, _, _) in postings.items()],
+            )
+            for term in postings:
+                if segments.get(term, 0) + 1 >= MERGE_FACTOR:
+                    self._merge_segments(term)
+
+            self._db.execute(
+                "UPDATE stats SET docs = docs + ?, total_length = total_length + ?", (added, total_length)
+            )
+        return added
+
+    def _segment_counts(self, terms):
+        """{term: number of segments} for the terms that exist"""
+        counts = {}
+        for i in range(0, len(terms), 500):
+            chunk = terms[i:i + 500]
+            counts.update(self._db.execute(
+                f"SELECT term, segments FROM terms WHERE term IN ({','.join('?' * len(chunk))})", chunk
+            ))
+        return counts
+
+    def _merge_segments(self, term):
+        """
+        Merges the term's newest segments while the last MERGE_FACTOR
+        of them share a level (inside the caller's transaction)
+        """
+        levels = [level for (level,) in self._db.execute(
+            "SELECT level FROM postings WHERE term = ? ORDER BY segment", (term,)
+        )]
+        merged_any = False
+        while len(levels) >= MERGE_FACTOR and len(set(levels[-MERGE_FACTOR:])) == 1:
+            first = len(levels) - MERGE_FACTOR
+            rows = self._db.execute(
+                "SELECT doc_ids, tfs, lengths FROM postings WHERE term = ? AND segment >= ? ORDER BY segment",
+                (term, first),
+            ).fetchall()
+            blobs = [b"".join(row[i] for row in rows) for i in range(3)]
+            self._db.execute("DELETE FROM postings WHERE term = ? AND segment >= ?", (term, first))
+            self._db.execute("INSERT INTO postings VALUES (?, ?, ?, ?, ?, ?)", (term, first, *blobs, levels[-1] + 1))
+            levels[first:] = [levels[-1] + 1]
+            merged_any = True
+        if merged_any:
+            self._db.execute("UPDATE terms SET segments = ? WHERE term = ?", (len(levels), term))
+
+    def search(self, query, limit=10):
+        """
+        Best matching stories for a keyword query, by BM25.
+
+        Returns a list of dicts: title, url, source, created, score.
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+
+        with self._lock:
+            n_docs, total_length = self._db.execute("SELECT docs, total_length FROM stats").fetchone()
+            rows = self._db.execute(
+                "SELECT t.df, p.doc_ids, p.tfs, p.lengths FROM postings p JOIN terms t ON t.term = p.term "
+                f"WHERE p.term IN ({','.join('?' * len(terms))})", terms
+            ).fetchall()
+        if not rows or not n_docs:
+            return []
+
+        avg_length = total_length / n_docs
+
+        all_ids, all_scores = [], []
+        for df, id_blob, tf_blob, length_blob in rows:
+            ids = np.frombuffer(id_blob, dtype=np.uint32)
+            tf = np.frombuffer(tf_blob, dtype=np.uint16).astype(np.float32)
+            lengths = np.frombuffer(length_blob, dtype=np.uint16).astype(np.float32)
+            idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths / avg_length)
+            all_ids.append(ids)
+            all_scores.append(idf * tf * (BM25_K1 + 1) / (tf + norm))
+
+        ids, inverse = np.unique(np.concatenate(all_ids), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(all_scores))
+
+        top = np.argpartition(-scores, min(limit, len(scores)) - 1)[:limit]
+        top = top[np.argsort(-scores[top])]
+        best = [(int(ids[i]), float(scores[i])) for i in top]
+
+        with self._lock:
+            found = {
+                row[0]: row for row in self._db.execute(
+                    f"SELECT id, title, url, source, created FROM docs WHERE id IN ({','.join('?' * len(best))})",
+                    [doc_id for doc_id, _ in best],
+                )
+            }
+        return [
+            {'title': found[doc_id][1], 'url': found[doc_id][2], 'source': found[doc_id][3],
+             'created': found[doc_id][4], 'score': score}
+            for doc_id, score in best if doc_id in found
+        ]
+
+    def close(self):
+        self._db.close()
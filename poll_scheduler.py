@@ -0,0 +1,237 @@
+# ============================================================================
+# RATE-LIMIT-AWARE POLL SCHEDULER
+# Runs a polling function on a fixed-rate grid without drifting or getting
+# banned: token bucket for the API quota, backoff with jitter on 429s
+# ============================================================================
+
+import math      # For counting missed ticks
+import random    # For backoff jitter
+import time      # For the monotonic clock and sleeping
+
+import requests  # For recognising rate-limit and timeout errors
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Backoff never waits longer than this (seconds)
+MAX_BACKOFF = 600
+
+# HTTP status codes that mean "slow down" rather than "broken request"
+THROTTLE_STATUS_CODES = {429, 503}
+
+
+def is_throttle_error(exc):
+    """True for errors that should trigger a backoff (429s, timeouts, resets)."""
+    if isinstance(exc, (requests.exceptions.Timeout, requests.exceptions.ConnectionError)):
+        return True
+    response = getattr(exc, 'response', None)
+    return response is not None and response.status_code in THROTTLE_STATUS_CODES
+
+
+def retry_after(exc):
+    """Seconds from a Retry-After header on the error's response, or None."""
+    response = getattr(exc, 'response', None)
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    try:
+        return max(0.0, float(value))
+    except (TypeError, ValueError):
+        return None  # Missing, or an HTTP date we don't bother parsing
+
+
+# ============================================================================
+# TOKEN BUCKET
+# ============================================================================
+class TokenBucket:
+    """
+    Classic token bucket sized to an upstream quota.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    reserve() always succeeds but returns how long the caller must wait
+    before its requests fit in the quota, so bursts never exceed it.
+
+    Example:
+        bucket = TokenBucket.per_minute(30)   # CoinGecko free tier
+        time.sleep(bucket.reserve(cost=3))
+    """
+
+    def __init__(self, rate, capacity, clock=time.monotonic):
+        """
+        Args:
+            rate (float): Tokens added per second
+            capacity (float): Max tokens that can pile up (burst size)
+            clock (callable): Monotonic time source, handy for tests
+        """
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self._clock = clock
+        self._updated = clock()
+
+    @classmethod
+    def per_minute(cls, calls, burst=None, clock=time.monotonic):
+        """Bucket allowing `calls` requests per minute (burst defaults to 1/6 of that)."""
+        burst = burst if burst is not None else max(1, calls // 6)
+        return cls(calls / 60.0, burst, clock)
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, cost=1):
+        """
+        Takes `cost` tokens, going into debt if needed.
+
+        Returns:
+            float: Seconds to wait before spending them (0 if available now)
+        """
+        self._refill()
+        self.tokens -= cost
+        if self.tokens >= 0:
+            return 0.0
+        return -self.tokens / self.rate
+
+
+# ============================================================================
+# POLL SCHEDULER
+# ============================================================================
+class PollStats:
+    """Counters describing how a scheduler run went."""
+
+    __slots__ = ('polls', 'ok', 'errors', 'throttled', 'skipped', 'delayed', 'delay_seconds')
+
+    def __init__(self):
+        self.polls = 0          # Polls attempted
+        self.ok = 0             # Polls that returned normally
+        self.errors = 0         # Polls that raised (any error)
+        self.throttled = 0      # ...of which 429s / timeouts that caused a backoff
+        self.skipped = 0        # Grid ticks skipped (overrun or backoff)
+        self.delayed = 0        # Polls held back by the token bucket
+        self.delay_seconds = 0.0  # Total time spent waiting for tokens
+
+    def __repr__(self):
+        return ("PollStats(polls={0.polls}, ok={0.ok}, errors={0.errors}, throttled={0.throttled}, "
+                "skipped={0.skipped}, delayed={0.delayed})".format(self))
+
+
+class PollScheduler:
+    """
+    Fixed-rate polling with quota and backoff handling.
+
+    Ticks are aligned to a grid (start, start + interval, ...), so time
+    spent fetching and printing doesn't make the interval drift. If a
+    poll overruns, or a backoff is in progress, the missed grid ticks are
+    skipped instead of being fired in a burst.
+
+    Before each poll the token bucket (if any) is asked for `cost`
+    tokens; if the quota is used up the poll is delayed, never dropped.
+
+    Throttle errors (see is_throttle_error) back off exponentially with
+    jitter, honouring Retry-After. Other errors are reported and the
+    schedule simply continues.
+
+    Example:
+        scheduler = PollScheduler(10, TokenBucket.per_minute(30))
+        scheduler.run(lambda: fetch_quotes(), cost=1)
+    """
+
+    def __init__(self, interval, bucket=None, base_backoff=None, max_backoff=MAX_BACKOFF,
+                 clock=time.monotonic, sleep=time.sleep):
+        """
+        Args:
+            interval (float): Seconds between grid ticks
+            bucket (TokenBucket): Optional quota to respect
+            base_backoff (float): First backoff delay (default: interval)
+            max_backoff (float): Cap for the backoff delay
+            clock (callable): Monotonic time source
+            sleep (callable): Sleep function (both swappable for tests)
+        """
+        if interval <= 0:
+            raise ValueError("interval must be positive")
+        self.interval = float(interval)
+        self.bucket = bucket
+        self.base_backoff = float(base_backoff if base_backoff is not None else interval)
+        self.max_backoff = float(max_backoff)
+        self.stats = PollStats()
+        self._clock = clock
+        self._sleep = sleep
+        self._failures = 0
+
+    def backoff_delay(self, exc=None):
+        """Next backoff delay: exponential with jitter, at least Retry-After."""
+        ceiling = min(self.max_backoff, self.base_backoff * 2 ** (self._failures - 1))
+        delay = random.uniform(ceiling / 2, ceiling)
+        hinted = retry_after(exc) if exc is not None else None
+        return max(delay, hinted or 0.0)
+
+    def run(self, poll, cost=1, max_polls=None, on_error=None, on_wait=None):
+        """
+        Calls poll() on the schedule until max_polls is reached (or forever).
+
+        Args:
+            poll (callable): Does one refresh; raise to report a failure
+            cost (int): API calls one poll makes (tokens taken per poll)
+            max_polls (int): Stop after this many polls (default: never)
+            on_error (callable): on_error(exc, delay) after a failed poll;
+                                 delay is the backoff (0 if none)
+            on_wait (callable): on_wait(seconds) before sleeping to the next tick
+
+        Returns:
+            PollStats: The scheduler's counters
+        """
+        next_tick = self._clock()
+
+        while max_polls is None or self.stats.polls < max_polls:
+            # ----------------------------------------------------------------
+            # WAIT FOR THE GRID TICK
+            # ----------------------------------------------------------------
+            now = self._clock()
+            if now < next_tick:
+                self._sleep(next_tick - now)
+
+            # ----------------------------------------------------------------
+            # WAIT FOR THE QUOTA
+            # ----------------------------------------------------------------
+            if self.bucket is not None:
+                wait = self.bucket.reserve(cost)
+                if wait > 0:
+                    self.stats.delayed += 1
+                    self.stats.delay_seconds += wait
+                    self._sleep(wait)
+
+            # ----------------------------------------------------------------
+            # POLL
+            # ----------------------------------------------------------------
+            resume_at = None
+            self.stats.polls += 1
+            try:
+                poll()
+                self.stats.ok += 1
+                self._failures = 0
+            except Exception as exc:
+                self.stats.errors += 1
+                delay = 0.0
+                if is_throttle_error(exc):
+                    self.stats.throttled += 1
+                    self._failures += 1
+                    delay = self.backoff_delay(exc)
+                    resume_at = self._clock() + delay
+                if on_error is not None:
+                    on_error(exc, delay)
+
+            # ----------------------------------------------------------------
+            # NEXT GRID TICK - skip any we already missed
+            # ----------------------------------------------------------------
+            next_tick += self.interval
+            earliest = max(self._clock(), resume_at or 0.0)
+            if next_tick < earliest:
+                missed = math.ceil((earliest - next_tick) / self.interval)
+                next_tick += missed * self.interval
+                self.stats.skipped += missed
+
+            if on_wait is not None and (max_polls is None or self.stats.polls < max_polls):
+                on_wait(max(0.0, next_tick - self._clock()))
+
+        return self.stats
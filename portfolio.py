@@ -0,0 +1,242 @@
+# ============================================================================
+# CRYPTO PORTFOLIO VALUATION
+# Mark-to-market value, P&L and exposure of a whole book in every currency
+# Vectorized with NumPy | Incremental revaluation on every live tick
+# ============================================================================
+
+import csv       # For loading holdings from a spreadsheet export
+
+import numpy as np  # For valuing every position at once
+
+from crypto_quotes import QuoteTable  # Column-oriented snapshots
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Currency the cost basis in the holdings file is expressed in
+BASE_CURRENCY = 'usd'
+
+# Incremental updates between full revaluations - resyncs the running
+# totals so float rounding in the += deltas cannot build up
+FULL_REVALUE_EVERY = 100
+
+
+# ============================================================================
+# PORTFOLIO
+# ============================================================================
+class Portfolio:
+    """
+    A book of holdings valued against live quotes.
+
+    Holdings are three parallel arrays (coin index, quantity, cost basis),
+    so tens of thousands of positions cost a few hundred KB. Because value
+    is linear in price, the book is also kept as total quantity per coin:
+
+        value[currency] = qty_per_coin @ prices[:, currency]
+
+    A full revaluation is one small matrix product over the coin universe,
+    no matter how many positions there are. Incremental updates only touch
+    the coins whose price changed, and every FULL_REVALUE_EVERY updates
+    the totals are recomputed from scratch. Per-position values are computed on
+    demand with one gather: qty * prices[coin_index].
+
+    Example:
+        book = Portfolio.from_csv('holdings.csv', currencies=['usd', 'inr', 'eur'])
+        book.update(fetch_quotes(book.coin_ids, book.currencies))
+        print(book.summary())
+    """
+
+    def __init__(self, coins, quantities, cost_basis, currencies=('usd', 'inr'),
+                 base_currency=BASE_CURRENCY):
+        """
+        Args:
+            coins (list): CoinGecko id of every position
+            quantities (list): Units held per position
+            cost_basis (list): Total cost per position, in base_currency
+            currencies (list): Currencies to value the book in
+            base_currency (str): Currency of cost_basis (must be in currencies)
+        """
+        self.currencies = list(dict.fromkeys(currencies))
+        if base_currency not in self.currencies:
+            self.currencies.insert(0, base_currency)
+        self.base_currency = base_currency
+
+        # Coin universe + compact position arrays
+        self.coin_ids = list(dict.fromkeys(coins))
+        columns = {coin_id: i for i, coin_id in enumerate(self.coin_ids)}
+        self._columns = columns
+        self.coin_index = np.fromiter((columns[c] for c in coins), dtype=np.int32, count=len(coins))
+        self.quantity = np.asarray(quantities, dtype=np.float64)
+        self.cost_basis = np.asarray(cost_basis, dtype=np.float64)
+
+        n_coins = len(self.coin_ids)
+        self.qty_per_coin = np.bincount(self.coin_index, weights=self.quantity, minlength=n_coins)
+        self.cost_per_coin = np.bincount(self.coin_index, weights=self.cost_basis, minlength=n_coins)
+        self.total_cost = float(self.cost_basis.sum())
+
+        # Latest known price of every coin in every currency (NaN = never seen)
+        self.prices = np.full((n_coins, len(self.currencies)), np.nan)
+        self.value = np.zeros(len(self.currencies))   # Book value per currency
+        self._updates = 0             # Incremental updates since the last full revaluation
+        self._aligned_ids = None
+        self._src_rows = self._dst_cols = None
+
+    def __len__(self):
+        return len(self.quantity)
+
+    @classmethod
+    def from_csv(cls, path, currencies=('usd', 'inr'), base_currency=BASE_CURRENCY):
+        """
+        Loads holdings from a CSV file with the columns coin, qty, cost_basis.
+
+        Example file:
+            coin,qty,cost_basis
+            bitcoin,0.5,21000
+            ethereum,4,6400
+        """
+        coins, quantities, costs = [], [], []
+        with open(path, newline='', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                coins.append(row['coin'].strip().lower())
+                quantities.append(float(row['qty']))
+                costs.append(float(row.get('cost_basis') or 0))
+        return cls(coins, quantities, costs, currencies, base_currency)
+
+    # ----------------------------------------------------------------
+    # REVALUATION
+    # ----------------------------------------------------------------
+    def _price_matrix(self, quotes):
+        """New (coins x currencies) prices from a snapshot, NaN where missing."""
+        if quotes.coin_ids != self._aligned_ids:
+            rows, cols = quotes.positions(self._columns)
+            self._src_rows = np.array(rows, dtype=np.intp)
+            self._dst_cols = np.array(cols, dtype=np.intp)
+            self._aligned_ids = list(quotes.coin_ids)
+
+        prices = np.full_like(self.prices, np.nan)
+        for j, currency in enumerate(self.currencies):
+            if quotes.has_column(currency):
+                column = np.frombuffer(quotes.column(currency), dtype=np.float64)
+                prices[self._dst_cols, j] = column[self._src_rows]
+        return prices
+
+    def revalue(self, quotes):
+        """
+        Full mark-to-market from a snapshot (coins missing from it keep
+        their last known price).
+
+        Args:
+            quotes (QuoteTable): Snapshot from fetch_quotes(coin_ids, currencies)
+        """
+        if not isinstance(quotes, QuoteTable):
+            quotes = QuoteTable.from_api(quotes, self.currencies)
+        new = self._price_matrix(quotes)
+        self.prices = np.where(np.isnan(new), self.prices, new)
+        self.value = self.qty_per_coin @ np.nan_to_num(self.prices)
+        self._updates = 0
+
+    def update(self, quotes):
+        """
+        Incremental revaluation: only coins whose price changed are touched.
+        Every FULL_REVALUE_EVERY calls the book value is recomputed in full
+        instead, dropping any rounding drift in the running totals.
+
+        Args:
+            quotes (QuoteTable): Snapshot from fetch_quotes(coin_ids, currencies)
+
+        Returns:
+            array: Change in book value per currency since the last update
+        """
+        if not isinstance(quotes, QuoteTable):
+            quotes = QuoteTable.from_api(quotes, self.currencies)
+        self._updates += 1
+        if self._updates >= FULL_REVALUE_EVERY:
+            before = self.value
+            self.revalue(quotes)
+            return self.value - before
+
+        new = self._price_matrix(quotes)
+        changed = ~np.isnan(new) & (new != self.prices)
+        rows = np.flatnonzero(changed.any(axis=1))
+        if rows.size == 0:
+            return np.zeros(len(self.currencies))
+
+        old = np.nan_to_num(self.prices[rows])
+        self.prices[rows] = np.where(changed[rows], new[rows], self.prices[rows])
+        delta = self.qty_per_coin[rows] @ (np.nan_to_num(self.prices[rows]) - old)
+        self.value += delta
+        return delta
+
+    # ----------------------------------------------------------------
+    # RESULTS
+    # ----------------------------------------------------------------
+    def fx_rates(self):
+        """
+        Base-currency -> currency rates implied by the quotes (median over
+        all coins priced in both), used to convert the cost basis.
+        """
+        base = self.prices[:, self.currencies.index(self.base_currency)]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratios = self.prices / base[:, None]
+        rates = np.full(len(self.currencies), np.nan)
+        for j in range(len(self.currencies)):
+            column = ratios[:, j]
+            column = column[np.isfinite(column)]
+            if column.size:
+                rates[j] = np.median(column)
+        return rates
+
+    def pnl(self):
+        """Unrealized P&L per currency: value - cost basis converted at fx_rates()."""
+        return self.value - self.total_cost * self.fx_rates()
+
+    def position_values(self, currency=BASE_CURRENCY):
+        """Mark-to-market value of every position (same order as the holdings)."""
+        j = self.currencies.index(currency)
+        return self.quantity * np.nan_to_num(self.prices[self.coin_index, j])
+
+    def position_pnl(self, currency=BASE_CURRENCY):
+        """Unrealized P&L of every position in one currency."""
+        j = self.currencies.index(currency)
+        return self.position_values(currency) - self.cost_basis * self.fx_rates()[j]
+
+    def exposure(self, currency=BASE_CURRENCY):
+        """
+        Value and weight of each coin in the book.
+
+        Returns:
+            tuple: (values, weights) arrays aligned with coin_ids
+        """
+        j = self.currencies.index(currency)
+        values = self.qty_per_coin * np.nan_to_num(self.prices[:, j])
+        total = values.sum()
+        weights = values / total if total else np.zeros_like(values)
+        return values, weights
+
+    def summary(self):
+        """{currency: {'value', 'cost', 'pnl', 'pnl_pct'}} for the whole book."""
+        rates = self.fx_rates()
+        result = {}
+        for j, currency in enumerate(self.currencies):
+            cost = self.total_cost * rates[j]
+            pnl = self.value[j] - cost
+            result[currency] = {
+                'value': float(self.value[j]),
+                'cost': float(cost),
+                'pnl': float(pnl),
+                'pnl_pct': float(pnl / cost * 100) if cost else float('nan'),
+            }
+        return result
+
+    def summary_lines(self, top=5):
+        """Text rows for the live board: book value, P&L and biggest exposures."""
+        lines = ["💼 PORTFOLIO:"]
+        for currency, stats in self.summary().items():
+            sign = "+" if stats['pnl'] >= 0 else ""
+            lines.append(f"   {currency.upper():>4}: {stats['value']:>20,.2f} | "
+                         f"P&L {sign}{stats['pnl']:,.2f} ({sign}{stats['pnl_pct']:.2f}%)")
+        values, weights = self.exposure(self.base_currency)
+        for i in np.argsort(values)[::-1][:top]:
+            if values[i] > 0:
+                lines.append(f"   • {self.coin_ids[i]}: {weights[i] * 100:.1f}% of book")
+        return lines
@@ -0,0 +1,73 @@
+import queue
+import threading
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+# Results kept ready ahead of the user
+PREFETCH_SIZE = 2
+
+# How often a blocked producer checks whether it should stop (seconds)
+STOP_CHECK_INTERVAL = 0.5
+
+
+# -----------------------------
+# BACKGROUND PREFETCH QUEUE
+# -----------------------------
+class _Failed:
+    """Queue marker for a produce() call that raised."""
+
+    def __init__(self, exc: Exception):
+        self.exc = exc
+
+
+class Prefetcher:
+    """
+    Calls `produce()` on a background thread and keeps up to `size`
+    results waiting in a queue, so `get()` usually returns at once
+    while the next result is being fetched.
+
+    If produce() raises, get() raises the same exception in its turn
+    (and the producer pauses briefly before trying again). The thread
+    is a daemon and stops after `close()`.
+    """
+
+    def __init__(self, produce, size: int = PREFETCH_SIZE):
+        self._produce = produce
+        self._queue = queue.Queue(maxsize=size)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                item = self._produce()
+            except Exception as exc:
+                item = _Failed(exc)
+            while not self._stop.is_set():
+                try:
+                    self._queue.put(item, timeout=STOP_CHECK_INTERVAL)
+                    break
+                except queue.Full:
+                    pass
+            if isinstance(item, _Failed):
+                self._stop.wait(STOP_CHECK_INTERVAL)  # Don't spin on a broken source
+
+    def ready(self) -> bool:
+        """True if get() will not have to wait."""
+        return not self._queue.empty()
+
+    def get(self):
+        """
+        The next result, waiting for the producer if none is ready.
+        Raises the exception if producing it failed.
+        """
+        item = self._queue.get()
+        if isinstance(item, _Failed):
+            raise item.exc
+        return item
+
+    def close(self):
+        self._stop.set()
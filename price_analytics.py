@@ -0,0 +1,214 @@
+# ============================================================================
+# ROLLING PRICE ANALYTICS
+# Incremental EMA, rolling volatility and windowed min/max for every coin
+# O(1) work per tick | Vectorized across all coins with NumPy | One core
+# ============================================================================
+
+import numpy as np  # For doing the math on every coin at once
+
+from crypto_quotes import QuoteTable  # Column-oriented snapshots
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Number of ticks in the rolling window (stddev, min, max)
+DEFAULT_WINDOW = 30
+
+# EMA span in ticks - alpha = 2 / (span + 1), like pandas' ewm(span=...)
+DEFAULT_EMA_SPAN = 20
+
+
+# ============================================================================
+# ROLLING ANALYTICS
+# ============================================================================
+class RollingAnalytics:
+    """
+    Streaming statistics over the last `window` ticks of one price field.
+
+    Every update is a handful of NumPy operations over arrays of shape
+    (num_coins,), so the cost per tick does not grow with the window:
+
+        - EMA: classic recursive update
+        - Mean / stddev: running sum and sum of squares over a ring buffer
+        - Min / max: van Herk/Gil-Werman - the stream is cut into blocks of
+          `window` ticks; the max of the current window is the max of the
+          running max of the current block and the suffix max of the
+          previous block. The suffix arrays (and exact sums, to stop
+          floating point drift) are rebuilt once per block, so that work
+          is amortized O(1) per tick.
+
+    Coins missing from a snapshot keep their last known value. Statistics
+    for a coin that has never been seen are NaN.
+
+    Example:
+        analytics = RollingAnalytics(DEFAULT_COIN_IDS, window=30)
+        analytics.update_snapshot(fetch_quotes())
+        print(analytics.summary('bitcoin'))
+    """
+
+    def __init__(self, coin_ids, window=DEFAULT_WINDOW, ema_span=DEFAULT_EMA_SPAN, field='usd'):
+        """
+        Args:
+            coin_ids (list): Coin universe, fixes the column order
+            window (int): Ticks in the rolling window
+            ema_span (int): EMA span in ticks
+            field (str): Snapshot key to track (e.g. 'usd', 'inr')
+        """
+        if window < 1:
+            raise ValueError("window must be at least 1")
+
+        self.coin_ids = list(dict.fromkeys(coin_ids))
+        self.window = int(window)
+        self.alpha = 2.0 / (ema_span + 1)
+        self.field = field
+        self.ticks = 0
+
+        n = len(self.coin_ids)
+        self._columns = {coin_id: i for i, coin_id in enumerate(self.coin_ids)}
+        self._aligned_ids = None  # Row order of the last snapshot seen
+        self._src_rows = self._dst_cols = None
+
+        # Ring buffer of the last `window` values (NaN = not seen yet)
+        self._buf = np.full((self.window, n), np.nan)
+        self._last = np.full(n, np.nan)
+        self._filled = np.zeros(n, dtype=np.int64)
+
+        self._sum = np.zeros(n)
+        self._sumsq = np.zeros(n)
+        self.ema = np.full(n, np.nan)
+
+        # Running min/max of the current block, suffix min/max of the last one
+        self._prefix_min = np.full(n, np.nan)
+        self._prefix_max = np.full(n, np.nan)
+        self._suffix_min = np.full((self.window, n), np.nan)
+        self._suffix_max = np.full((self.window, n), np.nan)
+
+        self.min = np.full(n, np.nan)
+        self.max = np.full(n, np.nan)
+
+    # ----------------------------------------------------------------
+    # UPDATING
+    # ----------------------------------------------------------------
+    def update_snapshot(self, quotes):
+        """
+        Feeds one snapshot as returned by fetch_quotes().
+
+        Args:
+            quotes (QuoteTable): Snapshot (a raw {coin_id: {field: value}}
+                                 dict also works)
+        """
+        if not isinstance(quotes, QuoteTable):
+            quotes = QuoteTable.from_api(quotes)
+        if quotes.coin_ids != self._aligned_ids:
+            rows, cols = quotes.positions(self._columns)
+            self._src_rows = np.array(rows, dtype=np.intp)
+            self._dst_cols = np.array(cols, dtype=np.intp)
+            self._aligned_ids = list(quotes.coin_ids)
+
+        values = np.full(len(self.coin_ids), np.nan)
+        if quotes.has_column(self.field):
+            column = np.frombuffer(quotes.column(self.field), dtype=np.float64)
+            values[self._dst_cols] = column[self._src_rows]
+        self.update(values)
+
+    def update(self, values):
+        """
+        Feeds one tick of values aligned with coin_ids.
+
+        Args:
+            values (array): Shape (num_coins,), NaN for "no new value"
+        """
+        values = np.asarray(values, dtype=np.float64)
+        x = np.where(np.isnan(values), self._last, values)  # Carry forward
+        self._last = x
+        valid = ~np.isnan(x)
+        x0 = np.where(valid, x, 0.0)
+
+        pos = self.ticks % self.window
+
+        # ----------------------------------------------------------------
+        # BLOCK BOUNDARY - amortized O(window) work once every `window` ticks
+        # ----------------------------------------------------------------
+        if pos == 0 and self.ticks > 0:
+            buf = self._buf
+            self._suffix_max = np.fmax.accumulate(buf[::-1], axis=0)[::-1]
+            self._suffix_min = np.fmin.accumulate(buf[::-1], axis=0)[::-1]
+            self._prefix_max = np.full_like(self._prefix_max, np.nan)
+            self._prefix_min = np.full_like(self._prefix_min, np.nan)
+
+            # Recompute the sums exactly so float errors never pile up
+            filled = np.nan_to_num(buf)
+            self._sum = filled.sum(axis=0)
+            self._sumsq = (filled * filled).sum(axis=0)
+
+        # ----------------------------------------------------------------
+        # RING BUFFER + RUNNING SUMS
+        # ----------------------------------------------------------------
+        old = np.nan_to_num(self._buf[pos])  # Zero until the buffer wraps
+        self._sum += x0 - old
+        self._sumsq += x0 * x0 - old * old
+        self._buf[pos] = x
+        self._filled = np.minimum(self._filled + valid, self.window)
+
+        # ----------------------------------------------------------------
+        # EMA
+        # ----------------------------------------------------------------
+        self.ema = np.where(np.isnan(self.ema), x, self.ema + self.alpha * (x - self.ema))
+
+        # ----------------------------------------------------------------
+        # WINDOWED MIN / MAX (fmin/fmax skip NaN)
+        # ----------------------------------------------------------------
+        self._prefix_max = np.fmax(self._prefix_max, x)
+        self._prefix_min = np.fmin(self._prefix_min, x)
+        if pos + 1 < self.window:
+            self.max = np.fmax(self._prefix_max, self._suffix_max[pos + 1])
+            self.min = np.fmin(self._prefix_min, self._suffix_min[pos + 1])
+        else:
+            self.max = self._prefix_max
+            self.min = self._prefix_min
+
+        self.ticks += 1
+
+    # ----------------------------------------------------------------
+    # READING
+    # ----------------------------------------------------------------
+    @property
+    def mean(self):
+        """Rolling mean per coin (NaN for coins never seen)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return np.where(self._filled > 0, self._sum / self._filled, np.nan)
+
+    @property
+    def std(self):
+        """Rolling population stddev per coin (NaN for coins never seen)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = self._sum / self._filled
+            var = np.maximum(self._sumsq / self._filled - mean * mean, 0.0)
+            return np.where(self._filled > 0, np.sqrt(var), np.nan)
+
+    @property
+    def volatility(self):
+        """Rolling stddev as a percentage of the rolling mean."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return self.std / self.mean * 100
+
+    def summary(self, coin_id):
+        """
+        Returns the current statistics for one coin.
+
+        Args:
+            coin_id (str): CoinGecko id
+
+        Returns:
+            dict: last, ema, mean, std, volatility (%), min and max
+        """
+        i = self._columns[coin_id]
+        return {
+            'last': float(self._last[i]),
+            'ema': float(self.ema[i]),
+            'mean': float(self.mean[i]),
+            'std': float(self.std[i]),
+            'volatility': float(self.volatility[i]),
+            'min': float(self.min[i]),
+            'max': float(self.max[i]),
+        }
@@ -0,0 +1,332 @@
+# ============================================================================
+# CRYPTO PRICE HISTORY STORE
+# Append-only, array-backed storage for every live_tracker snapshot
+# One memory-mapped file on disk | No Python dict per tick | Fast range reads
+# ============================================================================
+
+import json      # For the small metadata file next to the data files
+import os        # For building file paths and creating folders
+
+import numpy as np  # For the fixed-width, memory-mapped arrays
+
+from crypto_quotes import QuoteTable  # Column-oriented snapshots
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+# Default folder for the history files (created on first use)
+HISTORY_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "price_history")
+
+# Number of ticks to reserve timestamp space for when a store is created.
+# The timestamp file doubles in size whenever it fills up.
+INITIAL_CAPACITY = 4096
+
+# Ticks per time block. A sealed block stores each coin's values next to
+# each other, so one coin's window is a few contiguous runs of
+# BLOCK_TICKS values (1024 ticks = ~3 hours of 10-second ticks)
+BLOCK_TICKS = 1024
+
+# Snapshot fields stored for every coin, mapped to the API response keys
+FIELDS = {
+    'usd': 'usd',                   # Price in US Dollars
+    'inr': 'inr',                   # Price in Indian Rupees
+    'change': 'usd_24h_change',     # 24hr percentage change
+    'market_cap': 'usd_market_cap', # Total market value
+}
+
+# Storage type per field: prices stay float64 for precision,
+# percentages and market caps fit in float32
+FIELD_TYPES = {'usd': '<f8', 'inr': '<f8', 'change': '<f4', 'market_cap': '<f4'}
+
+
+def _row_dtype(num_coins):
+    """
+    Builds the record for one tick of the open block: one value per coin
+    for each field. Recent ticks are written row by row so an append only
+    touches a few pages.
+    """
+    return np.dtype([(name, FIELD_TYPES[name], (num_coins,)) for name in FIELDS])
+
+
+def _block_dtype(num_coins, block_ticks):
+    """
+    Builds the record for one sealed time block: per field a
+    (coins, block_ticks) array, so each coin's run of values is contiguous.
+    """
+    return np.dtype([(name, FIELD_TYPES[name], (num_coins, block_ticks)) for name in FIELDS])
+
+
+# ============================================================================
+# PRICE HISTORY STORE
+# ============================================================================
+class PriceHistory:
+    """
+    Append-only columnar store of price snapshots, backed by np.memmap.
+
+    Layout on disk:
+        meta.json   - coin universe, timestamp capacity and block size
+        ts.dat      - one float64 timestamp per tick
+        blocks.dat  - sealed time blocks, coin-major (see _block_dtype)
+        tail.dat    - the open block, one row per tick (see _row_dtype)
+
+    New ticks go into the tail row by row; when BLOCK_TICKS of them have
+    been collected the tail is transposed into a sealed block. Reading one
+    coin's week of 10-second ticks therefore touches ~60 contiguous runs
+    per field instead of a few bytes in every one of 60,000 records.
+    Only the pages you actually read are loaded into RAM.
+
+    The coin universe is fixed when the store is created; coins missing from
+    a snapshot are stored as NaN and unknown coins are ignored.
+
+    Example:
+        history = PriceHistory(coin_ids=DEFAULT_COIN_IDS)
+        history.append(fetch_quotes())
+        btc = history.read('bitcoin', start=time.time() - 3600)
+    """
+
+    def __init__(self, path=HISTORY_DIR, coin_ids=None, capacity=INITIAL_CAPACITY):
+        """
+        Opens the store at path, creating it if it doesn't exist yet.
+
+        Args:
+            path (str): Folder holding meta.json and the data files
+            coin_ids (list): Coin universe - required when creating a store,
+                             ignored when opening an existing one
+            capacity (int): Ticks to reserve timestamp space for in a new store
+        """
+        self.path = path
+        self._meta_path = os.path.join(path, "meta.json")
+        self._ts_path = os.path.join(path, "ts.dat")
+        self._blocks_path = os.path.join(path, "blocks.dat")
+        self._tail_path = os.path.join(path, "tail.dat")
+
+        if os.path.exists(self._meta_path):
+            with open(self._meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+            self.coin_ids = meta['coins']
+            self.capacity = meta['capacity']
+            self.block_ticks = meta['block_ticks']
+            self.sealed = meta['sealed']
+        else:
+            if not coin_ids:
+                raise ValueError("coin_ids is required to create a new price history")
+            os.makedirs(path, exist_ok=True)
+            self.coin_ids = list(dict.fromkeys(coin_ids))
+            self.capacity = max(1, int(capacity))
+            self.block_ticks = BLOCK_TICKS
+            self.sealed = 0
+            self._write_meta()
+
+        # Coin id -> column number, built once so appends are dict lookups only
+        self._columns = {coin_id: i for i, coin_id in enumerate(self.coin_ids)}
+        self._aligned_ids = None  # Row order of the last snapshot appended
+        self._src_rows = self._dst_cols = None
+        self.row_dtype = _row_dtype(len(self.coin_ids))
+        self.block_dtype = _block_dtype(len(self.coin_ids), self.block_ticks)
+        self._open()
+
+        # A tick only counts once its timestamp is written (written last),
+        # so a crash mid-append never leaves a half-written row behind
+        written = self._ts > 0
+        self.count = int(np.argmin(written)) if not written.all() else self.capacity
+
+    # ----------------------------------------------------------------
+    # FILE HANDLING
+    # ----------------------------------------------------------------
+    def _write_meta(self):
+        with open(self._meta_path, "w", encoding="utf-8") as f:
+            json.dump({'coins': self.coin_ids, 'capacity': self.capacity,
+                       'block_ticks': self.block_ticks, 'sealed': self.sealed}, f)
+
+    @staticmethod
+    def _reserve(path, size):
+        """Makes sure a data file is at least size bytes (new bytes read as zeros)."""
+        with open(path, "ab") as f:
+            if f.tell() < size:
+                f.truncate(size)
+
+    def _open(self):
+        """Maps the data files, growing them to the current capacity if needed."""
+        self._reserve(self._ts_path, self.capacity * 8)
+        self._ts = np.memmap(self._ts_path, dtype='<f8', mode="r+", shape=(self.capacity,))
+
+        self._reserve(self._tail_path, self.block_ticks * self.row_dtype.itemsize)
+        self._tail = np.memmap(self._tail_path, dtype=self.row_dtype, mode="r+", shape=(self.block_ticks,))
+
+        self._map_blocks(self.sealed)
+
+    def _map_blocks(self, blocks):
+        self._blocks = None
+        if blocks:
+            self._reserve(self._blocks_path, blocks * self.block_dtype.itemsize)
+            self._blocks = np.memmap(self._blocks_path, dtype=self.block_dtype, mode="r+",
+                                     shape=(blocks,))
+
+    def _grow(self):
+        """Doubles the capacity of the timestamp file."""
+        self._ts.flush()
+        del self._ts
+        self.capacity *= 2
+        self._reserve(self._ts_path, self.capacity * 8)
+        self._ts = np.memmap(self._ts_path, dtype='<f8', mode="r+", shape=(self.capacity,))
+        self._write_meta()
+
+    def _seal(self):
+        """
+        Copies the full tail into a new coin-major block.
+
+        The block only counts once it is flushed and recorded in meta.json,
+        and the tail is reused after that, so after a crash the ticks are
+        either still in the tail or safely sealed.
+        """
+        self._map_blocks(self.sealed + 1)
+        for name in FIELDS:
+            self._blocks[name][self.sealed] = self._tail[name].T
+        self._blocks.flush()
+        self.sealed += 1
+        self._write_meta()
+
+    def flush(self):
+        """Writes pending changes to disk."""
+        self._tail.flush()
+        self._ts.flush()
+
+    def __len__(self):
+        return self.count
+
+    # ----------------------------------------------------------------
+    # WRITING
+    # ----------------------------------------------------------------
+    def _align(self, quotes):
+        """
+        Maps snapshot rows to store columns as two index arrays.
+
+        Snapshots from the same coin list share the mapping, so it is only
+        rebuilt when the list changes.
+        """
+        if quotes.coin_ids != self._aligned_ids:
+            rows, cols = quotes.positions(self._columns)
+            self._src_rows = np.array(rows, dtype=np.intp)
+            self._dst_cols = np.array(cols, dtype=np.intp)
+            self._aligned_ids = list(quotes.coin_ids)
+        return self._src_rows, self._dst_cols
+
+    def _append_row(self, ts, values):
+        """Writes one tick ({field: per-coin array}) after the last one."""
+        if self.count and self.count % self.block_ticks == 0 and self.sealed < self.count // self.block_ticks:
+            self._seal()
+        if self.count == self.capacity:
+            self._grow()
+
+        slot = self.count % self.block_ticks
+        for name in FIELDS:
+            self._tail[name][slot] = values[name]
+        self._ts[self.count] = ts  # Written last - marks the row as complete
+        self.count += 1
+
+    def append(self, quotes, ts=None):
+        """
+        Stores one snapshot as a new tick.
+
+        Args:
+            quotes (QuoteTable): Snapshot from fetch_quotes() (a raw
+                                 {coin_id: {field: value}} dict also works)
+            ts (float): Unix timestamp of the tick (default: the
+                        snapshot's own timestamp)
+
+        Raises:
+            ValueError: If ts is older than the last stored tick
+        """
+        if not isinstance(quotes, QuoteTable):
+            quotes = QuoteTable.from_api(quotes)
+        ts = quotes.ts if ts is None else float(ts)
+        if self.count and ts < self._ts[self.count - 1]:
+            raise ValueError("ticks must be appended in time order")
+
+        # Scatter each snapshot column into its store columns - no per-coin loop
+        src_rows, dst_cols = self._align(quotes)
+        values = {}
+        for name, key in FIELDS.items():
+            values[name] = np.full(len(self.coin_ids), np.nan)
+            if quotes.has_column(key):
+                column = np.frombuffer(quotes.column(key), dtype=np.float64)
+                values[name][dst_cols] = column[src_rows]
+        self._append_row(ts, values)
+
+    # ----------------------------------------------------------------
+    # READING
+    # ----------------------------------------------------------------
+    def _window(self, start, end):
+        """Returns the [lo, hi) row range for a time window (binary search)."""
+        ts = self._ts[:self.count]
+        lo = 0 if start is None else int(np.searchsorted(ts, start, side='left'))
+        hi = self.count if end is None else int(np.searchsorted(ts, end, side='right'))
+        return lo, hi
+
+    def _runs(self, lo, hi):
+        """
+        Splits the row range [lo, hi) into (block, first, last) runs;
+        block is None for rows still in the tail.
+        """
+        size = self.block_ticks
+        sealed_end = self.sealed * size
+        runs = []
+        for first in range(lo - lo % size, min(hi, sealed_end), size):
+            block = first // size
+            runs.append((block, max(lo, first) - first, min(hi, first + size) - first))
+        if hi > sealed_end:
+            runs.append((None, max(lo, sealed_end) - sealed_end, hi - sealed_end))
+        return runs
+
+    def read(self, coin_id, start=None, end=None):
+        """
+        Reads one coin's history in a time window.
+
+        Args:
+            coin_id (str): CoinGecko id
+            start (float): Earliest unix timestamp to include (default: first)
+            end (float): Latest unix timestamp to include (default: last)
+
+        Returns:
+            dict: {'ts': array, 'usd': array, 'inr': array,
+                   'change': array, 'market_cap': array}
+
+        Raises:
+            KeyError: If coin_id is not part of this store's universe
+        """
+        column = self._columns[coin_id]
+        lo, hi = self._window(start, end)
+        runs = self._runs(lo, hi)
+        result = {'ts': np.array(self._ts[lo:hi])}
+        for name in FIELDS:
+            parts = [self._tail[name][first:last, column] if block is None
+                     else self._blocks[name][block, column, first:last]   # Contiguous run
+                     for block, first, last in runs]
+            result[name] = np.concatenate(parts) if parts else np.empty(0, dtype=FIELD_TYPES[name])
+        return result
+
+    def read_window(self, start=None, end=None, coin_ids=None):
+        """
+        Reads every (or selected) coin in a time window.
+
+        Args:
+            start (float): Earliest unix timestamp to include
+            end (float): Latest unix timestamp to include
+            coin_ids (list): Coins to include (default: whole universe)
+
+        Returns:
+            dict: {'ts': (ticks,) array, field: (ticks, coins) array}
+        """
+        lo, hi = self._window(start, end)
+        runs = self._runs(lo, hi)
+        columns = (slice(None) if coin_ids is None
+                   else [self._columns[coin_id] for coin_id in coin_ids])
+        width = len(self.coin_ids) if coin_ids is None else len(coin_ids)
+        result = {'ts': np.array(self._ts[lo:hi])}
+        for name in FIELDS:
+            parts = [self._tail[name][first:last][:, columns] if block is None
+                     else self._blocks[name][block][columns, first:last].T
+                     for block, first, last in runs]
+            result[name] = (np.concatenate(parts) if parts
+                            else np.empty((0, width), dtype=FIELD_TYPES[name]))
+        return result
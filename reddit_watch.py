@@ -0,0 +1,211 @@
+import argparse
+import hashlib
+import heapq
+import math
+import time
+from datetime import datetime
+
+from news_aggregator import story_from_reddit
+from news_fetcher import fetch_reddit_page, record_stories
+from poll_scheduler import MAX_BACKOFF, TokenBucket, is_throttle_error, retry_after
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+# Seconds between polls of a subreddit unless configured otherwise
+DEFAULT_INTERVAL = 120
+
+# Requests per minute we allow ourselves against Reddit's public JSON API
+REDDIT_REQUESTS_PER_MINUTE = 10
+
+# Newest posts read per poll
+NEW_PAGE_SIZE = 25
+
+# Seen-post filter: posts per generation and target false-positive rate.
+# Two generations are kept, so a post is remembered for at least this
+# many newer posts and memory never grows
+SEEN_CAPACITY = 50_000
+SEEN_ERROR_RATE = 0.001
+
+
+# -----------------------------
+# ROTATING BLOOM FILTER
+# -----------------------------
+class BloomFilter:
+    """Fixed-size set of strings with a small false-positive rate."""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class RotatingBloomFilter:
+    """
+    "Have we seen this post?" with flat memory.
+
+    Keys go into the current filter; lookups check the current and
+    the previous one. When the current filter is full it becomes the
+    previous one and a fresh filter takes over, so old posts are
+    forgotten only after `capacity` newer ones.
+    """
+
+    def __init__(self, capacity: int = SEEN_CAPACITY, error_rate: float = SEEN_ERROR_RATE):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.current = BloomFilter(capacity, error_rate)
+        self.previous = None
+
+    def add(self, key: str):
+        if self.current.count >= self.capacity:
+            self.previous = self.current
+            self.current = BloomFilter(self.capacity, self.error_rate)
+        self.current.add(key)
+
+    def __contains__(self, key: str):
+        return key in self.current or (self.previous is not None and key in self.previous)
+
+    def memory_bytes(self) -> int:
+        return len(self.current.bits) * 2
+
+
+# -----------------------------
+# MULTI-SUBREDDIT WATCHER
+# -----------------------------
+class RedditWatcher:
+    """
+    Polls many subreddits' /new listings, each on its own interval,
+    and reports only posts it has not seen before.
+
+    Polls come off a heap ordered by due time. First polls are spread
+    evenly over the shortest interval, and every request also takes a
+    token from a shared bucket, so many subreddits never burst against
+    the rate limit. A throttled subreddit backs off on its own.
+    """
+
+    def __init__(self, intervals: dict, bucket=None, seen=None, announce_existing: bool = False,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.intervals = dict(intervals)
+        self.bucket = bucket or TokenBucket.per_minute(REDDIT_REQUESTS_PER_MINUTE, burst=1, clock=clock)
+        self.seen = seen or RotatingBloomFilter()
+        self.announce_existing = announce_existing
+        self._clock = clock
+        self._sleep = sleep
+        self._failures = {name: 0 for name in self.intervals}
+        self._primed = set()
+
+        # Stagger the first polls across the shortest interval
+        now = clock()
+        spacing = min(self.intervals.values(), default=0) / max(len(self.intervals), 1)
+        self._queue = [(now + i * spacing, name) for i, name in enumerate(self.intervals)]
+        heapq.heapify(self._queue)
+
+    def poll(self, subreddit: str):
+        """Fetches the newest posts once; returns the ones not seen before."""
+        posts, _ = fetch_reddit_page(subreddit, listing="new", limit=NEW_PAGE_SIZE)
+        fresh = []
+        for post in reversed(posts):  # Oldest first
+            key = post.get("name") or post.get("id", "")
+            if key and key not in self.seen:
+                self.seen.add(key)
+                fresh.append(post)
+
+        if subreddit not in self._primed:
+            # First look: remember what's already there without announcing it
+            self._primed.add(subreddit)
+            if not self.announce_existing:
+                print(f"👀 Watching r/{subreddit} every {self.intervals[subreddit]:g}s "
+                      f"({len(fresh)} existing posts skipped)")
+                return []
+        return fresh
+
+    def report(self, subreddit: str, posts):
+        now = datetime.now().strftime("%H:%M:%S")
+        for post in posts:
+            print(f"[{now}] r/{subreddit:<15} {post.get('title', 'No title')}")
+            print(f"{'':>29}https://www.reddit.com{post.get('permalink', '')}")
+        record_stories([story_from_reddit(post, subreddit) for post in posts])
+
+    def run(self, max_polls: int = None):
+        """Runs the schedule until max_polls polls have been made (or forever)."""
+        polls = 0
+        while self._queue and (max_polls is None or polls < max_polls):
+            due, subreddit = heapq.heappop(self._queue)
+            now = self._clock()
+            if due > now:
+                self._sleep(due - now)
+            wait = self.bucket.reserve(1)
+            if wait > 0:
+                self._sleep(wait)
+
+            interval = self.intervals[subreddit]
+            polls += 1
+            try:
+                self.report(subreddit, self.poll(subreddit))
+                self._failures[subreddit] = 0
+                next_due = due + interval
+            except Exception as exc:
+                delay = interval
+                if is_throttle_error(exc):
+                    self._failures[subreddit] += 1
+                    delay = min(MAX_BACKOFF, interval * 2 ** self._failures[subreddit])
+                    delay = max(delay, retry_after(exc) or 0)
+                print(f"❌ r/{subreddit}: {exc} (next try in {delay:.0f}s)")
+                next_due = self._clock() + delay
+
+            # Skip slots we fell behind on instead of polling twice in a row
+            now = self._clock()
+            if next_due < now:
+                next_due += math.ceil((now - next_due) / interval) * interval
+            heapq.heappush(self._queue, (next_due, subreddit))
+        return polls
+
+
+def parse_watch_list(items, default_interval: float = DEFAULT_INTERVAL):
+    """['worldnews=60', 'science'] -> {'worldnews': 60.0, 'science': 120.0}"""
+    intervals = {}
+    for item in items:
+        name, _, seconds = item.partition("=")
+        name = name.strip().removeprefix("r/")
+        if name:
+            intervals[name] = float(seconds) if seconds else float(default_interval)
+    return intervals
+
+
+# -----------------------------
+# MAIN PROGRAM
+# -----------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Watch subreddits for new posts")
+    parser.add_argument("subreddits", nargs="*", default=["worldnews", "news", "technology", "science"],
+                        help="names, optionally with an interval in seconds: worldnews=60")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL, help="default seconds between polls")
+    parser.add_argument("--announce-existing", action="store_true", help="also print posts found on the first poll")
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("📡 REDDIT WATCH - new posts only (Ctrl+C to stop)")
+    print("=" * 70)
+
+    watcher = RedditWatcher(parse_watch_list(args.subreddits, args.interval),
+                            announce_existing=args.announce_existing)
+    try:
+        watcher.run()
+    except KeyboardInterrupt:
+        print("\n👋 Watch stopped.")
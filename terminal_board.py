@@ -0,0 +1,113 @@
+# ============================================================================
+# DIFF-BASED TERMINAL RENDERER
+# Redraws only the rows of a text board that changed since the last frame
+# One buffered write per frame | ANSI cursor addressing | Plain output if piped
+# ============================================================================
+
+import os        # For enabling ANSI escape codes on Windows
+import shutil    # For the terminal height
+import sys       # For stdout
+
+# ANSI escape sequences
+CLEAR_SCREEN = "\x1b[2J\x1b[H"   # Clear everything, cursor to top-left
+CLEAR_TO_EOL = "\x1b[K"          # Erase from the cursor to end of line
+CLEAR_BELOW = "\x1b[J"           # Erase from the cursor to end of screen
+
+
+def _move_to(row):
+    """Cursor to the start of a 1-based screen row."""
+    return f"\x1b[{row};1H"
+
+
+class BoardRenderer:
+    """
+    Renders whole frames (lists of lines) to a terminal efficiently.
+
+    On a TTY the first frame clears the screen and draws everything; each
+    later frame rewrites only the rows whose text changed, using cursor
+    addressing, and everything goes out in a single write. When the output
+    is not a TTY (piped to a file, CI logs...) each frame is written plainly
+    in one go, so logs stay readable.
+
+    Frames taller than the terminal are cut to fit, with a final row saying
+    how many rows are hidden - rows that scrolled away can't be redrawn.
+    Put the rows that must stay visible (alerts, totals) at the top.
+
+    Example:
+        renderer = BoardRenderer()
+        renderer.render(["PRICES", "BTC  $70,000.00"])
+        renderer.render(["PRICES", "BTC  $70,100.00"])  # Rewrites one row
+        renderer.status("Refreshing in 10 seconds...")
+    """
+
+    def __init__(self, stream=None, diff=None):
+        """
+        Args:
+            stream: File-like object to write to (default: sys.stdout)
+            diff (bool): Force diff mode on/off (default: on when stream is a TTY)
+        """
+        self.stream = stream or sys.stdout
+        if diff is None:
+            isatty = getattr(self.stream, 'isatty', None)
+            diff = bool(isatty and isatty())
+        self.diff = diff
+        self._previous = None   # Lines currently on screen (None = nothing drawn)
+        self._status_row = 1
+
+        if self.diff and os.name == 'nt':
+            os.system('')  # Turns on ANSI escape handling in the Windows console
+
+    def _fit(self, lines):
+        """Cuts a frame to the terminal height (keeping one row for status)."""
+        height = shutil.get_terminal_size().lines - 1
+        if len(lines) <= height:
+            return lines
+        hidden = len(lines) - (height - 1)
+        return lines[:height - 1] + [f"... {hidden} more rows (enlarge the terminal to see them)"]
+
+    def render(self, lines):
+        """
+        Draws one frame.
+
+        Args:
+            lines (list): Text rows of the frame, without newlines
+        """
+        if not self.diff:
+            self.stream.write("\n".join(lines) + "\n")
+            self.stream.flush()
+            return
+
+        lines = self._fit(lines)
+        out = []
+
+        if self._previous is None:
+            out.append(CLEAR_SCREEN)
+            out.append("\n".join(lines))
+        else:
+            previous = self._previous
+            for row, line in enumerate(lines):
+                if row >= len(previous) or previous[row] != line:
+                    out.append(_move_to(row + 1) + line + CLEAR_TO_EOL)
+            if len(lines) < len(previous):
+                # The board got shorter - wipe the leftover rows
+                out.append(_move_to(len(lines) + 1) + CLEAR_BELOW)
+
+        self._previous = lines
+        self._status_row = len(lines) + 1
+        out.append(_move_to(self._status_row))
+
+        self.stream.write("".join(out))
+        self.stream.flush()
+
+    def status(self, text):
+        """
+        Shows a message below the board (countdown, errors...).
+
+        On a TTY it replaces the previous message in place; otherwise it is
+        written as normal lines.
+        """
+        if not self.diff:
+            self.stream.write(text + "\n")
+        else:
+            self.stream.write(_move_to(self._status_row) + CLEAR_BELOW + text)
+        self.stream.flush()
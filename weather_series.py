@@ -0,0 +1,141 @@
+import time
+from datetime import datetime
+
+import numpy as np
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+# How far ahead "feels like" alerts look
+ALERT_HOURS = 48
+
+# Heat index bands (°C), after the US NWS heat index chart
+HEAT_INDEX_CAUTION_C = 32   # Extreme caution: heat cramps / exhaustion possible
+HEAT_INDEX_DANGER_C = 41    # Danger: heat exhaustion likely
+
+# Dew point above which the air feels oppressively humid (°C)
+MUGGY_DEW_POINT_C = 24
+
+
+# -----------------------------
+# VECTORIZED DERIVED METRICS
+# -----------------------------
+def heat_index_c(temp_c, rh):
+    """
+    Heat index ("feels like" in humid heat) for arrays of temperature
+    and relative humidity, using the NWS Rothfusz regression with its
+    low-humidity and high-humidity adjustments. Below ~27°C the simple
+    Steadman formula is used, as the regression is not valid there.
+    """
+    t = np.asarray(temp_c, dtype=np.float64) * 9 / 5 + 32
+    rh = np.asarray(rh, dtype=np.float64)
+
+    simple = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + rh * 0.094)
+
+    hi = (
+        -42.379 + 2.04901523 * t + 10.14333127 * rh
+        - 0.22475541 * t * rh - 6.83783e-3 * t * t
+        - 5.481717e-2 * rh * rh + 1.22874e-3 * t * t * rh
+        + 8.5282e-4 * t * rh * rh - 1.99e-6 * t * t * rh * rh
+    )
+    with np.errstate(invalid="ignore"):
+        dry = (rh < 13) & (t >= 80) & (t <= 112)
+        hi = np.where(dry, hi - (13 - rh) / 4 * np.sqrt(np.clip(17 - np.abs(t - 95), 0, None) / 17), hi)
+        humid = (rh > 85) & (t >= 80) & (t <= 87)
+        hi = np.where(humid, hi + (rh - 85) / 10 * (87 - t) / 5, hi)
+
+    # The regression only applies once the simple estimate reaches 80°F
+    hi = np.where((simple + t) / 2 < 80, simple, hi)
+    return (hi - 32) * 5 / 9
+
+
+def dew_point_c(temp_c, rh):
+    """Dew point for arrays of temperature and relative humidity (Magnus formula)."""
+    a, b = 17.62, 243.12
+    t = np.asarray(temp_c, dtype=np.float64)
+    rh = np.clip(np.asarray(rh, dtype=np.float64), 1e-6, 100)
+    gamma = np.log(rh / 100) + a * t / (b + t)
+    return b * gamma / (a - gamma)
+
+
+# -----------------------------
+# HOURLY SERIES FOR ONE LOCATION
+# -----------------------------
+class HourlySeries:
+    """
+    The hourly block of one forecast payload as NumPy arrays.
+
+    The lists from the JSON response go straight into arrays
+    (null -> NaN); no per-hour objects are built. Expects the
+    payload to be requested with timeformat=unixtime.
+    """
+
+    __slots__ = ("time", "temp", "rh")
+
+    def __init__(self, time, temp, rh):
+        self.time = time
+        self.temp = temp
+        self.rh = rh
+
+    @classmethod
+    def from_payload(cls, data: dict):
+        """Decodes a forecast payload; None if it has no usable hourly block."""
+        hourly = (data or {}).get("hourly") or {}
+        times = hourly.get("time")
+        if not times or not isinstance(times[0], (int, float)):
+            return None  # Missing, or ISO strings from an older cached payload
+        n = len(times)
+        return cls(
+            np.asarray(times, dtype=np.int64),
+            np.array(hourly.get("temperature_2m") or [None] * n, dtype=np.float64),
+            np.array(hourly.get("relativehumidity_2m") or [None] * n, dtype=np.float64),
+        )
+
+    def __len__(self):
+        return len(self.time)
+
+    def upcoming(self, hours: int = ALERT_HOURS, now: float = None):
+        """The slice from the current hour to `hours` ahead."""
+        now = time.time() if now is None else now
+        start = np.searchsorted(self.time, now // 3600 * 3600)
+        end = np.searchsorted(self.time, now + hours * 3600)
+        return HourlySeries(self.time[start:end], self.temp[start:end], self.rh[start:end])
+
+    @property
+    def heat_index(self):
+        return heat_index_c(self.temp, self.rh)
+
+    @property
+    def dew_point(self):
+        return dew_point_c(self.temp, self.rh)
+
+
+# -----------------------------
+# "FEELS LIKE" ALERTS
+# -----------------------------
+def feels_like_alerts(series: HourlySeries, hours: int = ALERT_HOURS, now: float = None):
+    """
+    Alert messages for the next `hours`, one per condition,
+    each with when it starts and its peak.
+    """
+    window = series.upcoming(hours, now)
+    if len(window) == 0:
+        return []
+
+    heat = window.heat_index
+    dew = window.dew_point
+    checks = [
+        (heat >= HEAT_INDEX_DANGER_C, heat, "🥵 DANGER: Heat index up to {peak:.0f}°C from {start}"),
+        ((heat >= HEAT_INDEX_CAUTION_C) & (heat < HEAT_INDEX_DANGER_C), heat,
+         "🔥 CAUTION: Feels like {peak:.0f}°C from {start}"),
+        (dew >= MUGGY_DEW_POINT_C, dew, "💧 Oppressively humid: dew point up to {peak:.0f}°C from {start}"),
+    ]
+
+    alerts = []
+    for mask, values, message in checks:
+        if not mask.any():
+            continue
+        start = datetime.fromtimestamp(int(window.time[mask.argmax()])).strftime("%a %I %p")
+        alerts.append(message.format(peak=np.nanmax(values[mask]), start=start))
+    return alerts
@@ -0,0 +1,149 @@
+import argparse
+import time
+from datetime import datetime
+
+import numpy as np
+
+from geo_cache import GAZETTEER_PATH, load_gazetteer
+from poll_scheduler import PollScheduler
+from Weather_India import COLD_TEMP_C, HOT_TEMP_C, RAIN_CODES, get_forecasts
+
+
+# -----------------------------
+# CONFIGURATION
+# -----------------------------
+# Minutes between sweeps. Forecasts are cached per tile until the next
+# model run, so most sweeps only re-read the current hour from the cache
+SWEEP_MINUTES = 15
+
+# Alert kinds, in column order of the alert matrix
+ALERTS = [
+    ("hot", "🔥 Very hot"),
+    ("cold", "🧥 Cold"),
+    ("rain", "🌧️ Rain likely"),
+]
+
+
+# -----------------------------
+# VECTORIZED ALERT RULES
+# -----------------------------
+def evaluate_alerts(temp, code):
+    """
+    Alert matrix for all cities at once: one row per city,
+    one boolean column per entry of ALERTS. Missing readings
+    (NaN / -1) never raise an alert.
+    """
+    return np.column_stack([
+        temp > HOT_TEMP_C,
+        temp < COLD_TEMP_C,
+        np.isin(code, RAIN_CODES),
+    ])
+
+
+def current_readings(forecasts):
+    """Current temperature and weather code arrays (NaN / -1 where missing)."""
+    temp = np.full(len(forecasts), np.nan)
+    code = np.full(len(forecasts), -1, dtype=np.int16)
+    for i, data in enumerate(forecasts):
+        current = data.get("current_weather") if data else None
+        if current:
+            temp[i] = current.get("temperature", np.nan)
+            code[i] = current.get("weathercode", -1)
+    return temp, code
+
+
+# -----------------------------
+# NATIONWIDE SWEEP
+# -----------------------------
+class WeatherSweep:
+    """
+    Checks the alert rules for every city in the gazetteer.
+
+    Each sweep fetches (or reuses cached) forecasts for all cities,
+    evaluates the rules as one NumPy expression, and reports only
+    alerts that started or cleared since the previous sweep.
+    """
+
+    def __init__(self, places):
+        self.places = list(places)
+        self.points = [(p["lat"], p["lon"]) for p in self.places]
+        self.active = np.zeros((len(self.places), len(ALERTS)), dtype=bool)
+        self.temp = np.full(len(self.places), np.nan)
+
+    def sweep(self):
+        """
+        Runs one sweep.
+
+        Returns (started, cleared): lists of (city index, alert index).
+        """
+        forecasts = get_forecasts(self.points, strict=True)
+        temp, code = current_readings(forecasts)
+        active = evaluate_alerts(temp, code)
+
+        # No data for a city -> keep its previous state instead of "clearing"
+        missing = np.isnan(temp)
+        active[missing] = self.active[missing]
+        temp[missing] = self.temp[missing]
+
+        changed = active != self.active
+        started = np.argwhere(changed & active)
+        cleared = np.argwhere(changed & ~active)
+
+        self.active = active
+        self.temp = temp
+        return [tuple(x) for x in started], [tuple(x) for x in cleared]
+
+    def describe(self, city: int, alert: int, started: bool) -> str:
+        place = self.places[city]
+        label = ALERTS[alert][1]
+        temp = self.temp[city]
+        reading = f" ({temp:.1f}°C)" if not np.isnan(temp) else ""
+        state = "ALERT" if started else "cleared"
+        return f"{label} {state}: {place['name']}, {place['state']}{reading}"
+
+    def report(self, started, cleared):
+        """Prints the changes of one sweep (nothing if nothing changed)."""
+        now = datetime.now().strftime("%H:%M")
+        for city, alert in started:
+            print(f"[{now}] {self.describe(city, alert, True)}")
+        for city, alert in cleared:
+            print(f"[{now}] {self.describe(city, alert, False)}")
+
+    def run(self, interval_minutes: float = SWEEP_MINUTES, max_sweeps: int = None):
+        """Sweeps on a fixed schedule, backing off when the API throttles."""
+        scheduler = PollScheduler(interval_minutes * 60)
+
+        def poll():
+            started = time.perf_counter()
+            changes = self.sweep()
+            self.report(*changes)
+            took = time.perf_counter() - started
+            print(f"   ✔ Swept {len(self.places)} cities in {took:.2f}s, "
+                  f"{int(self.active.sum())} active alert(s)")
+
+        def on_error(exc, delay):
+            retry = f", retrying in {delay:.0f}s" if delay else ""
+            print(f"❌ Sweep failed: {exc}{retry}")
+
+        return scheduler.run(poll, max_polls=max_sweeps, on_error=on_error)
+
+
+# -----------------------------
+# MAIN PROGRAM
+# -----------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Nationwide weather alert sweep")
+    parser.add_argument("--interval", type=float, default=SWEEP_MINUTES, help="minutes between sweeps")
+    parser.add_argument("--cities", default=GAZETTEER_PATH, help="CSV with name, state, lat, lon")
+    parser.add_argument("--once", action="store_true", help="run a single sweep and exit")
+    args = parser.parse_args()
+
+    places = load_gazetteer(args.cities)
+    print("=" * 55)
+    print(f"     WEATHER ALERT SWEEP - {len(places)} CITIES")
+    print("=" * 55)
+
+    try:
+        WeatherSweep(places).run(args.interval, max_sweeps=1 if args.once else None)
+    except KeyboardInterrupt:
+        print("\n👋 Sweep stopped.")